@@ -0,0 +1,344 @@
+"""Alert on buy/sell signal transitions of newly analyzed bars
+
+Usage:
+    python alerts.py                                   # print to stdout
+    python alerts.py --sink data/alerts.jsonl --sink https://example.com/hook
+
+The screening rules (see ``screening``) are evaluated only on the bars
+analyzed since the last run. The signal and date of the last evaluated bar
+of every symbol are kept in ``alerts.json`` next to the analyzed data, so
+an alert is raised once, when the signal of a symbol changes to one of the
+rules (``hold -> buy``, ``buy -> sell``), and not again while it holds.
+
+Symbols seen for the first time only record their current signal. Changing
+the rules starts over the same way.
+
+Delivery is tracked per sink: alerts a sink failed to take are kept in
+its outbox in ``alerts.json`` and sent to that sink, and only that sink,
+on the next run.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from screening import RULE_SETS, RuleSet, default_rule_set
+from storage import _replace_atomically, open_store
+
+ALERT_STATE_FILE = "alerts.json"
+
+
+@dataclass(frozen=True)
+class Alert:
+    symbol: str
+    date: pd.Timestamp
+    signal: str
+    previous: str
+    close: float
+
+    def to_dict(self) -> dict:
+        return {
+            "symbol": self.symbol,
+            "date": self.date.strftime("%Y-%m-%d"),
+            "signal": self.signal,
+            "previous": self.previous,
+            "close": None if np.isnan(self.close) else self.close,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Alert":
+        return cls(
+            symbol=data["symbol"],
+            date=pd.Timestamp(data["date"]),
+            signal=data["signal"],
+            previous=data["previous"],
+            close=np.nan if data["close"] is None else float(data["close"]),
+        )
+
+
+class StdoutSink:
+    """Prints every alert as a JSON line."""
+
+    name = "stdout"
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def __call__(self, alerts: List[Alert]):
+        stream = self.stream or sys.stdout
+        for alert in alerts:
+            print(json.dumps(alert.to_dict()), file=stream)
+
+
+class JsonlSink:
+    """Appends every alert as a JSON line to ``path``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = path
+
+    def __call__(self, alerts: List[Alert]):
+        with open(self.path, "a") as file:
+            for alert in alerts:
+                file.write(json.dumps(alert.to_dict()) + "\n")
+
+
+class WebhookSink:
+    """POSTs every batch to ``url`` as ``{"alerts": [...]}``."""
+
+    def __init__(self, url: str, timeout: float = 10.0, session=None):
+        self.url = url
+        self.name = url
+        self.timeout = timeout
+        self.session = session
+
+    def __call__(self, alerts: List[Alert]):
+        if self.session is None:
+            from fetch_engine import pooled_session
+
+            self.session = pooled_session(1)
+        response = self.session.post(
+            self.url,
+            json={"alerts": [alert.to_dict() for alert in alerts]},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+
+Sink = Callable[[List[Alert]], None]
+
+
+def make_sink(spec: str) -> Sink:
+    """``stdout`` (or ``-``), an ``http(s)://`` webhook URL or a JSONL file path."""
+    if spec in ("-", "stdout"):
+        return StdoutSink()
+    if spec.startswith(("http://", "https://")):
+        return WebhookSink(spec)
+    return JsonlSink(spec)
+
+
+def sink_names(sinks: List[Sink]) -> List[str]:
+    """
+    Stable name of every sink, keying its outbox: its ``name`` attribute or
+    its position; repeated names are numbered.
+    """
+    names = []
+    for position, sink in enumerate(sinks):
+        name = getattr(sink, "name", None) or f"sink {position}"
+        if name in names:
+            name = f"{name} #{position}"
+        names.append(name)
+    return names
+
+
+class Alerter:
+    """
+    Evaluates ``rule_set`` on the bars of ``analyzed_folder`` that arrived
+    since the last run and sends the signal transitions to ``sinks``.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[Sink],
+        rule_set: Optional[RuleSet] = None,
+        storage_format: Optional[str] = None,
+    ):
+        self.sinks = list(sinks)
+        self.rule_set = rule_set or default_rule_set()
+        self.storage_format = storage_format
+
+    @property
+    def fingerprint(self) -> dict:
+        rules = {name: rule.expression for name, rule in self.rule_set.rules.items()}
+        return {"rules": rules, "default": self.rule_set.default}
+
+    def state_path(self, analyzed_folder: str) -> str:
+        return os.path.join(analyzed_folder, ALERT_STATE_FILE)
+
+    def _read_state(self, analyzed_folder: str) -> dict:
+        path = self.state_path(analyzed_folder)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def load_state(self, analyzed_folder: str) -> Dict[str, dict]:
+        """Last evaluated date and signal of every symbol, for the current rules."""
+        state = self._read_state(analyzed_folder)
+        if state.get("rule_set") != self.fingerprint:
+            return {}
+        return state.get("symbols", {})
+
+    def load_outbox(self, analyzed_folder: str) -> Dict[str, List[Alert]]:
+        """Alerts raised earlier that each sink has not taken yet."""
+        outbox = self._read_state(analyzed_folder).get("outbox", {})
+        return {
+            name: [Alert.from_dict(alert) for alert in alerts]
+            for name, alerts in outbox.items()
+        }
+
+    def save_state(
+        self,
+        analyzed_folder: str,
+        symbols: Dict[str, dict],
+        outbox: Optional[Dict[str, List[Alert]]] = None,
+    ):
+        state = {
+            "rule_set": self.fingerprint,
+            "symbols": symbols,
+            "outbox": {
+                name: [alert.to_dict() for alert in alerts]
+                for name, alerts in (outbox or {}).items()
+                if alerts
+            },
+        }
+
+        def write(tmp_path):
+            with open(tmp_path, "w") as file:
+                json.dump(state, file, indent=4, sort_keys=True)
+
+        _replace_atomically(self.state_path(analyzed_folder), write)
+
+    def new_bars(self, analyzed_folder: str, state: Dict[str, dict]) -> pd.DataFrame:
+        """
+        Rows of every symbol from its last evaluated date on (all rows of
+        new symbols), sorted by symbol and date. Symbols sharing a last date
+        are read together.
+        """
+        store = open_store(analyzed_folder, "date", self.storage_format)
+        groups: Dict[Optional[str], List[str]] = {}
+        for symbol in store.symbols():
+            start = state[symbol]["date"] if symbol in state else None
+            groups.setdefault(start, []).append(symbol)
+        frames = [
+            store.read_all(start=start, symbols=symbols)
+            for start, symbols in groups.items()
+        ]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=["date", "symbol"])
+        df = pd.concat(frames, ignore_index=True)
+        df["symbol"] = df["symbol"].astype(str)
+        return df.sort_values(["symbol", "date"], kind="stable", ignore_index=True)
+
+    def evaluate(self, analyzed_folder: str) -> Tuple[List[Alert], Dict[str, dict]]:
+        """The alerts of the new bars and the state after them, without side effects."""
+        state = self.load_state(analyzed_folder)
+        df = self.new_bars(analyzed_folder, state)
+        if df.empty:
+            return [], state
+
+        labels = self.rule_set.labels
+        codes = self.rule_set.classify(df).codes.astype(np.int64)
+        symbols = df["symbol"].to_numpy()
+        dates = df["date"].to_numpy()
+        known = df["symbol"].map(lambda symbol: symbol in state).to_numpy()
+        last_dates = pd.to_datetime(
+            df["symbol"].map(lambda symbol: state.get(symbol, {}).get("date"))
+        ).to_numpy()
+        stored = np.array(
+            [
+                labels.index(state[symbol]["signal"]) if symbol in state else -1
+                for symbol in symbols
+            ],
+            dtype=np.int64,
+        )
+
+        # The last evaluated bar keeps the signal it was alerted with.
+        evaluated = known & (dates <= last_dates)
+        codes = np.where(evaluated, stored, codes)
+        first = np.ones(len(df), dtype=bool)
+        first[1:] = symbols[1:] != symbols[:-1]
+        previous = np.empty_like(codes)
+        previous[1:] = codes[:-1]
+        previous[first] = stored[first]
+
+        default = labels.index(self.rule_set.default)
+        changed = known & ~evaluated & (codes != previous) & (codes != default)
+        close = (
+            df["close"].to_numpy(dtype=float)
+            if "close" in df.columns
+            else np.full(len(df), np.nan)
+        )
+        alerts = [
+            Alert(
+                symbol=symbols[row],
+                date=pd.Timestamp(dates[row]),
+                signal=labels[codes[row]],
+                previous=labels[previous[row]],
+                close=float(close[row]),
+            )
+            for row in np.flatnonzero(changed)
+        ]
+        alerts.sort(key=lambda alert: (alert.date, alert.symbol))
+
+        last = np.ones(len(df), dtype=bool)
+        last[:-1] = first[1:]
+        state = dict(state)
+        for row in np.flatnonzero(last):
+            state[symbols[row]] = {
+                "date": pd.Timestamp(dates[row]).strftime("%Y-%m-%d"),
+                "signal": labels[codes[row]],
+            }
+        return alerts, state
+
+    def run(self, analyzed_folder: str) -> List[Alert]:
+        """
+        Send the alerts of the new bars, after the ones still in its outbox,
+        to every sink and save the state. Returns the new alerts. If a sink
+        failed, its batch stays in its outbox and the first error is raised
+        once every other sink had its turn.
+        """
+        alerts, state = self.evaluate(analyzed_folder)
+        pending = self.load_outbox(analyzed_folder)
+        outbox, errors = {}, []
+        for name, sink in zip(sink_names(self.sinks), self.sinks):
+            batch = pending.get(name, []) + alerts
+            if not batch:
+                continue
+            try:
+                sink(batch)
+            except Exception as error:
+                outbox[name] = batch
+                errors.append(error)
+        self.save_state(analyzed_folder, state, outbox)
+        if errors:
+            raise errors[0]
+        return alerts
+
+
+def main(argv=None):
+    from pipeline import ANALYZED_FOLDER
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--analyzed-folder", default=ANALYZED_FOLDER)
+    parser.add_argument(
+        "--sink",
+        action="append",
+        default=[],
+        help="stdout, a webhook URL or a JSONL file (repeatable, default stdout)",
+    )
+    parser.add_argument(
+        "--rule-set", choices=list(RULE_SETS), default="RSI/CCI thresholds"
+    )
+    args = parser.parse_args(argv)
+
+    alerter = Alerter(
+        [make_sink(spec) for spec in args.sink or ["stdout"]],
+        RULE_SETS[args.rule_set](),
+    )
+    alerter.run(args.analyzed_folder)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,28 +1,89 @@
 import os
 import json
-import pandas as pd
+import uuid
 import streamlit as st
 from datetime import datetime, timedelta, timezone
 from extractor import Extractor
 from transform import TickerAnalyzer
-import matplotlib.pyplot as plt
-
-
-def load_and_filter_analyzed_data(analyzed_folder):
-    """Load all CSVs, add a 'symbol' column, and filter last X days."""
-    all_data = []
-    for filename in os.listdir(analyzed_folder):
-        if filename.endswith(".csv"):
-            file_path = os.path.join(analyzed_folder, filename)
-            df = pd.read_csv(file_path)
-            df["symbol"] = filename.split(".")[0]
-            all_data.append(df)
-    return pd.concat(all_data, ignore_index=True)
+from storage import open_store
+from panel_cache import PanelCache, load_analyzed_panel
+from panel_schema import DATE_FORMAT
+from shared_panel import shared_panel
+from screening import CRITERIA, RULE_SETS
+from rollups import RollupStore, choose_resolution
+from timeframes import TimeframeStore
+from charts import cached_png, figure_cache
+from backtest import BacktesterCache, grid
+from cross_section import CrossSectionCache
+import instrumentation
+from instrumentation import stage
+from refresh import current_folders
+
+
+@st.cache_resource
+def get_panel_cache():
+    """Process-wide cache of the analyzed universe, shared by all sessions."""
+    return PanelCache()
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide cache of rendered charts, shared by all sessions."""
+    return figure_cache()
+
+
+@st.cache_resource
+def get_backtesters():
+    """Process-wide backtesters, so swept results are reused across runs."""
+    return BacktesterCache()
+
+
+@st.cache_resource
+def get_cross_sections():
+    """Process-wide cross-sections, extended as new dates are analyzed."""
+    return CrossSectionCache()
+
+
+@st.cache_data
+def load_tickers_data(json_file, mtime_ns):
+    """Ticker universe, parsed once per version of the file."""
+    with open(json_file, "r") as file:
+        return json.load(file)
+
+
+def load_and_filter_analyzed_data(
+    analyzed_folder, start=None, end=None, symbols=None, float32=False
+):
+    """
+    Analyzed universe with a 'symbol' column, filtered by dates and symbols,
+    in the compact schema of ``panel_schema``.
+
+    Reads the memory-mapped panel shared by all sessions when one has been
+    published, otherwise the cached analyzed store.
+    """
+    published = shared_panel(analyzed_folder)
+    if published is not None:
+        return published.to_pandas(
+            start=start, end=end, symbols=symbols, float32=float32
+        )
+    return load_analyzed_panel(
+        analyzed_folder,
+        get_panel_cache(),
+        start=start,
+        end=end,
+        symbols=symbols,
+        float32=float32,
+    )
 
 
 # Streamlit UI
 st.title("Lightyear Analysis App")
 
+show_performance = st.sidebar.checkbox("Show performance panel", value=False)
+# Recording is process-wide: it stays on while any session shows the panel.
+session_key = st.session_state.setdefault("timings_key", uuid.uuid4().hex)
+instrumentation.subscribe(session_key, show_performance)
+
 # Default settings
 default_start_date = (datetime.today() - timedelta(days=729)).strftime(
     "%Y-%m-%d"
@@ -39,17 +100,23 @@ if not os.path.exists(json_file):
     st.error(f"JSON file {json_file} not found!")
     st.stop()
 
-with open(json_file, "r") as file:
-    tickers_data = json.load(file)
+tickers_data = load_tickers_data(json_file, os.stat(json_file).st_mtime_ns)
 
 tickers = list(tickers_data.values())
 symbols = list(tickers_data.keys())  # Extract ticker symbols
 symbols.sort()
 st.write(f"Loaded {len(tickers)} tickers from {json_file}")
 
-# Paths
-raw_folder = "data/tickers"
-analyzed_folder = "data/analyzed"
+# Paths: the latest snapshot published by refresh.py, if the daemon runs
+snapshot_folders = current_folders()
+if snapshot_folders is not None:
+    raw_folder, analyzed_folder = snapshot_folders
+    st.sidebar.caption(
+        f"Reading snapshot {os.path.basename(os.path.dirname(raw_folder))}"
+    )
+else:
+    raw_folder = "data/tickers"
+    analyzed_folder = "data/analyzed"
 
 # Ensure output directories exist
 os.makedirs(analyzed_folder, exist_ok=True)
@@ -69,42 +136,87 @@ with st.expander("Set Thresholds & Filtering Options"):
         "Select Start Date", datetime.strptime(default_start_date, "%Y-%m-%d")
     )
     days = st.slider("Filter last X days:", 1, 365, default_days)
+    incremental = st.checkbox(
+        "Incremental extraction (only fetch bars after the last stored one)",
+        value=True,
+    )
+    rebuild = st.checkbox(
+        "Full rebuild (recompute indicators over the whole history)", value=False
+    )
+    float32 = st.checkbox(
+        "Load indicators as float32 (half the memory, ~7 significant digits)",
+        value=False,
+    )
 
 # Step buttons in an expander for data operations
 with st.expander("Data Operations (Extract, Analyze, Clean-Up)"):
+    # Published snapshots are read-only: refresh.py stages and publishes
+    # new ones, so the buttons must not write into the one being read.
+    read_only = snapshot_folders is not None
+    if read_only:
+        st.info(
+            "The data is refreshed by refresh.py into snapshots; "
+            "extract, analyze and clean-up are disabled."
+        )
     col_extract, col_analyze, col_cleanup = st.columns(3)
 
     # Step 1: Extract Data
     with col_extract:
-        if st.button("Extract Data"):
+        if st.button("Extract Data", disabled=read_only):
             st.write("Extracting data, please wait...")
             extractor = Extractor(
                 tickers=tickers,
                 start_date=str(start_date),
                 end_date=datetime.now().strftime("%Y-%m-%d"),
                 target_folder=raw_folder,
+                incremental=incremental,
             )
             extractor.extract_data()
+            if extractor.failed:
+                st.warning(
+                    "Failed tickers: "
+                    + ", ".join(
+                        f"{ticker} ({error})"
+                        for ticker, error in sorted(extractor.failed.items())
+                    )
+                )
+            get_panel_cache().invalidate()
             st.success("Data extraction complete.")
 
     # Step 2: Analyze Data
     with col_analyze:
-        if st.button("Analyze Data"):
+        if st.button("Analyze Data", disabled=read_only):
             st.write("Analyzing data, please wait...")
             analyzer = TickerAnalyzer(
                 raw_folder=raw_folder, analyzed_folder=analyzed_folder
             )
-            for ticker in tickers:
-                analyzer.preprocess_and_analyze(ticker)
+            progress_bar = st.progress(0.0, text="Analyzing...")
+
+            def show_progress(done, total, ticker, error):
+                progress_bar.progress(done / total, text=f"{done}/{total} {ticker}")
+
+            report = analyzer.analyze_many(
+                tickers, workers=os.cpu_count(), rebuild=rebuild, progress=show_progress
+            )
+            if report.failures:
+                st.warning(
+                    "Failed tickers: "
+                    + ", ".join(
+                        f"{ticker} ({error})"
+                        for ticker, error in sorted(report.failures.items())
+                    )
+                )
+            get_panel_cache().invalidate()
             st.success("All tickers processed and analyzed.")
 
     # Step 3: Clean-Up Data
     with col_cleanup:
-        if st.button("Clean-Up Data"):
+        if st.button("Clean-Up Data", disabled=read_only):
             st.write("Cleaning up raw and analyzed data...")
 
-            def delete_files_in_folder(folder):
+            def delete_files_in_folder(folder, time_column):
                 if os.path.exists(folder):
+                    open_store(folder, time_column).clear()
                     for file in os.listdir(folder):
                         file_path = os.path.join(folder, file)
                         if os.path.isfile(file_path):
@@ -113,14 +225,18 @@ with st.expander("Data Operations (Extract, Analyze, Clean-Up)"):
                 else:
                     st.write(f"Folder {folder} does not exist.")
 
-            delete_files_in_folder(raw_folder)
-            delete_files_in_folder(analyzed_folder)
+            delete_files_in_folder(raw_folder, "datetime")
+            delete_files_in_folder(analyzed_folder, "date")
+            RollupStore(analyzed_folder).clear()
+            TimeframeStore(analyzed_folder).clear()
+            get_panel_cache().invalidate()
             st.success("Clean-up complete.")
 
 # Filter selection inside an expander
 with st.expander("Select Filter Criteria & Symbols"):
+    rule_set_name = st.selectbox("Screening Rules", list(RULE_SETS))
     selected_criteria = st.multiselect(
-        "Select Criteria to Filter", ["buy", "sell", "hold"], default=["buy", "sell"]
+        "Select Criteria to Filter", CRITERIA, default=["buy", "sell"]
     )
     selected_symbols = st.multiselect(
         "Select Tickers to Filter", symbols, default=symbols
@@ -128,29 +244,27 @@ with st.expander("Select Filter Criteria & Symbols"):
 
     # Step 4: Load and Filter Data (only after criteria is selected)
     if st.button("Load & Filter Data"):
-        st.write("Loading and filtering data, please wait...")
-
-        filtered_data = load_and_filter_analyzed_data(analyzed_folder)
+        # Keep showing the table on later reruns, so changing a threshold or
+        # the "last X days" slider re-filters the cached universe.
+        st.session_state["show_filtered"] = True
 
+    if st.session_state.get("show_filtered"):
         # Filter last X days
         today = datetime.now(timezone.utc)
         days_ago = today - timedelta(days=days)
 
-        filtered_data["date"] = pd.to_datetime(
-            filtered_data["date"], errors="coerce"
-        ).dt.tz_localize(None)
-        days_ago = days_ago.replace(tzinfo=None)
-        df_filtered = filtered_data[filtered_data["date"] >= days_ago]
-
-        # Add 'criteria' column based on user-defined thresholds
-        df_filtered["criteria"] = df_filtered.apply(
-            lambda row: "buy"
-            if row["rsi_14"] < rsi_buy and row["cci_25"] < cci_buy
-            else "sell"
-            if row["rsi_14"] > rsi_sell and row["cci_25"] > cci_sell
-            else "hold",
-            axis=1,
+        with stage("load") as record:
+            df_filtered = load_and_filter_analyzed_data(
+                analyzed_folder, start=days_ago.replace(tzinfo=None), float32=float32
+            )
+            record["rows"] = len(df_filtered)
+
+        # Add 'criteria' column based on the selected rules and thresholds
+        rule_set = RULE_SETS[rule_set_name](
+            rsi_buy=rsi_buy, cci_buy=cci_buy, rsi_sell=rsi_sell, cci_sell=cci_sell
         )
+        with stage("classify", rows=len(df_filtered)):
+            df_filtered["criteria"] = rule_set.classify(df_filtered)
 
         # Filter data based on selected criteria and symbols (apply only if criteria are selected)
         if selected_criteria:
@@ -161,9 +275,6 @@ with st.expander("Select Filter Criteria & Symbols"):
         if selected_symbols:
             result_df = result_df[result_df["symbol"].isin(selected_symbols)]
 
-        # Format the date column to YYYY-MM-DD
-        result_df["date"] = result_df["date"].dt.strftime("%Y-%m-%d")
-
         # Rearrange columns to print date, symbol, criteria first, then others
         ordered_columns = ["date", "symbol", "criteria"] + [
             col
@@ -179,9 +290,76 @@ with st.expander("Select Filter Criteria & Symbols"):
             use_container_width=True,  # Stretch across the full container
             hide_index=True,  # Hide the index column
             height=None,  # Allow the table to take up maximum height if necessary
+            # Dates stay datetime64 and are only formatted for display
+            column_config={"date": st.column_config.DateColumn(format=DATE_FORMAT)},
         )
 
 
+# Backtest the thresholds over the analyzed history
+with st.expander("Backtest Thresholds"):
+    sweep = st.checkbox("Also sweep thresholds around the current ones", value=False)
+
+    if st.button("Run Backtest"):
+        backtester = get_backtesters().get(analyzed_folder, start=start_date)
+        params = (rsi_buy, cci_buy, rsi_sell, cci_sell)
+        st.write("### Current thresholds")
+        st.json(backtester.run(params))
+        st.dataframe(backtester.per_symbol(params), use_container_width=True)
+
+        if sweep:
+            combinations = grid(
+                [rsi_buy - 10, rsi_buy - 5, rsi_buy, rsi_buy + 5],
+                [cci_buy - 50, cci_buy - 25, cci_buy, cci_buy + 25],
+                [rsi_sell - 5, rsi_sell, rsi_sell + 5, rsi_sell + 10],
+                [cci_sell - 25, cci_sell, cci_sell + 25, cci_sell + 50],
+            )
+            st.write(f"### Sweep of {len(combinations)} combinations")
+            st.dataframe(
+                backtester.sweep(combinations),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+
+# Correlations, ranks and relative strength across the analyzed universe
+with st.expander("Cross-Sectional View"):
+    # Streamlit runs the body of collapsed expanders too, so the panel is
+    # only loaded and correlated on request.
+    if st.checkbox("Compute cross-sectional view", value=False):
+        published = shared_panel(analyzed_folder)
+        analyzed_symbols = (
+            published.symbols
+            if published is not None
+            else open_store(analyzed_folder, "date").symbols()
+        )
+        if analyzed_symbols:
+            benchmark = st.selectbox(
+                "Benchmark",
+                analyzed_symbols,
+                index=(
+                    analyzed_symbols.index("CSPX") if "CSPX" in analyzed_symbols else 0
+                ),
+            )
+            window = st.number_input("Correlation window (days)", 10, 250, 60)
+            lookback = st.number_input("Relative strength lookback (days)", 5, 250, 20)
+            with stage("cross_section", symbols=len(analyzed_symbols)):
+                cross_section = get_cross_sections().get(
+                    analyzed_folder, benchmark, int(window), int(lookback)
+                )
+            st.write("### Percentile ranks and relative strength")
+            st.dataframe(cross_section.latest(), use_container_width=True)
+            st.write("### Most correlated pairs")
+            st.dataframe(
+                cross_section.top_pairs(), use_container_width=True, hide_index=True
+            )
+            if st.checkbox("Show the full correlation matrix", value=False):
+                st.dataframe(
+                    cross_section.correlation_frame(), use_container_width=True
+                )
+        else:
+            st.write("No analyzed data yet.")
+
+
 # Plot Data - Create another expander for this section
 with st.expander("Plot Selected Symbol Data"):
     # Step 5: Plot Selected Symbol Data
@@ -205,111 +383,73 @@ with st.expander("Plot Selected Symbol Data"):
         end_date_plot.date()
     )  # If end_date_plot is a datetime.datetime, convert it to datetime.date
 
-    # Calculate the difference between the start and end dates
-    date_diff = (end_date_plot - start_date_plot).days
-    # Determine whether to display data daily or weekly
-    interval = "weekly" if date_diff > 14 else "daily"
-
-    if interval == "weekly":
-        st.write(
-            "The date range is more than 2 weeks, so the data will be displayed weekly."
-        )
-    else:
-        st.write(
-            "The date range is within 2 weeks, so the data will be displayed daily."
-        )
+    # Pick the coarsest precomputed rollup with enough points for the range
+    interval = choose_resolution(start_date_plot, end_date_plot)
+    st.write(f"The data will be displayed {interval}.")
 
     # Button to plot data
     if st.button("Plot Data"):
         st.write(f"Generating plots for {selected_plot_symbol}...")
 
-        # Load all data
-        df = load_and_filter_analyzed_data(analyzed_folder)
-
-        # Convert date column to datetime
-        df["date"] = pd.to_datetime(df["date"])
-
-        # Filter for the selected symbol
-        df_symbol = df[df["symbol"] == selected_plot_symbol]
-
-        # Apply date range filter (use today's date for the end date)
-        df_symbol = df_symbol[
-            (df_symbol["date"] >= pd.to_datetime(start_date_plot))
-            & (df_symbol["date"] <= pd.to_datetime(end_date_plot))
-        ]
+        # Render the rollup of the selected symbol over the date range (end date
+        # is today), or reuse the figure of this view while its data is unchanged
+        rollups = RollupStore(analyzed_folder)
+        png = b""
+        if rollups.exists(selected_plot_symbol):
+            view = (interval, str(start_date_plot), str(end_date_plot))
+
+            def load_rollup():
+                with stage("load", selected_plot_symbol, resolution=interval) as record:
+                    df_symbol = rollups.read(
+                        selected_plot_symbol,
+                        interval,
+                        start=start_date_plot,
+                        end=end_date_plot,
+                    )
+                    record["rows"] = len(df_symbol)
+                return df_symbol
+
+            with stage("render", selected_plot_symbol, resolution=interval):
+                png = cached_png(
+                    get_figure_cache(),
+                    selected_plot_symbol,
+                    view,
+                    rollups.fingerprint(selected_plot_symbol, interval),
+                    load_rollup,
+                )
 
         # Check if data exists after filtering
-        if df_symbol.empty:
+        if not png:
             st.error(
                 f"No data available for {selected_plot_symbol} in the selected date range."
             )
         else:
-            # Resample the data based on the interval (daily or weekly)
-            if interval == "weekly":
-                df_symbol = df_symbol.resample("W-Mon", on="date").agg(
-                    {
-                        "close": "last",
-                        "rsi_14": "last",
-                        "cci_25": "last",
-                        "ma_9": "last",
-                        "ma_50": "last",
-                        "ma_250": "last",  # Add ma_250
-                    }
-                )
-            else:
-                df_symbol = df_symbol.set_index("date")
-
-            # Create subplots for multiple plots
-            fig, axes = plt.subplots(
-                3, 1, figsize=(12, 12)
-            )  # 3 rows, 1 column for different plots
-
-            # Plot Closing Price & Moving Averages
-            axes[0].plot(
-                df_symbol.index, df_symbol["close"], label="Close Price", color="blue"
-            )
-            axes[0].plot(
-                df_symbol.index,
-                df_symbol["ma_9"],
-                label="MA 9",
-                linestyle="dashed",
-                color="orange",
-            )
-            axes[0].plot(
-                df_symbol.index,
-                df_symbol["ma_50"],
-                label="MA 50",
-                linestyle="dashed",
-                color="green",
-            )
-            axes[0].plot(
-                df_symbol.index,
-                df_symbol["ma_250"],
-                label="MA 250",
-                linestyle="dashed",
-                color="red",
-            )
-            axes[0].set_title(f"Price & Moving Averages ({selected_plot_symbol})")
-            axes[0].legend()
-
-            # Plot RSI
-            axes[1].plot(
-                df_symbol.index, df_symbol["rsi_14"], label="RSI 14", color="purple"
+            # Display the plot
+            st.image(png, use_container_width=True)
+
+
+# Performance panel: slowest stages and tickers recorded in this process
+if show_performance:
+    timings = instrumentation.subscribe(session_key, True)
+    with st.sidebar:
+        st.write("### Performance")
+        if st.button("Clear timings"):
+            timings.clear()
+        if not timings.records:
+            st.write("No stages recorded yet.")
+        else:
+            st.write("Slowest stages")
+            st.dataframe(timings.summary("stage"))
+            st.write("Slowest tickers")
+            st.dataframe(timings.summary("ticker").head(10))
+            st.write("Slowest single stages")
+            st.dataframe(
+                timings.slowest(10)[["stage", "ticker", "seconds"]], hide_index=True
             )
-            axes[1].axhline(y=30, color="red", linestyle="--", label="RSI 30")
-            axes[1].axhline(y=70, color="green", linestyle="--", label="RSI 70")
-            axes[1].set_title(f"RSI ({selected_plot_symbol})")
-            axes[1].legend()
-
-            # Plot CCI
-            axes[2].plot(
-                df_symbol.index, df_symbol["cci_25"], label="CCI 25", color="brown"
+            st.download_button(
+                "Download JSON log",
+                "\n".join(
+                    json.dumps(record, default=str) for record in timings.records
+                ),
+                file_name="timings.jsonl",
             )
-            axes[2].axhline(y=-100, color="red", linestyle="--", label="CCI -100")
-            axes[2].axhline(y=100, color="green", linestyle="--", label="CCI 100")
-            axes[2].set_title(f"CCI ({selected_plot_symbol})")
-            axes[2].legend()
-
-            # Display the plot
-            plt.tight_layout()
-            st.pyplot(fig)
@@ -0,0 +1,244 @@
+"""Vectorized backtest and threshold sweep of the RSI/CCI strategy
+
+The strategy is long-only per symbol: it enters at the close of a bar where
+the buy rule holds (``rsi_14 < rsi_buy and cci_25 < cci_buy``), exits at the
+close of a bar where the sell rule holds and earns the close-to-close returns
+in between. Every backtest runs on whole ``date x symbol`` arrays.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from indicators import Panel
+from panel_cache import folder_fingerprint
+from shared_panel import shared_panel
+from storage import open_store
+
+PARAMETERS = ("rsi_buy", "cci_buy", "rsi_sell", "cci_sell")
+PANEL_COLUMNS = ["close", "rsi_14", "cci_25"]
+
+_worker_backtester = None
+
+
+def load_panel(analyzed_folder: str, start=None, end=None) -> Panel:
+    """Close, RSI and CCI of the analyzed universe as a date x symbol panel."""
+    published = shared_panel(analyzed_folder)
+    if published is not None:
+        df = published.to_pandas(start=start, end=end, columns=PANEL_COLUMNS)
+    else:
+        store = open_store(analyzed_folder, "date")
+        df = store.read_all(columns=PANEL_COLUMNS, start=start, end=end)
+    return Panel.from_long(df, PANEL_COLUMNS)
+
+
+class Backtester:
+    """
+    Backtests threshold tuples ``(rsi_buy, cci_buy, rsi_sell, cci_sell)``
+    over a panel. Summaries are cached by parameter tuple, so repeated or
+    overlapping sweeps only run new combinations. ``cost`` is charged as a
+    fraction of the position on every entry and exit.
+
+    Arrays are kept as ``symbol x date`` so every scan along time runs over
+    contiguous memory, and returns are accumulated in log space so a whole
+    backtest is a handful of array passes.
+    """
+
+    def __init__(self, panel: Panel, cost: float = 0.0):
+        self.panel = panel
+        self.cost = cost
+        self.cache: Dict[Tuple, dict] = {}
+        close = np.ascontiguousarray(panel.fields["close"].T)
+        log_returns = np.zeros(close.shape)
+        with np.errstate(all="ignore"):
+            log_returns[:, 1:] = np.log(close[:, 1:] / close[:, :-1])
+        self.log_returns = np.nan_to_num(log_returns, nan=0.0, posinf=0.0, neginf=0.0)
+        self.rsi = np.ascontiguousarray(panel.fields["rsi_14"].T)
+        self.cci = np.ascontiguousarray(panel.fields["cci_25"].T)
+        self.sell_codes = 2 * np.arange(1, close.shape[1] + 1, dtype=np.int32)
+        self.buy_codes = self.sell_codes + 1
+
+    def positions(self, rsi_buy, cci_buy, rsi_sell, cci_sell) -> np.ndarray:
+        """
+        ``symbol x date`` array, True while a position is held after the
+        close of a bar. A bar matching both rules counts as a sell.
+        """
+        with np.errstate(invalid="ignore"):
+            buy = (self.rsi < rsi_buy) & (self.cci < cci_buy)
+            sell = (self.rsi > rsi_sell) & (self.cci > cci_sell)
+        # Encode each event as 2 * (date + 1) + is_buy; the running maximum
+        # is then the latest event and its low bit tells buy from sell.
+        events = np.maximum((buy & ~sell) * self.buy_codes, sell * self.sell_codes)
+        return (np.maximum.accumulate(events, axis=1) & 1).astype(bool)
+
+    def simulate(self, params: Sequence[float]) -> Dict[str, np.ndarray]:
+        """Per-symbol trade count, return, max drawdown and winning trades."""
+        position = self.positions(*params)
+        symbols, dates = position.shape
+        if dates == 0:
+            zeros = np.zeros(symbols)
+            return {
+                "trades": zeros.astype(int),
+                "total_return": zeros,
+                "max_drawdown": zeros,
+                "winning_trades": zeros.astype(int),
+            }
+
+        # A position taken at a close earns the return of the next bar.
+        held = np.zeros_like(position)
+        held[:, 1:] = position[:, :-1]
+        strategy = held * self.log_returns
+        if self.cost:
+            strategy += (position != held) * np.log1p(-self.cost)
+        equity = np.cumsum(strategy, axis=1)
+        drawdown = (equity - np.maximum.accumulate(equity, axis=1)).min(axis=1)
+
+        # Pair the first and last held bar of every trade; both lists are in
+        # symbol then date order, so the n-th start belongs to the n-th end.
+        previous = np.zeros_like(held)
+        previous[:, 1:] = held[:, :-1]
+        following = np.zeros_like(held)
+        following[:, :-1] = held[:, 1:]
+        first = np.flatnonzero(held & ~previous)
+        last = np.flatnonzero(held & ~following)
+        flat = equity.ravel()
+        before = np.where(first % dates == 0, 0.0, flat[first - 1])
+        trade_symbols = first // dates
+        winning = np.bincount(
+            trade_symbols, weights=flat[last] - before > 0, minlength=symbols
+        )
+
+        return {
+            "trades": (position & ~held).sum(axis=1),
+            "total_return": np.expm1(equity[:, -1]),
+            "max_drawdown": np.expm1(drawdown),
+            "winning_trades": winning.astype(int),
+        }
+
+    def summarize(self, params: Sequence[float], result: Dict[str, np.ndarray]) -> dict:
+        trades = int(result["trades"].sum())
+        return {
+            **dict(zip(PARAMETERS, params)),
+            "trades": trades,
+            "mean_return": float(result["total_return"].mean()),
+            "median_return": float(np.median(result["total_return"])),
+            "max_drawdown": float(result["max_drawdown"].min()),
+            "hit_rate": float(result["winning_trades"].sum() / trades) if trades else np.nan,
+        }
+
+    def run(self, params: Sequence[float]) -> dict:
+        """Aggregated summary of one parameter tuple (cached)."""
+        params = tuple(float(value) for value in params)
+        if params not in self.cache:
+            self.cache[params] = self.summarize(params, self.simulate(params))
+        return self.cache[params]
+
+    def per_symbol(self, params: Sequence[float]) -> pd.DataFrame:
+        """Per-symbol trades, return, drawdown and hit rate of one tuple."""
+        result = self.simulate(params)
+        df = pd.DataFrame(result, index=pd.Index(self.panel.symbols, name="symbol"))
+        with np.errstate(all="ignore"):
+            df["hit_rate"] = df["winning_trades"] / df["trades"].replace(0, np.nan)
+        return df.drop(columns="winning_trades")
+
+    def sweep(
+        self, combinations: Iterable[Sequence[float]], workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Run every parameter tuple not cached yet on ``workers`` processes
+        (``workers=1`` runs in this process) and return all summaries,
+        best mean return first.
+        """
+        combinations = [tuple(float(value) for value in params) for params in combinations]
+        missing = list(dict.fromkeys(p for p in combinations if p not in self.cache))
+        if missing and workers == 1:
+            for params in missing:
+                self.run(params)
+        elif missing:
+            chunk_size = max(1, len(missing) // ((workers or 4) * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self.panel, self.cost)
+            ) as pool:
+                for params, summary in zip(
+                    missing, pool.map(_run_in_worker, missing, chunksize=chunk_size)
+                ):
+                    self.cache[params] = summary
+        summaries = pd.DataFrame([self.cache[params] for params in dict.fromkeys(combinations)])
+        if summaries.empty:
+            return summaries
+        return summaries.sort_values("mean_return", ascending=False, ignore_index=True)
+
+
+class BacktesterCache:
+    """
+    Thread-safe cache of one ``Backtester`` per analyzed folder, start date
+    and cost, so its summaries cached by parameter tuple outlive a single
+    run. An entry is replaced when the published panel gets a new version
+    (or, without one, when the analyzed folder changed). The ``max_entries``
+    most recently used entries are kept.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        # key -> (data version, backtester)
+        self.entries: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, analyzed_folder: str, start=None, cost: float = 0.0) -> Backtester:
+        published = shared_panel(analyzed_folder)
+        version = (
+            published.version if published is not None else folder_fingerprint(analyzed_folder)
+        )
+        key = (analyzed_folder, None if start is None else str(start), cost)
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached is not None and cached[0] == version:
+                self.entries.move_to_end(key)
+                return cached[1]
+            backtester = Backtester(load_panel(analyzed_folder, start=start), cost)
+            self.entries[key] = (version, backtester)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            return backtester
+
+
+def _init_worker(panel: Panel, cost: float):
+    global _worker_backtester
+    _worker_backtester = Backtester(panel, cost)
+
+
+def _run_in_worker(params: Tuple[float, ...]) -> dict:
+    return _worker_backtester.run(params)
+
+
+def grid(
+    rsi_buy: Iterable[float],
+    cci_buy: Iterable[float],
+    rsi_sell: Iterable[float],
+    cci_sell: Iterable[float],
+) -> List[Tuple[float, ...]]:
+    """Every combination of the given threshold values."""
+    return list(itertools.product(rsi_buy, cci_buy, rsi_sell, cci_sell))
+
+
+def random_grid(
+    n: int,
+    rsi_buy=(20, 50),
+    cci_buy=(-200, 0),
+    rsi_sell=(50, 80),
+    cci_sell=(0, 200),
+    seed: Optional[int] = None,
+) -> List[Tuple[float, ...]]:
+    """``n`` threshold tuples drawn uniformly (rounded) from the given ranges."""
+    rng = np.random.default_rng(seed)
+    columns = [
+        np.round(rng.uniform(low, high, n))
+        for low, high in (rsi_buy, cci_buy, rsi_sell, cci_sell)
+    ]
+    return list(zip(*(column.tolist() for column in columns)))
@@ -0,0 +1,402 @@
+"""Benchmark the pipeline stages on a synthetic OHLCV universe
+
+Usage:
+    python bench.py --tickers 100 --days 730
+    python bench.py --tickers 10000 --days 730 --stages extract,analyze
+    python bench.py --tickers 100 --compare benchmarks/<previous>.json
+
+Every stage is timed separately (wall time, peak resident memory above the
+start of the stage and rows per second) and the results are written as JSON
+to ``benchmarks/``, together with the git commit they were measured on.
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from extractor import MANIFEST_FILE, Extractor
+from charts import render_png
+from panel_cache import PanelCache, load_analyzed_panel
+from rollups import RollupStore, choose_resolution
+from screening import default_rule_set
+from transform import TickerAnalyzer
+
+RESULTS_FOLDER = "benchmarks"
+STAGES = [
+    "startup",
+    "extract",
+    "analyze",
+    "load",
+    "load_cached",
+    "classify",
+    "resample",
+    "plot_read",
+    "render",
+]
+ORIGIN = pd.Timestamp("2020-01-01")
+HOURS = np.arange(9, 18)
+RENDERED_CHARTS = 5
+# Modules imported at the top of app.py, and the heavy ones that must only
+# be imported when a stage needs them.
+APP_MODULES = [
+    "streamlit",
+    "extractor",
+    "transform",
+    "storage",
+    "panel_cache",
+    "panel_schema",
+    "shared_panel",
+    "screening",
+    "rollups",
+    "timeframes",
+    "charts",
+    "backtest",
+    "cross_section",
+    "instrumentation",
+    "refresh",
+]
+DEFERRED_MODULES = ["yfinance", "matplotlib", "requests"]
+
+
+def synthetic_tickers(count: int) -> List[str]:
+    return [f"SYN{number:05d}.DE" for number in range(count)]
+
+
+def synthetic_bars(ticker: str, start, end) -> pd.DataFrame:
+    """
+    Hourly OHLCV bars of ``ticker`` shaped like a Yahoo Finance download,
+    09:00-17:00 Berlin time on weekdays from ``start`` up to ``end``.
+
+    The random walk starts at a fixed origin and is seeded by the ticker
+    name, so overlapping requests return identical bars.
+    """
+    end = pd.Timestamp(end)
+    days = pd.bdate_range(ORIGIN, end - pd.Timedelta(days=1))
+    rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+    steps = rng.normal(0, 0.003, len(days) * len(HOURS))
+    spread = np.abs(rng.normal(0, 0.002, len(steps)))
+    close = rng.uniform(20, 200) * np.exp(np.cumsum(steps))
+
+    index = pd.DatetimeIndex(
+        (days.values[:, None] + HOURS * np.timedelta64(1, "h")).ravel(), name="Datetime"
+    ).tz_localize("Europe/Berlin")
+    bars = pd.DataFrame(
+        {
+            "Open": close / np.exp(steps),
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(100, 10_000, len(steps)),
+        },
+        index=index,
+    )
+    return bars[bars.index >= pd.Timestamp(start, tz="Europe/Berlin")]
+
+
+def git_commit() -> Optional[str]:
+    """Commit of the working tree, with ``-dirty`` for uncommitted changes."""
+    folder = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=folder,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=folder,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def resident_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where /proc is missing."""
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class PeakMemory:
+    """
+    Samples the resident set size on a background thread and records how
+    far it rose above its value on entry. Unlike tracemalloc this does not
+    slow down the measured code.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.baseline = resident_bytes()
+        self.peak = self.baseline
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self):
+        while not self.done.wait(self.interval):
+            self.peak = max(self.peak, resident_bytes())
+
+    def __enter__(self):
+        if self.baseline is not None:
+            self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.baseline is not None:
+            self.done.set()
+            self.thread.join()
+            self.peak = max(self.peak, resident_bytes())
+
+    @property
+    def megabytes(self) -> Optional[float]:
+        if self.baseline is None:
+            return None
+        return round((self.peak - self.baseline) / 2**20, 3)
+
+
+def measure(stage: str, function: Callable[[], int]) -> dict:
+    """Run ``function`` (returning the rows it processed) and time it."""
+    with PeakMemory() as memory, contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        rows = function()
+        seconds = time.perf_counter() - started
+    result = {
+        "stage": stage,
+        "seconds": round(seconds, 6),
+        "peak_mb": memory.megabytes,
+        "rows": int(rows),
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+    }
+    print(
+        f"{stage:>12}: {seconds:9.3f}s {result['peak_mb'] or 0:10.1f} MB peak "
+        f"{rows:>12,} rows {result['rows_per_sec'] or 0:>14,.0f} rows/s"
+    )
+    return result
+
+
+def cold_start() -> List[str]:
+    """
+    Import the app's modules in a fresh interpreter, as a cold start of the
+    app does, and return the deferred modules that were imported anyway.
+    """
+    code = (
+        "import json, sys\n"
+        f"for name in {APP_MODULES!r}:\n"
+        "    __import__(name)\n"
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def resample_weekly(df_symbol: pd.DataFrame) -> pd.DataFrame:
+    """On-the-fly weekly resampling, as the plot section did before rollups."""
+    return df_symbol.resample("W-Mon", on="date").agg(
+        {
+            column: "last"
+            for column in ["close", "rsi_14", "cci_25", "ma_9", "ma_50", "ma_250"]
+        }
+    )
+
+
+def run_benchmark(
+    tickers: int = 100,
+    days: int = 730,
+    stages: Optional[List[str]] = None,
+    workdir: Optional[str] = None,
+    filter_days: int = 5,
+) -> dict:
+    """Time the selected ``stages`` on ``tickers`` synthetic tickers."""
+    stages = stages or STAGES
+    names = synthetic_tickers(tickers)
+    end = pd.Timestamp.today().normalize()
+    start = end - pd.Timedelta(days=days)
+
+    with contextlib.ExitStack() as stack:
+        if workdir is None:
+            workdir = stack.enter_context(tempfile.TemporaryDirectory())
+        raw_folder = os.path.join(workdir, "tickers")
+        analyzed_folder = os.path.join(workdir, "analyzed")
+        state = {}
+        results = []
+
+        def startup():
+            deferred = cold_start()
+            if deferred:
+                print(f"Imported at startup: {', '.join(deferred)}", file=sys.stderr)
+            return len(APP_MODULES)
+
+        def extract():
+            extractor = Extractor(
+                names,
+                start.strftime("%Y-%m-%d"),
+                end.strftime("%Y-%m-%d"),
+                target_folder=raw_folder,
+                fetch=synthetic_bars,
+                rate=1e9,
+                retries=0,
+            )
+            return sum(len(bars) for bars in extractor.extract_data().values())
+
+        def analyze():
+            analyzer = TickerAnalyzer(raw_folder, analyzed_folder)
+            for ticker in names:
+                analyzer.preprocess_and_analyze(ticker, rebuild=True)
+            with open(os.path.join(raw_folder, MANIFEST_FILE), "r") as file:
+                return sum(entry["rows"] for entry in json.load(file).values())
+
+        def load():
+            state["cache"] = PanelCache(max_bytes=2**40)
+            state["universe"] = load_analyzed_panel(analyzed_folder, state["cache"])
+            return len(state["universe"])
+
+        def load_cached():
+            since = end - pd.Timedelta(days=filter_days)
+            recent = load_analyzed_panel(analyzed_folder, state["cache"], start=since)
+            return len(recent)
+
+        def classify():
+            default_rule_set().classify(state["universe"])
+            return len(state["universe"])
+
+        def resample():
+            for _, df_symbol in state["universe"].groupby("symbol", observed=True):
+                resample_weekly(df_symbol)
+            return len(state["universe"])
+
+        def plot_read():
+            rollups = RollupStore(analyzed_folder)
+            resolution = choose_resolution(start, end)
+            rows = 0
+            for ticker in names:
+                symbol = ticker.split(".")[0]
+                rows += len(rollups.read(symbol, resolution, start=start, end=end))
+            return rows
+
+        def render():
+            rollups = RollupStore(analyzed_folder)
+            resolution = choose_resolution(start, end)
+            rows = 0
+            for ticker in names[:RENDERED_CHARTS]:
+                symbol = ticker.split(".")[0]
+                df_symbol = rollups.read(symbol, resolution, start=start, end=end)
+                render_png(df_symbol.set_index("date"), symbol)
+                rows += len(df_symbol)
+            return rows
+
+        functions = {
+            "startup": startup,
+            "extract": extract,
+            "analyze": analyze,
+            "load": load,
+            "load_cached": load_cached,
+            "classify": classify,
+            "resample": resample,
+            "plot_read": plot_read,
+            "render": render,
+        }
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            # Produce the input of a stage untimed when its producer is skipped.
+            with contextlib.redirect_stdout(io.StringIO()):
+                needs_raw = stage not in ("startup", "extract")
+                if needs_raw and not os.path.exists(raw_folder):
+                    extract()
+                needs_analyzed = needs_raw and stage != "analyze"
+                if needs_analyzed and not os.path.exists(analyzed_folder):
+                    analyze()
+                needs_universe = stage in ("load_cached", "classify", "resample")
+                if needs_universe and "cache" not in state:
+                    load()
+            results.append(measure(stage, functions[stage]))
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "tickers": tickers,
+        "days": days,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "stages": results,
+    }
+
+
+def save_results(results: dict, folder: str = RESULTS_FOLDER) -> str:
+    os.makedirs(folder, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    size = f"{results['tickers']}x{results['days']}"
+    path = os.path.join(folder, f"{stamp}-{results['commit'] or 'nocommit'}-{size}.json")
+    with open(path, "w") as file:
+        json.dump(results, file, indent=4)
+    return path
+
+
+def compare(previous: dict, current: dict) -> Dict[str, float]:
+    """Wall time of every stage relative to a previous run (>1 is slower)."""
+    before = {stage["stage"]: stage["seconds"] for stage in previous["stages"]}
+    return {
+        stage["stage"]: stage["seconds"] / before[stage["stage"]]
+        for stage in current["stages"]
+        if before.get(stage["stage"])
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--workdir", help="keep the generated data in this folder")
+    parser.add_argument("--output", default=RESULTS_FOLDER)
+    parser.add_argument("--compare", help="previous result file to compare against")
+    args = parser.parse_args(argv)
+
+    stages = args.stages.split(",")
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)}")
+
+    results = run_benchmark(args.tickers, args.days, stages, args.workdir)
+    print(f"Saved results to {save_results(results, args.output)}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            previous = json.load(file)
+        for stage, ratio in compare(previous, results).items():
+            print(f"{stage:>12}: {ratio:6.2f}x the time of {previous['commit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Indicator charts of one symbol, downsampled and rendered to PNG
+
+Each series is reduced with Largest-Triangle-Three-Buckets (LTTB) to about
+one point per horizontal pixel before plotting. LTTB keeps the peaks and
+troughs that a plain stride would drop. Figures are drawn on a standalone
+``Figure`` (no pyplot state) and rendered to PNG bytes, which the app keeps
+in a ``PanelCache`` keyed on the view and the fingerprint of the data.
+matplotlib is only imported when the first figure is drawn.
+"""
+
+from typing import TYPE_CHECKING, Hashable, Tuple
+import io
+
+import numpy as np
+import pandas as pd
+
+from panel_cache import PanelCache
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+FIGURE_SIZE = (12, 12)
+DPI = 100
+MAX_FIGURE_BYTES = 64 * 1024 * 1024
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of ``threshold`` points of ``(x, y)`` chosen by LTTB.
+
+    The first and last point are always kept. Every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the mean of the next bucket. NaN values of ``y`` are
+    skipped.
+    """
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if threshold >= n or threshold < 3:
+        return valid
+    x = np.asarray(x, dtype=float)[valid]
+    y = np.asarray(y, dtype=float)[valid]
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        mean_x = x[next_start:next_end].mean()
+        mean_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[previous] - mean_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (mean_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return valid[selected]
+
+
+def downsample(series: pd.Series, threshold: int) -> pd.Series:
+    """``series`` (with a datetime index) reduced to ``threshold`` points."""
+    x = series.index
+    if isinstance(x, pd.DatetimeIndex):
+        x = x.asi8
+    return series.iloc[lttb(np.asarray(x), series.to_numpy(dtype=float), threshold)]
+
+
+def indicator_figure(
+    df_symbol: pd.DataFrame, symbol: str, max_points: int
+) -> "Figure":
+    """Price & moving averages, RSI and CCI of one symbol (date index)."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=FIGURE_SIZE)
+    axes = fig.subplots(3, 1)  # 3 rows, 1 column for different plots
+
+    def plot(ax, column, **style):
+        series = downsample(df_symbol[column], max_points)
+        ax.plot(series.index, series.to_numpy(), **style)
+
+    # Plot Closing Price & Moving Averages
+    plot(axes[0], "close", label="Close Price", color="blue")
+    plot(axes[0], "ma_9", label="MA 9", linestyle="dashed", color="orange")
+    plot(axes[0], "ma_50", label="MA 50", linestyle="dashed", color="green")
+    plot(axes[0], "ma_250", label="MA 250", linestyle="dashed", color="red")
+    axes[0].set_title(f"Price & Moving Averages ({symbol})")
+    axes[0].legend()
+
+    # Plot RSI
+    plot(axes[1], "rsi_14", label="RSI 14", color="purple")
+    axes[1].axhline(y=30, color="red", linestyle="--", label="RSI 30")
+    axes[1].axhline(y=70, color="green", linestyle="--", label="RSI 70")
+    axes[1].set_title(f"RSI ({symbol})")
+    axes[1].legend()
+
+    # Plot CCI
+    plot(axes[2], "cci_25", label="CCI 25", color="brown")
+    axes[2].axhline(y=-100, color="red", linestyle="--", label="CCI -100")
+    axes[2].axhline(y=100, color="green", linestyle="--", label="CCI 100")
+    axes[2].set_title(f"CCI ({symbol})")
+    axes[2].legend()
+
+    fig.tight_layout()
+    return fig
+
+
+def render_png(df_symbol: pd.DataFrame, symbol: str, dpi: int = DPI) -> bytes:
+    """Indicator chart as PNG, downsampled to the pixel width of the figure."""
+    max_points = int(FIGURE_SIZE[0] * dpi)
+    fig = indicator_figure(df_symbol, symbol, max_points)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
+
+
+def figure_cache(max_bytes: int = MAX_FIGURE_BYTES) -> PanelCache:
+    """LRU cache of rendered PNG figures bounded by their total size."""
+    return PanelCache(max_bytes=max_bytes, sizeof=len)
+
+
+def cached_png(
+    cache: PanelCache, symbol: str, view: Tuple, fingerprint: Hashable, load
+) -> bytes:
+    """
+    PNG of ``symbol`` over ``view`` (e.g. resolution and date range). The
+    frame from ``load()`` is only read and rendered when the cache holds no
+    figure of this view for ``fingerprint``. An empty frame gives empty bytes.
+    """
+
+    def render():
+        df_symbol = load()
+        if df_symbol.empty:
+            return b""
+        return render_png(df_symbol.set_index("date"), symbol)
+
+    return cache.get((symbol,) + tuple(view), fingerprint, render)
@@ -0,0 +1,24 @@
+import pytest
+
+from storage import open_store
+from test_analyzer import hourly_bars
+from transform import TickerAnalyzer
+
+UNIVERSE = ["IWDA.AS", "GMVM.DE", "C40.PA"]
+
+
+def write_universe(tmp_path, days=80):
+    """Raw hourly bars of ``UNIVERSE``; the closes of more days extend fewer."""
+    raw_store = open_store(str(tmp_path / "tickers"), "datetime")
+    for seed, ticker in enumerate(UNIVERSE):
+        raw_store.write(ticker, hourly_bars(days, seed=seed))
+    return raw_store
+
+
+@pytest.fixture
+def analyzed_universe(tmp_path):
+    """Analyzer of a small universe that has been analyzed and published."""
+    write_universe(tmp_path)
+    analyzer = TickerAnalyzer(str(tmp_path / "tickers"), str(tmp_path / "analyzed"))
+    analyzer.analyze_many(UNIVERSE, workers=1)
+    return analyzer
@@ -0,0 +1,347 @@
+"""Cross-sectional analytics over the aligned date x symbol panel
+
+- a rolling correlation matrix of ``pct_change`` over the last ``window``
+  dates, from running pairwise sums, so a new day costs a few outer
+  products instead of a recomputation
+- percentile ranks of RSI and CCI across symbols for every date
+- relative strength of every symbol against a benchmark symbol: its
+  return over ``lookback`` dates divided by the benchmark's
+
+Everything runs on whole arrays; the correlation of thousands of symbols
+is a handful of matrix products. ``CrossSection`` keeps the results and
+extends them as new dates arrive.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+
+from indicators import Panel
+from panel_cache import folder_fingerprint
+from shared_panel import SharedPanel, shared_panel
+from storage import open_store
+
+CORRELATION_WINDOW = 60
+RS_LOOKBACK = 20
+RANKED_FIELDS = ["rsi_14", "cci_25"]
+FIELDS = ["close", "pct_change"] + RANKED_FIELDS
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """Fill NaN values with the last valid value above them (per column)."""
+    rows = np.where(~np.isnan(values), np.arange(len(values))[:, None], 0)
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    # Columns starting with NaN stay NaN until their first value.
+    return values[rows, np.arange(values.shape[1])]
+
+
+def percentile_ranks(values: np.ndarray) -> np.ndarray:
+    """
+    Percentile rank (0, 1] of every value among the symbols of its date,
+    ties sharing their average rank, like ``DataFrame.rank(axis=1, pct=True)``.
+    NaN values are not ranked.
+    """
+    ranks = np.full(values.shape, np.nan)
+    if values.size == 0:
+        return ranks
+    order = np.argsort(values, axis=1, kind="stable")  # NaN sort last
+    ordered = np.take_along_axis(values, order, axis=1)
+    columns = np.arange(values.shape[1])
+    # First and last position of every run of equal values in a row.
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    first = np.maximum.accumulate(np.where(starts, columns, 0), axis=1)
+    ends = np.ones(ordered.shape, dtype=bool)
+    ends[:, :-1] = starts[:, 1:]
+    reversed_ends = np.where(ends, columns, columns[-1])[:, ::-1]
+    last = np.minimum.accumulate(reversed_ends, axis=1)[:, ::-1]
+    counts = (~np.isnan(values)).sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        average = ((first + last) / 2 + 1) / counts
+    average[np.isnan(ordered)] = np.nan
+    np.put_along_axis(ranks, order, average, axis=1)
+    return ranks
+
+
+def relative_strength(
+    close: np.ndarray, benchmark: np.ndarray, lookback: int = RS_LOOKBACK
+) -> np.ndarray:
+    """
+    Return of every column over ``lookback`` rows divided by the benchmark's,
+    minus one: above 0 the symbol outperformed the benchmark. ``close`` and
+    ``benchmark`` are forward-filled closes; the first ``lookback`` rows are
+    NaN.
+    """
+    result = np.full(close.shape, np.nan)
+    if len(close) <= lookback:
+        return result
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = close[lookback:] / close[:-lookback]
+        benchmark_returns = benchmark[lookback:] / benchmark[:-lookback]
+        result[lookback:] = returns / benchmark_returns[:, None] - 1
+    return result
+
+
+class RollingCorrelation:
+    """
+    Correlation matrix over the last ``window`` rows pushed, with
+    pairwise-complete observations (a pair uses the rows where both values
+    are present).
+
+    The running sums are ``symbols x symbols`` matrices: pushing a row adds
+    its outer products and the row leaving the window is subtracted.
+    """
+
+    def __init__(
+        self, symbols: int, window: int = CORRELATION_WINDOW, min_periods=None
+    ):
+        self.window = window
+        self.min_periods = min_periods or max(window // 2, 3)
+        self.rows = deque()
+        shape = (symbols, symbols)
+        self.counts = np.zeros(shape)
+        self.sums = np.zeros(shape)  # sums[i, j]: sum of x_i where x_j is present
+        self.squares = np.zeros(shape)
+        self.products = np.zeros(shape)
+
+    def _add(self, rows: np.ndarray, sign: float):
+        present = ~np.isnan(rows)
+        values = np.where(present, rows, 0.0)
+        weights = present.astype(float)
+        self.counts += sign * (weights.T @ weights)
+        self.sums += sign * (values.T @ weights)
+        self.squares += sign * ((values * values).T @ weights)
+        self.products += sign * (values.T @ values)
+
+    def extend(self, rows: np.ndarray):
+        """Push several rows (``dates x symbols``) at once."""
+        rows = np.atleast_2d(rows)[-self.window :]
+        dropped = len(self.rows) + len(rows) - self.window
+        if dropped > 0:
+            self._add(np.array([self.rows.popleft() for _ in range(dropped)]), -1.0)
+        self._add(rows, 1.0)
+        self.rows.extend(rows)
+
+    def pop(self) -> np.ndarray:
+        """Remove the newest row (e.g. to replace a revised day)."""
+        row = self.rows.pop()
+        self._add(row[None, :], -1.0)
+        return row
+
+    def matrix(self) -> np.ndarray:
+        n = self.counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = n * self.products - self.sums * self.sums.T
+            variance = n * self.squares - self.sums**2
+            correlation = covariance / np.sqrt(variance * variance.T)
+        correlation[(n < self.min_periods) | ~np.isfinite(correlation)] = np.nan
+        return np.clip(correlation, -1.0, 1.0)
+
+
+class CrossSection:
+    """
+    Correlations, percentile ranks and relative strength of a fixed set of
+    symbols, extended with ``update(panel)`` as new dates arrive.
+
+    ``update`` reprocesses the dates from the last known one onwards (the
+    last day may have been revised) and ignores older dates. It returns
+    False when the panel holds symbols this cross-section does not know,
+    in which case it has to be rebuilt.
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        benchmark: Optional[str] = None,
+        window: int = CORRELATION_WINDOW,
+        lookback: int = RS_LOOKBACK,
+    ):
+        self.symbols = list(symbols)
+        self.positions = {symbol: position for position, symbol in enumerate(symbols)}
+        self.benchmark = benchmark if benchmark in self.positions else None
+        self.window = window
+        self.lookback = lookback
+        self.dates = pd.DatetimeIndex([])
+        self.closes = np.empty((0, len(symbols)))
+        self.ranks = {field: np.empty((0, len(symbols))) for field in RANKED_FIELDS}
+        self.strength = np.empty((0, len(symbols)))
+        self.correlation = RollingCorrelation(len(symbols), window)
+
+    @classmethod
+    def from_panel(cls, panel: Panel, **kwargs) -> "CrossSection":
+        cross_section = cls(panel.symbols, **kwargs)
+        cross_section.update(panel)
+        return cross_section
+
+    def _aligned(self, panel: Panel, field: str) -> np.ndarray:
+        values = np.full((len(panel.dates), len(self.symbols)), np.nan)
+        columns = [self.positions[symbol] for symbol in panel.symbols]
+        values[:, columns] = panel.fields[field]
+        return values
+
+    def _drop_from(self, row: int):
+        """Forget the dates from ``row`` on; they are the newest correlation rows."""
+        for _ in range(min(len(self.dates) - row, len(self.correlation.rows))):
+            self.correlation.pop()
+        self.dates = self.dates[:row]
+        self.closes = self.closes[:row]
+        self.strength = self.strength[:row]
+        self.ranks = {field: ranks[:row] for field, ranks in self.ranks.items()}
+
+    def update(self, panel: Panel) -> bool:
+        if any(symbol not in self.positions for symbol in panel.symbols):
+            return False
+        if len(self.dates):
+            keep = panel.dates >= self.dates[-1]
+            if not keep.any():
+                return True
+            panel = Panel(
+                panel.dates[keep],
+                panel.symbols,
+                {field: values[keep] for field, values in panel.fields.items()},
+            )
+            self._drop_from(self.dates.searchsorted(panel.dates[0]))
+
+        new = len(panel.dates)
+        previous = self.closes[-1:]
+        filled = forward_fill(np.concatenate([previous, self._aligned(panel, "close")]))
+        self.closes = np.concatenate([self.closes, filled[len(previous) :]])
+        tail = self.closes[-(new + self.lookback) :]
+        if self.benchmark is not None:
+            benchmark = tail[:, self.positions[self.benchmark]]
+            strength = relative_strength(tail, benchmark, self.lookback)[-new:]
+        else:
+            strength = np.full((new, len(self.symbols)), np.nan)
+
+        self.dates = self.dates.append(panel.dates)
+        self.strength = np.concatenate([self.strength, strength])
+        for field in RANKED_FIELDS:
+            ranks = percentile_ranks(self._aligned(panel, field))
+            self.ranks[field] = np.concatenate([self.ranks[field], ranks])
+        self.correlation.extend(self._aligned(panel, "pct_change"))
+        return True
+
+    def correlation_frame(self) -> pd.DataFrame:
+        """Correlation of ``pct_change`` over the last ``window`` dates."""
+        return pd.DataFrame(
+            self.correlation.matrix(), index=self.symbols, columns=self.symbols
+        )
+
+    def top_pairs(self, count: int = 10) -> pd.DataFrame:
+        """The ``count`` most correlated pairs of distinct symbols."""
+        matrix = self.correlation.matrix()
+        first, second = np.triu_indices(len(self.symbols), k=1)
+        values = matrix[first, second]
+        order = np.argsort(-np.nan_to_num(values, nan=-np.inf), kind="stable")
+        order = order[:count]
+        return pd.DataFrame(
+            {
+                "symbol": np.asarray(self.symbols)[first[order]],
+                "other": np.asarray(self.symbols)[second[order]],
+                "correlation": values[order],
+            }
+        )
+
+    def latest(self) -> pd.DataFrame:
+        """Ranks and relative strength of every symbol on the last date."""
+        if not len(self.dates):
+            columns = [f"{field}_pct" for field in RANKED_FIELDS]
+            return pd.DataFrame(columns=columns + ["relative_strength"])
+        data: Dict[str, np.ndarray] = {
+            f"{field}_pct": self.ranks[field][-1] for field in RANKED_FIELDS
+        }
+        data["relative_strength"] = self.strength[-1]
+        df = pd.DataFrame(data, index=pd.Index(self.symbols, name="symbol"))
+        return df.sort_values("relative_strength", ascending=False)
+
+
+def load_fields(analyzed_folder: str, start=None) -> Panel:
+    """The fields of the analyzed universe from ``start`` on, as a panel."""
+    published = shared_panel(analyzed_folder)
+    if published is not None:
+        df = published.to_pandas(start=start, columns=FIELDS)
+    else:
+        df = open_store(analyzed_folder, "date").read_all(columns=FIELDS, start=start)
+    return Panel.from_long(df, FIELDS)
+
+
+def history_digest(published: SharedPanel, before) -> str:
+    """
+    Digest of the symbols, dates and ``FIELDS`` of the rows of a published
+    panel dated before ``before``. It only changes if that history was
+    rewritten, not when later dates are appended.
+    """
+    cutoff = pd.Timestamp(before).value
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(published.symbols).encode())
+    columns = [
+        np.asarray(published.table.column(name).combine_chunks())
+        for name in ["date"] + FIELDS
+    ]
+    offsets = published.offsets
+    for first, stop in zip(offsets[:-1], offsets[1:]):
+        stop = first + np.searchsorted(published.dates[first:stop], cutoff)
+        digest.update(np.int64(stop - first).tobytes())
+        for values in columns:
+            digest.update(values[first:stop].tobytes())
+    return digest.hexdigest()
+
+
+class CrossSectionCache:
+    """
+    Thread-safe cache of one ``CrossSection`` per analyzed folder and
+    parameters.
+
+    An entry is reused as long as the published panel keeps its version.
+    A new version that only appended dates extends the cached cross-section
+    from its last date; any other change (rewritten history, removed or
+    added symbols) rebuilds it. Without a published panel the entry is
+    rebuilt whenever the analyzed folder changed.
+    """
+
+    def __init__(self):
+        # key -> (cross-section, data version, digest of its history)
+        self.entries: Dict[tuple, tuple] = {}
+        self.lock = threading.Lock()
+
+    def get(
+        self,
+        analyzed_folder: str,
+        benchmark: Optional[str] = None,
+        window: int = CORRELATION_WINDOW,
+        lookback: int = RS_LOOKBACK,
+    ) -> CrossSection:
+        key = (analyzed_folder, benchmark, window, lookback)
+        published = shared_panel(analyzed_folder)
+        version = (
+            published.version
+            if published is not None
+            else folder_fingerprint(analyzed_folder)
+        )
+        with self.lock:
+            cached, cached_version, digest = self.entries.get(key, (None, None, None))
+            if cached is not None and cached_version == version:
+                return cached
+            if (
+                cached is not None
+                and published is not None
+                and len(cached.dates)
+                and history_digest(published, cached.dates[-1]) == digest
+                and cached.update(load_fields(analyzed_folder, start=cached.dates[-1]))
+            ):
+                cross_section = cached
+            else:
+                cross_section = CrossSection.from_panel(
+                    load_fields(analyzed_folder),
+                    benchmark=benchmark,
+                    window=window,
+                    lookback=lookback,
+                )
+            if published is not None and len(cross_section.dates):
+                digest = history_digest(published, cross_section.dates[-1])
+            self.entries[key] = (cross_section, version, digest)
+            return cross_section
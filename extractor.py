@@ -1,11 +1,18 @@
 """Extract a symbol(s)"""
 
-from typing import List
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import functools
+import json
 import os
 import re
-import yfinance as yf
-from yfinance.data import YfData
-import requests
+import pandas as pd
+from fetch_engine import FetchEngine, pooled_session
+from instrumentation import stage
+from storage import open_store
+
+if TYPE_CHECKING:
+    import requests
 
 # Define a modern User-Agent header
 NEW_HEADERS = {
@@ -14,22 +21,79 @@ NEW_HEADERS = {
 }
 
 
-# Monkey-patch the YfData class to use the new headers
-class PatchedYfData(YfData):
-    def _fetch(self, url, params=None, **kwargs):
-        if "headers" not in kwargs:
-            kwargs["headers"] = NEW_HEADERS
-        return super()._fetch(url, params=params, **kwargs)
+MANIFEST_FILE = "manifest.json"
+
+
+@functools.lru_cache(maxsize=None)
+def patch_yfinance():
+    """
+    Make yfinance send ``NEW_HEADERS``, once per process.
+
+    yfinance is imported here rather than at module import, so the app and
+    the pipeline only pay for it when they download something.
+    """
+    import requests
+    import yfinance as yf
+    from yfinance.data import YfData
+
+    # Monkey-patch the YfData class to use the new headers
+    class PatchedYfData(YfData):
+        def _fetch(self, url, params=None, **kwargs):
+            if "headers" not in kwargs:
+                kwargs["headers"] = NEW_HEADERS
+            return super()._fetch(url, params=params, **kwargs)
+
+    # Replace the default YfData instance with our patched version
+    patched_data_instance = PatchedYfData()
+    patched_data_instance.session = requests.Session()
+    yf.shared._data = patched_data_instance
+    return yf
+
+
+@functools.lru_cache(maxsize=None)
+def no_data_errors() -> Tuple[type, ...]:
+    """Errors meaning the ticker has no data on Yahoo; retrying them is pointless."""
+    from yfinance.exceptions import YFPricesMissingError, YFTzMissingError
+
+    return (YFPricesMissingError, YFTzMissingError)
+
 
+@functools.lru_cache(maxsize=None)
+def shared_session(pool_size: int) -> "requests.Session":
+    """Process-wide pooled session for ``pool_size`` download threads."""
+    return pooled_session(pool_size, headers=NEW_HEADERS)
 
-# Replace the default YfData instance with our patched version
-patched_data_instance = PatchedYfData()
-patched_data_instance.session = requests.Session()
-yf.shared._data = patched_data_instance
+
+def yfinance_fetch(
+    ticker: str, start: str, end: str, session: Optional["requests.Session"] = None
+) -> pd.DataFrame:
+    """Download the hourly bars of a single ticker from Yahoo Finance."""
+    yf = patch_yfinance()
+    return yf.Ticker(ticker, session=session).history(
+        start=start,
+        end=end,
+        interval="1h",
+        prepost=False,
+        actions=False,
+        auto_adjust=True,
+        raise_errors=True,
+    )
 
 
 class Extractor:
-    """This is the extractor Class"""
+    """This is the extractor Class
+
+    With ``incremental=True`` only the bars after the last stored timestamp
+    of each ticker are downloaded (plus ``overlap_days`` to pick up revised
+    bars) and merged into the existing file. The covered range of every
+    ticker is recorded in ``manifest.json`` inside the target folder.
+
+    Tickers are fetched concurrently by a ``FetchEngine`` with ``max_workers``
+    threads, at most ``rate`` requests per second and ``retries`` retries
+    per ticker. ``fetch(ticker, start, end)`` can be injected to replace the
+    Yahoo Finance download, in which case yfinance is never imported.
+    Tickers that fail are listed in ``failed``.
+    """
 
     def __init__(
         self,
@@ -37,17 +101,45 @@ class Extractor:
         start_date: str,
         end_date: str,
         target_folder: str = "data/tickers",
+        incremental: bool = False,
+        overlap_days: int = 1,
+        fetch: Optional[Callable[[str, str, str], pd.DataFrame]] = None,
+        max_workers: int = 8,
+        rate: float = 4.0,
+        retries: int = 3,
+        storage_format: Optional[str] = None,
     ):
         self.tickers = tickers
         self.start_date = start_date
         self.end_date = end_date
         self.target_folder = target_folder
+        self.incremental = incremental
+        self.overlap_days = overlap_days
+        self.manifest_path = os.path.join(self.target_folder, MANIFEST_FILE)
+        fatal_errors = ()
+        if fetch is None:
+            session = shared_session(max_workers)
+            fatal_errors = no_data_errors()
+
+            def fetch(ticker, start, end):
+                return yfinance_fetch(ticker, start, end, session=session)
+
+        self.fetch = fetch
+        self.engine = FetchEngine(
+            fetch,
+            max_workers=max_workers,
+            rate=rate,
+            retries=retries,
+            fatal_errors=fatal_errors,
+        )
+        self.failed = {}
 
         # Create the target folder if it doesn't exist
         print(self.target_folder)
         if not os.path.exists(self.target_folder):
             print(f"Creating folder {self.target_folder}...")
             os.makedirs(self.target_folder, exist_ok=True)
+        self.store = open_store(self.target_folder, "datetime", storage_format)
 
     def clean_col(self, col):
         """
@@ -69,36 +161,151 @@ class Extractor:
         col = col.replace("_", "")
         return col
 
+    def load_manifest(self) -> dict:
+        """Return the per-ticker manifest, or an empty one if none exists."""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, "r") as file:
+            return json.load(file)
+
+    def save_manifest(self, manifest: dict):
+        with open(self.manifest_path, "w") as file:
+            json.dump(manifest, file, indent=4, sort_keys=True)
+
+    def load_existing(self, ticker: str) -> Optional[pd.DataFrame]:
+        """Load the stored bars of a ticker, or None if nothing is stored yet."""
+        if not self.store.exists(ticker):
+            return None
+        existing = self.store.read(ticker)
+        if existing.empty or "datetime" not in existing.columns:
+            return None
+        existing["datetime"] = pd.to_datetime(existing["datetime"], utc=True)
+        return existing
+
+    def last_timestamp(self, ticker: str, manifest: dict) -> Optional[pd.Timestamp]:
+        """Last stored bar of a ticker, from the manifest or the stored file."""
+        if not self.store.exists(ticker):
+            return None
+        entry = manifest.get(ticker)
+        if entry and entry.get("end"):
+            return pd.Timestamp(entry["end"])
+        stored = self.store.read(ticker, columns=["datetime"])
+        if stored.empty:
+            return None
+        return pd.to_datetime(stored["datetime"], utc=True).max()
+
+    def fetch_start(self, last_timestamp: Optional[pd.Timestamp]) -> str:
+        """Start of the download window for a ticker."""
+        if last_timestamp is None:
+            return self.start_date
+        start = last_timestamp - timedelta(days=self.overlap_days)
+        return max(start.strftime("%Y-%m-%d"), self.start_date)
+
+    @staticmethod
+    def merge_bars(existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge freshly downloaded bars into the stored ones.
+
+        Bars are aligned in UTC, duplicated timestamps keep the new (revised)
+        bar and the result is converted back to the exchange timezone of the
+        new data.
+        """
+        tz = getattr(new["datetime"].dt, "tz", None)
+        new = new.copy()
+        new["datetime"] = pd.to_datetime(new["datetime"], utc=True)
+        merged = pd.concat([existing, new], ignore_index=True)
+        merged = merged.drop_duplicates(subset="datetime", keep="last")
+        merged = merged.sort_values("datetime").reset_index(drop=True)
+        if tz is not None:
+            merged["datetime"] = merged["datetime"].dt.tz_convert(tz)
+        return merged
+
+    def manifest_entry(self, stock_data: pd.DataFrame) -> dict:
+        timestamps = pd.to_datetime(stock_data["datetime"], utc=True)
+        return {
+            "start": timestamps.min().isoformat(),
+            "end": timestamps.max().isoformat(),
+            "rows": int(len(stock_data)),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def clean(self, stock_data: pd.DataFrame) -> pd.DataFrame:
+        """Flatten a downloaded frame and clean its column names."""
+        stock_data = stock_data.copy()
+        # Reset index
+        stock_data.reset_index(inplace=True)
+
+        # Rename columns using the clean_col function.
+        stock_data.columns = [self.clean_col(col) for col in stock_data.columns]
+        return stock_data
+
+    def plan(self, manifest: dict):
+        """
+        Work out the download window of every ticker.
+
+        Returns ``(jobs, existing)``: ``ticker -> (start, end)`` for the tickers
+        that need a download, and the stored bars of incremental tickers.
+        """
+        jobs, existing = {}, {}
+        for ticker in self.tickers:
+            start = self.start_date
+            if self.incremental:
+                last_timestamp = self.last_timestamp(ticker, manifest)
+                start = self.fetch_start(last_timestamp)
+                if last_timestamp is not None:
+                    stored = self.load_existing(ticker)
+                    if stored is not None:
+                        existing[ticker] = stored
+            if start >= self.end_date and ticker in existing:
+                print(f"{ticker} is up to date")
+                continue
+            jobs[ticker] = (start, self.end_date)
+        return jobs, existing
+
     def extract_data(self) -> dict:
         """Downloads ticker data from Yahoo Finance"""
+        manifest = self.load_manifest()
+        jobs, existing = self.plan(manifest)
+        report = self.engine.run(jobs)
+        self.failed = dict(report.failures)
+
         result_data = {}
+        updated = False
         for ticker in self.tickers:
-            # Download stock data using yfinance with the patched headers
-            stock_data = yf.download(
-                ticker,
-                start=self.start_date,
-                end=self.end_date,
-                group_by="ticker",
-                progress=False,
-                prepost=False,
-                interval="1h",
-                auto_adjust=True,
-            )
-            # If the data is nested by ticker symbol, extract it accordingly.
-            if ticker in stock_data:
-                stock_data = stock_data[ticker]
-
-            # Reset index
-            stock_data.reset_index(inplace=True)
-
-            # Rename columns using the clean_col function.
-            stock_data.columns = [self.clean_col(col) for col in stock_data.columns]
-
-            # Save the data to a CSV file in the target folder
-            file_path = os.path.join(self.target_folder, f"{ticker}.csv")
-            stock_data.to_csv(file_path, index=False)
-            print(f"Saved {ticker} data to {file_path}")
+            if ticker not in jobs:
+                result_data[ticker] = existing[ticker]
+                continue
+            if ticker not in report.results:
+                continue
 
+            with stage("clean", ticker) as record:
+                stock_data = self.clean(report.results[ticker])
+                record["rows"] = len(stock_data)
+
+            if ticker in existing:
+                if stock_data.empty:
+                    print(f"No new {ticker} data since {jobs[ticker][0]}")
+                    result_data[ticker] = existing[ticker]
+                    continue
+                with stage("merge", ticker):
+                    stock_data = self.merge_bars(existing[ticker], stock_data)
+            elif stock_data.empty:
+                self.failed[ticker] = "no data returned"
+                continue
+
+            # Save the data to the ticker store in the target folder
+            with stage("write", ticker, rows=len(stock_data)) as record:
+                self.store.write(ticker, stock_data)
+                record["bytes"] = os.path.getsize(self.store.path(ticker))
+            print(f"Saved {ticker} data to {self.store.path(ticker)}")
+
+            manifest[ticker] = self.manifest_entry(stock_data)
+            updated = True
             result_data[ticker] = stock_data
 
+        for ticker, error in sorted(self.failed.items()):
+            print(f"Failed to extract {ticker}: {error}")
+
+        if updated:
+            self.save_manifest(manifest)
         return result_data
@@ -0,0 +1,150 @@
+"""Concurrent, rate-limited fetch engine used by the Extractor"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+import threading
+import time
+
+from instrumentation import stage
+
+if TYPE_CHECKING:
+    import requests
+
+
+def pooled_session(pool_size: int, headers: Optional[dict] = None) -> "requests.Session":
+    """Create a requests session whose connection pool fits ``pool_size`` workers."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    ``rate`` tokens are added per second up to ``capacity``; every call to
+    ``acquire`` takes one token and blocks until one is available.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = self.clock()
+                elapsed = now - self.updated_at
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+@dataclass
+class FetchReport:
+    """Outcome of a fetch run: frames per ticker and errors per failed ticker."""
+
+    results: Dict[str, object] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    attempts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def failed_tickers(self):
+        return sorted(self.failures)
+
+
+class FetchEngine:
+    """
+    Fetch many tickers concurrently.
+
+    ``fetch(ticker, start, end)`` is called from a pool of ``max_workers``
+    threads, every call (including retries) first takes a token from a
+    bucket refilled at ``rate`` calls per second. Failing calls are retried
+    ``retries`` times with exponential backoff; exceptions listed in
+    ``fatal_errors`` are not retried. A ticker that still fails is reported
+    in ``FetchReport.failures`` instead of aborting the run.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str, str], object],
+        max_workers: int = 8,
+        rate: float = 4.0,
+        burst: Optional[float] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        fatal_errors: Tuple[type, ...] = (),
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.fetch = fetch
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.fatal_errors = fatal_errors
+        self.sleep = sleep
+        self.bucket = TokenBucket(rate, burst, sleep=sleep)
+
+    def fetch_with_retry(self, ticker: str, start: str, end: str):
+        """Fetch a single ticker, return ``(frame, attempts)`` or raise."""
+        attempt = 0
+        while True:
+            attempt += 1
+            self.bucket.acquire()
+            try:
+                with stage("fetch", ticker, attempt=attempt) as record:
+                    frame = self.fetch(ticker, start, end)
+                    record["rows"] = len(frame)
+                return frame, attempt
+            except self.fatal_errors:
+                raise
+            except Exception:
+                if attempt > self.retries:
+                    raise
+                self.sleep(self.backoff * 2 ** (attempt - 1))
+
+    def run(self, jobs: Dict[str, Tuple[str, str]]) -> FetchReport:
+        """Fetch every ``ticker -> (start, end)`` job and collect a report."""
+        report = FetchReport()
+        if not jobs:
+            return report
+        workers = max(1, min(self.max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.fetch_with_retry, ticker, start, end): ticker
+                for ticker, (start, end) in jobs.items()
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    frame, attempts = future.result()
+                except Exception as error:
+                    report.failures[ticker] = f"{type(error).__name__}: {error}"
+                    continue
+                report.results[ticker] = frame
+                report.attempts[ticker] = attempts
+        return report
@@ -1,37 +1,13 @@
-import re
-import json 
-def extract_href(input_text):
-    """
-    Extracts all href values from the given text.
+"""Superseded by universe.py, which streams saved listing pages from disk
 
-    Parameters:
-        input_text (str): The text to process.
+The listing page that used to be embedded here is saved as
+``data/listings/lightyear_etfs.html``; running this script still rebuilds
+the universe from it.
+"""
 
-    Returns:
-        list: A list of href values found in the text.
-    """
-    href_pattern = r'href="([^"]+)"'
-    return re.findall(href_pattern, input_text)
+import sys
 
-# Example usage
-if __name__ == "__main__":
-    html='''
-    <div class="sc-6c6f0ed6-2 ftRJJl"><a href="/etf/CSPX:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core S&amp;P 500</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CSPX<span class="sc-65b86c41-0 dXpPBl">·</span>500 Largest US stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>100&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>560,29&nbsp;€</span></div></div></a><a href="/etf/SXR8:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core S&amp;P 500</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SXR8<span class="sc-65b86c41-0 dXpPBl">·</span>500 largest US stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>100&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>560,29&nbsp;€</span></div></div></a><a href="/etf/IWDA:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core MSCI World</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IWDA<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>89&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>99,48&nbsp;€</span></div></div></a><a href="/etf/EMIM:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core MSCI Emerging Markets</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€EMIM<span class="sc-65b86c41-0 dXpPBl">·</span>Emerging markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>21&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>32,41&nbsp;€</span></div></div></a><a href="/etf/VUAA:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard S&amp;P 500</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VUAA<span class="sc-65b86c41-0 dXpPBl">·</span>500 Largest US stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>19&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>100,47&nbsp;€</span></div></div></a><a href="/etf/VWCE:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard FTSE All-World</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VWCE<span class="sc-65b86c41-0 dXpPBl">·</span>Global stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>17&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>128,69&nbsp;€</span></div></div></a><a href="/etf/CNDX:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Nasdaq 100</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CNDX<span class="sc-65b86c41-0 dXpPBl">·</span>US technology stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>15&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1055,30&nbsp;€</span></div></div></a><a href="/etc/PPFB:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/instrument/logos/1ede8d29-44d8-6997-9457-63391db81f43.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Physical Gold</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€PPFB<span class="sc-65b86c41-0 dXpPBl">·</span>Gold<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>14&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>52,12&nbsp;€</span></div></div></a><a href="/etf/IMAE:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core MSCI Europe</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IMAE<span class="sc-65b86c41-0 dXpPBl">·</span>European stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>9,9&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>85,41&nbsp;€</span></div></div></a><a href="/etf/SPPW:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI World</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SPPW<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>9,9&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>36,33&nbsp;€</span></div></div></a><a href="/etf/SGAS:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI USA ESG Screened</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SGAS<span class="sc-65b86c41-0 dXpPBl">·</span>MSCI USA ESG Screened Index<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>9,7&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>10,75&nbsp;€</span></div></div></a><a href="/etf/QDVE:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares S&amp;P 500 Information Technology Sector</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€QDVE<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>9,4&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>28,58&nbsp;€</span></div></div></a><a href="/etf/EXS1:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core DAX</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€EXS1<span class="sc-65b86c41-0 dXpPBl">·</span>Top 40 German stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>7,8&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>189,71&nbsp;€</span></div></div></a><a href="/etf/MEUD:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/lyxor.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Amundi STOXX Europe 600</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€MEUD<span class="sc-65b86c41-0 dXpPBl">·</span>Top 600 European stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>7,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>258,18&nbsp;€</span></div></div></a><a href="/etf/2B7K:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI World SRI</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€2B7K<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets ESG stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>7,2&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>11,19&nbsp;€</span></div></div></a><a href="/etf/IBCF:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares S&amp;P 500 EUR Hedged</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IBCF<span class="sc-65b86c41-0 dXpPBl">·</span>500 Largest US stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>6,5&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>119,38&nbsp;€</span></div></div></a><a href="/etf/IJPA:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core MSCI Japan</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IJPA<span class="sc-65b86c41-0 dXpPBl">·</span>Japanese stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>5,3&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>52,05&nbsp;€</span></div></div></a><a href="/etf/CSX5:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core EURO STOXX 50</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CSX5<span class="sc-65b86c41-0 dXpPBl">·</span>Top 50 European stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>4,7&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>201,58&nbsp;€</span></div></div></a><a href="/etf/CEMU:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core MSCI EMU</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CEMU<span class="sc-65b86c41-0 dXpPBl">·</span>EMU stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>4,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>194,50&nbsp;€</span></div></div></a><a href="/etf/R2US:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR Russell 2000 US Small Cap</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€R2US<span class="sc-65b86c41-0 dXpPBl">·</span>US small cap stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>4,2&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>54,60&nbsp;€</span></div></div></a><a href="/etf/IS3Q:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Edge MSCI World Quality Factor</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IS3Q<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets quality stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,8&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>64,14&nbsp;€</span></div></div></a><a href="/etf/IESE:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI Europe SRI</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IESE<span class="sc-65b86c41-0 dXpPBl">·</span>European ESG stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>70,04&nbsp;€</span></div></div></a><a href="/etf/EUNM:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI EM</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€EUNM<span class="sc-65b86c41-0 dXpPBl">·</span>Emerging markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>37,48&nbsp;€</span></div></div></a><a href="/etf/QDVR:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI USA SRI</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€QDVR<span class="sc-65b86c41-0 dXpPBl">·</span>US ESG stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>14,25&nbsp;€</span></div></div></a><a href="/etf/AYEM:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI EM IMI ESG Screened</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€AYEM<span class="sc-65b86c41-0 dXpPBl">·</span>MSCI Emerging Markets Investable Market Index <span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,5&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>6,23&nbsp;€</span></div></div></a><a href="/etf/VGVF:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard FTSE Developed World</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VGVF<span class="sc-65b86c41-0 dXpPBl">·</span>Developed world stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,5&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>101,73&nbsp;€</span></div></div></a><a href="/etf/SLMC:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI Europe ESG Screened</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SLMC<span class="sc-65b86c41-0 dXpPBl">·</span>Europe ESG Index<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,4&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>9,06&nbsp;€</span></div></div></a><a href="/etf/IQQ0:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Edge MSCI World Minimum Volatility</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IQQ0<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,3&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>65,68&nbsp;€</span></div></div></a><a href="/etf/IS3S:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Edge MSCI World Value Factor</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IS3S<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets value stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>3,3&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>43,01&nbsp;€</span></div></div></a><a href="/etf/CEBL:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI EM Asia</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CEBL<span class="sc-65b86c41-0 dXpPBl">·</span>Emerging Asian markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,9&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>170,82&nbsp;€</span></div></div></a><a href="/etf/2B76:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Automation &amp; Robotics</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€2B76<span class="sc-65b86c41-0 dXpPBl">·</span>Global automation and robotics stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,8&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>12,52&nbsp;€</span></div></div></a><a href="/etf/DFEN:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vaneck.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">VanEck Defense</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€DFEN<span class="sc-65b86c41-0 dXpPBl">·</span>Defense stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,8&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>40,63&nbsp;€</span></div></div></a><a href="/etf/CPXJ:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Core MSCI Pacific ex Japan</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CPXJ<span class="sc-65b86c41-0 dXpPBl">·</span>HK, SG, AU, NZ stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>171,53&nbsp;€</span></div></div></a><a href="/etf/SUSM:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI EM SRI</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SUSM<span class="sc-65b86c41-0 dXpPBl">·</span>Emerging markets ESG stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,6&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>6,79&nbsp;€</span></div></div></a><a href="/etf/SPYI:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI All Country World IM</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SPYI<span class="sc-65b86c41-0 dXpPBl">·</span>Global developed and emerging stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,5&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>220,53&nbsp;€</span></div></div></a><a href="/etf/VUCE:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard USD Corporate Bond </h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VUCE<span class="sc-65b86c41-0 dXpPBl">·</span>US coporate bonds<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,5&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>53,64&nbsp;€</span></div></div></a><a href="/etf/DBXN:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/xtrackers.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Xtrackers Eurozone Government Bond</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€DBXN<span class="sc-65b86c41-0 dXpPBl">·</span>European government bonds<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,4&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>216,86&nbsp;€</span></div></div></a><a href="/etf/VGEA:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard EUR Eurozone Government Bond</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VGEA<span class="sc-65b86c41-0 dXpPBl">·</span>Eurozone government bonds<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,3&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>23,38&nbsp;€</span></div></div></a><a href="/etf/SXRG:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI USA Small Cap ESG Enhanced</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SXRG<span class="sc-65b86c41-0 dXpPBl">·</span>US ESG small cap stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>2,1&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>461,08&nbsp;€</span></div></div></a><a href="/etf/VVSM:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vaneck.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">VanEck Semiconductor</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VVSM<span class="sc-65b86c41-0 dXpPBl">·</span>Fund tracking Semiconductor 10% Capped ESG Index<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,9&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>35,16&nbsp;€</span></div></div></a><a href="/etf/EXS3:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MDAX</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€EXS3<span class="sc-65b86c41-0 dXpPBl">·</span>Top 50 German mid cap stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,5&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>240,73&nbsp;€</span></div></div></a><a href="/etf/VNRA:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard FTSE North America</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VNRA<span class="sc-65b86c41-0 dXpPBl">·</span>US and CA stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,4&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>130,53&nbsp;€</span></div></div></a><a href="/etf/IS02:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares J.P. Morgan USD Emerging Markets Bond</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IS02<span class="sc-65b86c41-0 dXpPBl">·</span>Emerging markets government bonds<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,4&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>5,42&nbsp;€</span></div></div></a><a href="/etf/ECN:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/bnp.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">BNP Paribas Easy Low Carbon 100 Europe</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€ECN<span class="sc-65b86c41-0 dXpPBl">·</span>European ESG stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,4&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>263,78&nbsp;€</span></div></div></a><a href="/etf/VWCG:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard FTSE Developed Europe</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VWCG<span class="sc-65b86c41-0 dXpPBl">·</span>European stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,2&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>48,81&nbsp;€</span></div></div></a><a href="/etf/IBCK:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Edge S&amp;P 500 Minimum Volatility</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€IBCK<span class="sc-65b86c41-0 dXpPBl">·</span>500 Largest US stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,2&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>92,47&nbsp;€</span></div></div></a><a href="/etf/SLMA:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI EMU ESG Screened</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SLMA<span class="sc-65b86c41-0 dXpPBl">·</span>European Economic and Monetary Union ESG<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,1&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>9,07&nbsp;€</span></div></div></a><a href="/etf/SXR2:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares MSCI Canada</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SXR2<span class="sc-65b86c41-0 dXpPBl">·</span>Top Canadian stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,1&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>188,50&nbsp;€</span></div></div></a><a href="/etf/LWCR:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/amundi.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Amundi MSCI World ESG Climate Net Zero Ambition</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€LWCR<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>1,1&nbsp;Mrd&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>495,48&nbsp;€</span></div></div></a><a href="/etf/C40:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/amundi.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Amundi CAC 40</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€C40<span class="sc-65b86c41-0 dXpPBl">·</span>Top 40 French stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>999&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>136,71&nbsp;€</span></div></div></a><a href="/etf/2B78:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Healthcare Innovation</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€2B78<span class="sc-65b86c41-0 dXpPBl">·</span>Global healthcare stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>964&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>7,10&nbsp;€</span></div></div></a><a href="/etn/WBIT:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/instrument/logos/1ef3aa4c-5f26-6cf0-8eba-bb4404220dad.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">WisdomTree Physical Bitcoin</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WBIT<span class="sc-65b86c41-0 dXpPBl">·</span>Bitcoin<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>880&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>18,05&nbsp;€</span></div></div></a><a href="/etf/SPYA:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI EM Asia</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€SPYA<span class="sc-65b86c41-0 dXpPBl">·</span>Emerging Asian markets stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>841&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>73,80&nbsp;€</span></div></div></a><a href="/etf/C6E:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/amundi.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Amundi STOXX Europe 600 ESG</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€C6E<span class="sc-65b86c41-0 dXpPBl">·</span>European ESG stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>735&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>135,29&nbsp;€</span></div></div></a><a href="/etf/QDVF:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares S&amp;P 500 Energy Sector</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€QDVF<span class="sc-65b86c41-0 dXpPBl">·</span>US energy stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>724&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>8,11&nbsp;€</span></div></div></a><a href="/etf/WTCH:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI World Technology</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WTCH<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets technology stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>685&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>151,92&nbsp;€</span></div></div></a><a href="/etf/DAX:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/lyxor.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Amundi DAX III</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€DAX<span class="sc-65b86c41-0 dXpPBl">·</span>Top 40 German stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>658&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>209,10&nbsp;€</span></div></div></a><a href="/etf/VDTE:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vanguard.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Vanguard USD Treasury Bond EUR Hedged</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€VDTE<span class="sc-65b86c41-0 dXpPBl">·</span>US treasury bonds<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>564&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>25,16&nbsp;€</span></div></div></a><a href="/etf/GMVM:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/vaneck.jpg&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">VanEck Morningstar Wide Moat</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€GMVM<span class="sc-65b86c41-0 dXpPBl">·</span>Moat index tracker<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>407&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>54,56&nbsp;€</span></div></div></a><a href="/etf/C3M:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/amundi.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Amundi ETF Govies 0-6 Months Euro Investment Grade</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€C3M<span class="sc-65b86c41-0 dXpPBl">·</span>Euro short term government bonds<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>406&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>123,52&nbsp;€</span></div></div></a><a href="/etf/DFND:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/ishares.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">iShares Global Aerospace &amp; Defence</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€DFND<span class="sc-65b86c41-0 dXpPBl">·</span>Global aerospace &amp; defence stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>318&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>6,08&nbsp;€</span></div></div></a><a href="/etf/AUCO:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/lgim.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">L&amp;G Gold Mining</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€AUCO<span class="sc-65b86c41-0 dXpPBl">·</span>Gold mining<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>193&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>44,89&nbsp;€</span></div></div></a><a href="/etf/CNAA:PAR" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/lyxor.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Lyxor Hwabao WP MSCI China A</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€CNAA<span class="sc-65b86c41-0 dXpPBl">·</span>Chinese A stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>174&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>140,19&nbsp;€</span></div></div></a><a href="/etn/WETH:XETRA" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/instrument/logos/1eff8dba-fca4-674a-95d1-ada85c235962.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">Wisdomtree Physical Ethereum</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WETH<span class="sc-65b86c41-0 dXpPBl">·</span>Ethereum<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>96&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>18,73&nbsp;€</span></div></div></a><a href="/etf/WTEL:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI World Telecommunications</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WTEL<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets telecom stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>86&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>58,24&nbsp;€</span></div></div></a><a href="/etf/WIND:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI World Industrials</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WIND<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets industrial stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>79&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>66,52&nbsp;€</span></div></div></a><a href="/etf/WMAT:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI World Materials</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WMAT<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets materials stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>78&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>56,83&nbsp;€</span></div></div></a><a href="/etf/WUTI:AEX" class="sc-2fbe5bac-0 ldUJPw sc-e14b8ed-0 hKSByl"><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1"><div class="sc-c45d095c-0 jYBKTa"><span class="inline-flex flex-shrink-0 flex-grow-0 items-center justify-center overflow-hidden size-8 rounded-lg border-solid border-[rgb(var(--white-l100))] bg-[rgb(var(--white-l100))] border-4"><div class="h-full w-full bg-center bg-no-repeat bg-cover" style="background-image: url(&quot;https://lightyear.com/asset/image/etf/spdr.png&quot;);"></div></span><div class="sc-c45d095c-0 bXpdTu"><h2 class="text-title-small text-content [&amp;_em]:font-light [&amp;_strong_em]:font-light">SPDR MSCI World Utilities</h2><div class="text-body-small-bold text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;">€WUTI<span class="sc-65b86c41-0 dXpPBl">·</span>Developed markets utilities stocks<span class="sc-65b86c41-0 dXpPBl">·</span>Acc</div></div></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>37&nbsp;M&nbsp;€</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>0,00%</span></div></div><div class="table-cell align-middle [&amp;:not(:first-child)]:pl-2 max-tablet:[&amp;:not(:first-child)]:pl-1 [&amp;:not(:last-child)]:pr-2 max-tablet:[&amp;:not(:last-child)]:pr-1 text-right"><div class="text-caption-medium text-[var(--text-color)] [&amp;_a]:font-medium [&amp;_em]:font-light [&amp;_ol+p]:mt-5 [&amp;_ol]:m-0 [&amp;_ol]:list-decimal [&amp;_ol]:pl-6 [&amp;_ol_li:not(:first-child)]:mt-4 [&amp;_ol_li]:relative [&amp;_p+ol]:mt-5 [&amp;_p+p]:mt-5 [&amp;_p+ul]:mt-5 [&amp;_strong]:font-semibold [&amp;_strong_a]:font-semibold [&amp;_strong_em]:font-light [&amp;_ul+p]:mt-5 [&amp;_ul]:m-0 [&amp;_ul]:list-disc [&amp;_ul]:pl-6 [&amp;_ul_li:not(:first-child)]:mt-4 [&amp;_ul_li]:relative" style="--text-color: #4a537d;"><span>50,26&nbsp;€</span></div></div></a></div>
-    '''
-    href_values = extract_href(html)
-    cleaned_values = [value.replace('/etf/', '') for value in href_values]
-    print(len(cleaned_values))
-
-    key_value_pairs = {}
-    for value in href_values:
-        cleaned_value = value.replace('/etf/', '')  # Remove the '/etf/' prefix
-        key, val = cleaned_value.split(':')  # Split at ':'
-        key_value_pairs[key] = val
-
-    sorted_dict = dict(sorted(key_value_pairs.items()))
+from universe import main
 
-    # Write to a JSON file
-    with open('data/lightyear_raw_etf_data.json', 'w') as json_file:
-        json.dump(sorted_dict, json_file, indent=4)
-
-    print("JSON file 'etf_data.json' created successfully!")
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main(["data/listings/lightyear_etfs.html", "--apply"]))
@@ -0,0 +1,342 @@
+"""Vectorized indicators over an aligned date x symbol panel"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+RSI_WINDOW = 14
+CCI_WINDOW = 25
+CCI_CONSTANT = 0.015
+MA_WINDOWS = (9, 14, 50, 250)
+
+INDICATOR_COLUMNS = ["pct_change", "cci_25", "rsi_14"] + [
+    f"ma_{window}" for window in MA_WINDOWS
+]
+
+# Upper bound of the temporary window array built for the CCI mean deviation.
+_MAX_WINDOW_BYTES = 64 * 1024 * 1024
+
+
+class Panel:
+    """
+    Aligned ``date x symbol`` arrays of a set of fields.
+
+    ``fields[name]`` is a float64 array of shape ``(len(dates), len(symbols))``
+    holding NaN wherever a symbol has no row for a date.
+    """
+
+    def __init__(self, dates: pd.DatetimeIndex, symbols: List[str], fields: Dict):
+        self.dates = dates
+        self.symbols = list(symbols)
+        self.fields = fields
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame], columns: List[str]):
+        """Align per-symbol frames indexed by date into one panel."""
+        frames = {symbol: df for symbol, df in frames.items() if not df.empty}
+        symbols = list(frames)
+        if not symbols:
+            return cls(pd.DatetimeIndex([]), [], {c: np.empty((0, 0)) for c in columns})
+        dates = pd.DatetimeIndex(
+            np.unique(np.concatenate([df.index.values for df in frames.values()]))
+        )
+        fields = {
+            column: np.full((len(dates), len(symbols)), np.nan) for column in columns
+        }
+        for position, df in enumerate(frames.values()):
+            rows = dates.get_indexer(df.index)
+            for column in columns:
+                fields[column][rows, position] = df[column].to_numpy(dtype=float)
+        return cls(dates, symbols, fields)
+
+    @classmethod
+    def from_long(
+        cls,
+        df: pd.DataFrame,
+        columns: List[str],
+        symbol_column: str = "symbol",
+        time_column: str = "date",
+    ):
+        """Align a long frame with one row per symbol and date into one panel."""
+        codes, symbols = pd.factorize(df[symbol_column], sort=True)
+        times = df[time_column].to_numpy()
+        dates = pd.DatetimeIndex(np.unique(times))
+        rows = dates.get_indexer(times)
+        fields = {}
+        for column in columns:
+            values = np.full((len(dates), len(symbols)), np.nan)
+            values[rows, codes] = df[column].to_numpy(dtype=float, na_value=np.nan)
+            fields[column] = values
+        return cls(dates, [str(symbol) for symbol in symbols], fields)
+
+    def to_frames(self, columns: List[str], index_name: str = "date") -> Dict:
+        """Split the panel back into per-symbol frames over each symbol's own rows."""
+        present = ~np.isnan(self.fields["close"])
+        frames = {}
+        for position, symbol in enumerate(self.symbols):
+            rows = present[:, position]
+            df = pd.DataFrame(
+                {column: self.fields[column][rows, position] for column in columns},
+                index=self.dates[rows],
+            )
+            df.index.name = index_name
+            frames[symbol] = df
+        return frames
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean along the date axis, NaN until ``window`` valid values
+    are available (same as ``Series.rolling(window).mean()``).
+    """
+    result = np.full(values.shape, np.nan)
+    if values.shape[0] < window:
+        return result
+    valid = ~np.isnan(values)
+    # Centre every column before the cumulative sum to limit cancellation.
+    with np.errstate(all="ignore"):
+        offset = np.nan_to_num(np.nanmean(values, axis=0))
+    centred = np.where(valid, values - offset, 0.0)
+    zero = np.zeros((1,) + values.shape[1:])
+    sums = np.concatenate([zero, np.cumsum(centred, axis=0)])
+    counts = np.concatenate([zero, np.cumsum(valid, axis=0)])
+    window_sums = sums[window:] - sums[:-window]
+    window_counts = counts[window:] - counts[:-window]
+    result[window - 1 :] = np.where(
+        window_counts == window, window_sums / window + offset, np.nan
+    )
+    return result
+
+
+def wilder_average(values: np.ndarray, window: int):
+    """
+    Wilder smoothing (``ewm(alpha=1/window, adjust=False)``) along the date
+    axis. Each column starts at its first non-NaN value; NaN values keep the
+    previous average. Returns the running averages and observation counts.
+    """
+    alpha = 1.0 / window
+    averages = np.full(values.shape, np.nan)
+    counts = np.zeros(values.shape, dtype=np.int64)
+    average = np.full(values.shape[1:], np.nan)
+    count = np.zeros(values.shape[1:], dtype=np.int64)
+    for row in range(values.shape[0]):
+        value = values[row]
+        valid = ~np.isnan(value)
+        started = ~np.isnan(average)
+        average = np.where(
+            valid & started, (1 - alpha) * average + alpha * value, average
+        )
+        average = np.where(valid & ~started, value, average)
+        count += valid
+        averages[row] = average
+        counts[row] = count
+    return averages, counts
+
+
+def wilder_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Wilder smoothing with ``min_periods=window``."""
+    averages, counts = wilder_average(values, window)
+    return np.where(counts >= window, averages, np.nan)
+
+
+def pct_change(close: np.ndarray) -> np.ndarray:
+    """Percentage change of close against the previous date."""
+    result = np.full(close.shape, np.nan)
+    with np.errstate(all="ignore"):
+        result[1:] = (close[1:] / close[:-1] - 1) * 100
+    return result
+
+
+def rsi_averages(close: np.ndarray, window: int = RSI_WINDOW):
+    """Wilder averages of up and down moves and their observation counts."""
+    diff = np.full(close.shape, np.nan)
+    diff[1:] = close[1:] - close[:-1]
+    valid = ~np.isnan(close)
+    # The first diff of each series is NaN and counts as no move.
+    up = np.where(valid, np.where(diff > 0, diff, 0.0), np.nan)
+    down = np.where(valid, np.where(diff < 0, -diff, 0.0), np.nan)
+    average_up, counts = wilder_average(up, window)
+    average_down, _ = wilder_average(down, window)
+    return average_up, average_down, counts
+
+
+def rsi_from_averages(average_up, average_down):
+    with np.errstate(all="ignore"):
+        result = 100 - 100 / (1 + average_up / average_down)
+    return np.where(average_down == 0, 100.0, result)
+
+
+def rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    """RSI with Wilder smoothing, as ``ta.momentum.RSIIndicator``."""
+    average_up, average_down, counts = rsi_averages(close, window)
+    ready = counts >= window
+    return rsi_from_averages(
+        np.where(ready, average_up, np.nan), np.where(ready, average_down, np.nan)
+    )
+
+
+def mean_deviation(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean absolute deviation around the window mean."""
+    result = np.full(values.shape, np.nan)
+    if values.shape[0] < window:
+        return result
+    per_column = values.shape[0] * window * values.itemsize
+    chunk = max(1, _MAX_WINDOW_BYTES // max(per_column, 1))
+    for first in range(0, values.shape[1], chunk):
+        columns = slice(first, first + chunk)
+        windows = sliding_window_view(values[:, columns], window, axis=0)
+        means = windows.mean(axis=-1, keepdims=True)
+        result[window - 1 :, columns] = np.abs(windows - means).mean(axis=-1)
+    return result
+
+
+def cci(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    window: int = CCI_WINDOW,
+    constant: float = CCI_CONSTANT,
+) -> np.ndarray:
+    """Commodity Channel Index, as ``ta.trend.CCIIndicator``."""
+    typical_price = (high + low + close) / 3.0
+    with np.errstate(all="ignore"):
+        return (typical_price - rolling_mean(typical_price, window)) / (
+            constant * mean_deviation(typical_price, window)
+        )
+
+
+def compute_indicators(panel: Panel) -> Panel:
+    """
+    Add the analyzed indicator set to a panel with close/high/low fields.
+
+    The running RSI averages are kept as ``rsi_up``, ``rsi_down`` and
+    ``rsi_count`` so ``IndicatorState`` can continue from any row.
+    """
+    close = panel.fields["close"]
+    panel.fields["pct_change"] = pct_change(close)
+    panel.fields["cci_25"] = cci(panel.fields["high"], panel.fields["low"], close)
+    average_up, average_down, counts = rsi_averages(close)
+    ready = counts >= RSI_WINDOW
+    panel.fields["rsi_14"] = rsi_from_averages(
+        np.where(ready, average_up, np.nan), np.where(ready, average_down, np.nan)
+    )
+    panel.fields["rsi_up"] = average_up
+    panel.fields["rsi_down"] = average_down
+    panel.fields["rsi_count"] = counts
+    for window in MA_WINDOWS:
+        panel.fields[f"ma_{window}"] = rolling_mean(close, window)
+    return panel
+
+
+class IndicatorState:
+    """
+    Running indicator state of one symbol after its bar of ``date``.
+
+    Holds the last bar, the close and typical price buffers of the rolling
+    windows and the RSI averages, so new daily bars can be analyzed in O(1)
+    each instead of recomputing the whole history. ``to_dict``/``from_dict``
+    give a JSON-friendly form for persisting it between runs.
+    """
+
+    close_buffer = max(MA_WINDOWS) - 1
+    typical_price_buffer = CCI_WINDOW - 1
+
+    def __init__(
+        self,
+        date,
+        close,
+        high,
+        low,
+        closes,
+        typical_prices,
+        rsi_up,
+        rsi_down,
+        rsi_count,
+    ):
+        self.date = pd.Timestamp(date)
+        self.close = close
+        self.high = high
+        self.low = low
+        self.closes = list(closes)[-self.close_buffer :]
+        self.typical_prices = list(typical_prices)[-self.typical_price_buffer :]
+        self.rsi_up = rsi_up
+        self.rsi_down = rsi_down
+        self.rsi_count = int(rsi_count)
+
+    @classmethod
+    def from_panel(cls, panel: Panel, position: int, row: int):
+        """State of ``panel.symbols[position]`` after its bar at ``row``."""
+        fields = panel.fields
+        close = fields["close"][: row + 1, position]
+        valid = ~np.isnan(close)
+        typical_price = (
+            fields["high"][: row + 1, position]
+            + fields["low"][: row + 1, position]
+            + close
+        ) / 3.0
+        return cls(
+            date=panel.dates[row],
+            close=float(fields["close"][row, position]),
+            high=float(fields["high"][row, position]),
+            low=float(fields["low"][row, position]),
+            closes=close[valid][-cls.close_buffer :].tolist(),
+            typical_prices=typical_price[valid][-cls.typical_price_buffer :].tolist(),
+            rsi_up=float(fields["rsi_up"][row, position]),
+            rsi_down=float(fields["rsi_down"][row, position]),
+            rsi_count=int(fields["rsi_count"][row, position]),
+        )
+
+    def update(self, date, close, high, low) -> dict:
+        """Advance the state by one bar and return its indicator values."""
+        alpha = 1.0 / RSI_WINDOW
+        diff = close - self.close
+        up, down = max(diff, 0.0), max(-diff, 0.0)
+        self.rsi_up = (1 - alpha) * self.rsi_up + alpha * up
+        self.rsi_down = (1 - alpha) * self.rsi_down + alpha * down
+        self.rsi_count += 1
+
+        row = {"close": close, "pct_change": (close / self.close - 1) * 100}
+        typical_prices = self.typical_prices + [(high + low + close) / 3.0]
+        if len(typical_prices) >= CCI_WINDOW:
+            window = np.array(typical_prices[-CCI_WINDOW:])
+            deviation = np.abs(window - window.mean()).mean()
+            with np.errstate(all="ignore"):
+                row["cci_25"] = (window[-1] - window.mean()) / (
+                    CCI_CONSTANT * deviation
+                )
+        else:
+            row["cci_25"] = np.nan
+        if self.rsi_count >= RSI_WINDOW:
+            row["rsi_14"] = float(rsi_from_averages(self.rsi_up, self.rsi_down))
+        else:
+            row["rsi_14"] = np.nan
+        closes = self.closes + [close]
+        for window in MA_WINDOWS:
+            row[f"ma_{window}"] = (
+                float(np.mean(closes[-window:])) if len(closes) >= window else np.nan
+            )
+
+        self.date = pd.Timestamp(date)
+        self.close, self.high, self.low = close, high, low
+        self.closes = closes[-self.close_buffer :]
+        self.typical_prices = typical_prices[-self.typical_price_buffer :]
+        return row
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.date.strftime("%Y-%m-%d"),
+            "close": self.close,
+            "high": self.high,
+            "low": self.low,
+            "closes": self.closes,
+            "typical_prices": self.typical_prices,
+            "rsi_up": self.rsi_up,
+            "rsi_down": self.rsi_down,
+            "rsi_count": self.rsi_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(**data)
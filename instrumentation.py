@@ -0,0 +1,206 @@
+"""Per-stage timing of the pipeline, logged as JSON
+
+Instrumented code wraps each stage of a ticker::
+
+    with stage("fetch", ticker) as record:
+        df = fetch(ticker)
+        record["rows"] = len(df)
+
+Every finished stage becomes a record with its name, ticker, wall time in
+seconds and the extra fields set on it. Records are kept in memory for the
+app and, with a log path, appended as JSON lines. Instrumentation is off by
+default; ``stage`` then returns a shared no-op context, so instrumented code
+only pays a function call. Set ``LIGHTYEAR_TIMINGS`` to a JSON lines path to
+enable it in every process.
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional
+import json
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+
+logger = logging.getLogger("lightyear.timings")
+
+MAX_RECORDS = 20_000
+# Seconds after which a subscriber that stopped renewing (a closed app
+# session) no longer keeps recording on.
+SUBSCRIPTION_TTL = 3600.0
+
+
+class _NullRecord:
+    """Stands in for a record while instrumentation is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setitem__(self, key, value):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+_NULL_RECORD = _NullRecord()
+
+
+class StageRecord(dict):
+    """Timing record of one stage, filled in when its ``with`` block exits."""
+
+    def __init__(
+        self, recorder: "Recorder", name: str, ticker: Optional[str], **fields
+    ):
+        super().__init__(stage=name, ticker=ticker, **fields)
+        self.recorder = recorder
+
+    def __enter__(self):
+        self["started_at"] = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self["seconds"] = time.perf_counter() - self._started
+        if exc_type is not None:
+            self["error"] = exc_type.__name__
+        self.recorder.add(dict(self))
+        return False
+
+
+class Recorder:
+    """
+    Collects stage records in a bounded in-memory buffer and optionally
+    appends them as JSON lines to ``log_path``.
+    """
+
+    def __init__(self, log_path: Optional[str] = None, max_records: int = MAX_RECORDS):
+        self.log_path = log_path
+        self.records = deque(maxlen=max_records)
+        self.lock = threading.Lock()
+
+    def add(self, record: dict):
+        self.records.append(record)
+        if self.log_path or logger.isEnabledFor(logging.DEBUG):
+            line = json.dumps(record, default=str)
+            logger.debug(line)
+            if self.log_path:
+                with self.lock, open(self.log_path, "a") as file:
+                    file.write(line + "\n")
+
+    def extend(self, records: Iterable[dict]):
+        for record in records:
+            self.add(record)
+
+    def drain(self) -> List[dict]:
+        """Return the buffered records and empty the buffer."""
+        with self.lock:
+            records = list(self.records)
+            self.records.clear()
+        return records
+
+    def clear(self):
+        self.records.clear()
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame(list(self.records))
+
+    def summary(self, by: str = "stage") -> pd.DataFrame:
+        """Count, total, mean and max seconds per ``by`` value, slowest first."""
+        df = self.frame()
+        if df.empty:
+            return df
+        summary = df.groupby(by)["seconds"].agg(["count", "sum", "mean", "max"])
+        summary = summary.rename(columns={"sum": "total"})
+        return summary.sort_values("total", ascending=False)
+
+    def slowest(self, n: int = 10) -> pd.DataFrame:
+        """The ``n`` slowest single stage records."""
+        df = self.frame()
+        if df.empty:
+            return df
+        return df.nlargest(n, "seconds").reset_index(drop=True)
+
+
+_recorder: Optional[Recorder] = None
+
+
+def enable(log_path: Optional[str] = None, max_records: int = MAX_RECORDS) -> Recorder:
+    """Start recording (if not already) and return the active recorder."""
+    global _recorder
+    if _recorder is None:
+        _recorder = Recorder(log_path, max_records)
+    elif log_path is not None:
+        _recorder.log_path = log_path
+    return _recorder
+
+
+def disable():
+    global _recorder
+    _recorder = None
+
+
+_subscribers: Dict[Hashable, float] = {}
+_subscribers_lock = threading.Lock()
+# Whether the active recorder was started for the subscribers (and not,
+# e.g., by LIGHTYEAR_TIMINGS), so the last one leaving may stop it.
+_subscribed_recorder = False
+
+
+def subscribe(key: Hashable, wanted: bool, clock=time.monotonic) -> Optional[Recorder]:
+    """
+    Renew (``wanted``) or drop the interest of ``key``, e.g. an app session,
+    in recording. Recording runs while at least one subscriber wants it, so
+    one session switching it off does not stop it for the others.
+    Subscribers not renewed for ``SUBSCRIPTION_TTL`` seconds are dropped.
+    Returns the active recorder.
+    """
+    global _subscribed_recorder
+    now = clock()
+    with _subscribers_lock:
+        if wanted:
+            _subscribers[key] = now
+        else:
+            _subscribers.pop(key, None)
+        for other, seen in list(_subscribers.items()):
+            if now - seen > SUBSCRIPTION_TTL:
+                del _subscribers[other]
+        if _subscribers:
+            if _recorder is None:
+                _subscribed_recorder = True
+            return enable()
+        if _subscribed_recorder:
+            _subscribed_recorder = False
+            disable()
+        return _recorder
+
+
+def recorder() -> Optional[Recorder]:
+    """The active recorder, or None while instrumentation is disabled."""
+    return _recorder
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def stage(name: str, ticker: Optional[str] = None, **fields):
+    """Context timing one stage; a no-op while instrumentation is disabled."""
+    if _recorder is None:
+        return _NULL_RECORD
+    return StageRecord(_recorder, name, ticker, **fields)
+
+
+def merge(records: Iterable[dict]):
+    """Add records collected in another process to the active recorder."""
+    if _recorder is not None:
+        _recorder.extend(records)
+
+
+if os.environ.get("LIGHTYEAR_TIMINGS"):
+    enable(os.environ["LIGHTYEAR_TIMINGS"])
@@ -0,0 +1,137 @@
+"""In-memory cache of the analyzed universe keyed on file fingerprints"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+import os
+import threading
+
+import pandas as pd
+
+from panel_schema import compact
+from storage import open_store
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def folder_fingerprint(folder: str) -> Tuple:
+    """
+    Fingerprint of every file below ``folder``: relative path, mtime and size.
+
+    Any write, delete or new file changes the fingerprint, so it can key a
+    cache that never has to be invalidated by hand.
+    """
+    entries = []
+    for root, _, files in os.walk(folder):
+        for filename in files:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append(
+                (os.path.relpath(path, folder), stat.st_mtime_ns, stat.st_size)
+            )
+    return tuple(sorted(entries))
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+class PanelCache:
+    """
+    Thread-safe LRU cache of data frames bounded by their memory size.
+
+    Entries are looked up by ``(name, fingerprint)``; when the fingerprint of
+    ``name`` changes, its old entry is replaced. Cached frames are shared, so
+    callers must not modify them in place. Other values can be cached by
+    passing their ``sizeof``.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sizeof: Callable[[Any], int] = frame_bytes,
+    ):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+    def get(
+        self, name: Hashable, fingerprint: Hashable, loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None and entry[0] == fingerprint:
+                self.entries.move_to_end(name)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        df = loader()
+        self.put(name, fingerprint, df)
+        return df
+
+    def put(self, name: Hashable, fingerprint: Hashable, df: pd.DataFrame):
+        size = self.sizeof(df)
+        with self.lock:
+            self.entries.pop(name, None)
+            self.sizes.pop(name, None)
+            if size > self.max_bytes:
+                return
+            self.entries[name] = (fingerprint, df)
+            self.sizes[name] = size
+            while self.total_bytes > self.max_bytes:
+                evicted, _ = self.entries.popitem(last=False)
+                self.sizes.pop(evicted)
+
+    def invalidate(self, folder: Optional[str] = None):
+        """Drop the entries of ``folder``, or every entry."""
+        with self.lock:
+            for name in list(self.entries):
+                if folder is None or name[0] == folder:
+                    self.entries.pop(name)
+                    self.sizes.pop(name)
+
+
+def load_analyzed_panel(
+    analyzed_folder: str,
+    cache: Optional[PanelCache] = None,
+    start=None,
+    end=None,
+    symbols=None,
+    float32: bool = False,
+) -> pd.DataFrame:
+    """
+    Analyzed universe with a 'symbol' column, filtered to ``start``/``end``
+    (inclusive) and ``symbols``, in the compact schema (see ``panel_schema``).
+
+    With a cache the whole universe is loaded once per fingerprint of the
+    folder and every filter runs on the in-memory frame.
+    """
+    store = open_store(analyzed_folder, "date")
+    if cache is None:
+        df = store.read_all(start=start, end=end, symbols=symbols)
+        return compact(df, float32=float32)
+
+    name = (analyzed_folder, "analyzed", float32)
+    panel = cache.get(
+        name,
+        folder_fingerprint(analyzed_folder),
+        lambda: compact(store.read_all(), float32=float32),
+    )
+    mask = pd.Series(True, index=panel.index)
+    if start is not None:
+        mask &= panel["date"] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= panel["date"] <= pd.Timestamp(end)
+    if symbols is not None:
+        mask &= panel["symbol"].isin(symbols)
+    return panel[mask].reset_index(drop=True)
@@ -0,0 +1,44 @@
+"""Compact in-memory schema of the analyzed panel
+
+Every loader returns the analyzed universe with the same dtypes:
+
+- ``symbol``: categorical with the symbols sorted, so filters and sorts
+  work on small integer codes
+- ``date``: ``datetime64[ns]``, formatted only when it is displayed
+- ``close`` and the indicators: float64, or float32 with ``float32=True``
+- ``criteria``: categorical of the rule set's labels (see ``screening``)
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from indicators import INDICATOR_COLUMNS
+
+VALUE_COLUMNS = ["close"] + INDICATOR_COLUMNS
+DATE_FORMAT = "YYYY-MM-DD"
+
+
+def symbol_dtype(symbols: Iterable[str]) -> pd.CategoricalDtype:
+    return pd.CategoricalDtype(sorted({str(symbol) for symbol in symbols}))
+
+
+def criteria_dtype(labels: Iterable[str]) -> pd.CategoricalDtype:
+    return pd.CategoricalDtype(list(dict.fromkeys(labels)))
+
+
+def compact(df: pd.DataFrame, float32: bool = False) -> pd.DataFrame:
+    """``df`` converted to the compact schema; columns already in it are kept."""
+    df = df.copy(deep=False)
+    if "symbol" in df.columns and not isinstance(
+        df["symbol"].dtype, pd.CategoricalDtype
+    ):
+        df["symbol"] = df["symbol"].astype(symbol_dtype(df["symbol"].dropna().unique()))
+    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"])
+    value_dtype = np.float32 if float32 else np.float64
+    for column in VALUE_COLUMNS:
+        if column in df.columns and df[column].dtype != value_dtype:
+            df[column] = df[column].astype(value_dtype)
+    return df
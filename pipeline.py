@@ -0,0 +1,128 @@
+"""Run the extract and analyze stages headless from the command line
+
+Usage:
+    python pipeline.py extract --incremental
+    python pipeline.py analyze --workers 4
+    python pipeline.py run --incremental --workers 4
+    python pipeline.py run --timings timings.jsonl
+    python pipeline.py analyze --timeframes 1h,4h,1w
+    python pipeline.py run --alert data/alerts.jsonl --alert https://example.com/hook
+"""
+
+from datetime import datetime, timedelta
+import argparse
+import json
+import os
+import sys
+
+from alerts import Alerter, make_sink
+from extractor import Extractor
+import instrumentation
+from screening import RULE_SETS
+from timeframes import TIMEFRAMES
+from transform import TickerAnalyzer
+
+TICKERS_FILE = "data/lightyear_yfinance_etf_data.json"
+RAW_FOLDER = "data/tickers"
+ANALYZED_FOLDER = "data/analyzed"
+
+
+def load_tickers(tickers_file=TICKERS_FILE):
+    with open(tickers_file, "r") as file:
+        return list(json.load(file).values())
+
+
+def extract(tickers, args):
+    extractor = Extractor(
+        tickers=tickers,
+        start_date=args.start_date,
+        end_date=datetime.now().strftime("%Y-%m-%d"),
+        target_folder=args.raw_folder,
+        incremental=args.incremental,
+        max_workers=args.fetch_workers,
+    )
+    extractor.extract_data()
+    return extractor.failed
+
+
+def analyze(tickers, args):
+    analyzer = TickerAnalyzer(
+        raw_folder=args.raw_folder,
+        analyzed_folder=args.analyzed_folder,
+        timeframes=args.timeframes,
+    )
+
+    def progress(done, total, ticker, error):
+        status = f"failed: {error}" if error else "done"
+        print(f"[{done}/{total}] {ticker} {status}")
+
+    report = analyzer.analyze_many(
+        tickers, workers=args.workers, rebuild=args.rebuild, progress=progress
+    )
+    return report.failures
+
+
+def alert(args):
+    alerter = Alerter(
+        [make_sink(spec) for spec in args.alert], RULE_SETS[args.rule_set]()
+    )
+    alerts = alerter.run(args.analyzed_folder)
+    print(f"{len(alerts)} alerts")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("stage", choices=["extract", "analyze", "run"])
+    parser.add_argument("--tickers-file", default=TICKERS_FILE)
+    parser.add_argument("--raw-folder", default=RAW_FOLDER)
+    parser.add_argument("--analyzed-folder", default=ANALYZED_FOLDER)
+    parser.add_argument(
+        "--start-date",
+        default=(datetime.today() - timedelta(days=729)).strftime("%Y-%m-%d"),
+    )
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("--timings", help="append per-stage timings as JSON lines")
+    parser.add_argument(
+        "--timeframes",
+        type=lambda value: [item for item in value.split(",") if item],
+        default=[],
+        help=f"also analyze these timeframes ({', '.join(TIMEFRAMES)})",
+    )
+    parser.add_argument(
+        "--alert",
+        action="append",
+        default=[],
+        help="after analyzing, send signal changes to stdout, a webhook URL "
+        "or a JSONL file (repeatable)",
+    )
+    parser.add_argument(
+        "--rule-set", choices=list(RULE_SETS), default="RSI/CCI thresholds"
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.timeframes) - set(TIMEFRAMES))
+    if unknown:
+        parser.error(f"unknown timeframes: {', '.join(unknown)}")
+    if args.timings:
+        instrumentation.enable(args.timings)
+
+    tickers = load_tickers(args.tickers_file)
+    failures = {}
+    if args.stage in ("extract", "run"):
+        failures.update(extract(tickers, args))
+    if args.stage in ("analyze", "run"):
+        failures.update(analyze(tickers, args))
+        if args.alert:
+            alert(args)
+
+    for ticker, error in sorted(failures.items()):
+        print(f"{ticker}: {error}")
+    if args.timings:
+        print(instrumentation.recorder().summary("stage").to_string())
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
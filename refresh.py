@@ -0,0 +1,385 @@
+"""Refresh the data headless after each exchange closes
+
+Usage:
+    python refresh.py            # run forever, after every venue's close
+    python refresh.py --once     # refresh whatever is due now and exit
+
+Every refresh extracts and analyzes only the tickers whose venue has closed
+a session since they were last fetched. Trading hours and holidays come from
+``data/exchanges.json``. The work happens in a staging copy of the latest
+snapshot, which is published by atomically replacing the ``CURRENT``
+pointer, so readers only ever see finished snapshots.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time as clock_time, timedelta, timezone
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import pandas as pd
+
+from alerts import Alerter, make_sink
+from extractor import MANIFEST_FILE, Extractor
+from pipeline import TICKERS_FILE, load_tickers
+from transform import TickerAnalyzer
+
+CALENDARS_FILE = "data/exchanges.json"
+SNAPSHOT_ROOT = "data/snapshots"
+POINTER_FILE = "CURRENT"
+FETCHED_FILE = "fetched.json"
+RAW = "tickers"
+ANALYZED = "analyzed"
+# Files replaced atomically by the stores can be shared between snapshots.
+LINKED_EXTENSIONS = (".parquet", ".csv", ".arrow")
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """Regular trading hours and holidays of a venue in its local time."""
+
+    name: str
+    timezone: str
+    open: clock_time
+    close: clock_time
+    holidays: FrozenSet[date] = frozenset()
+    suffixes: Tuple[str, ...] = ()
+
+    def trades_on(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def session_close(self, day: date) -> pd.Timestamp:
+        close = pd.Timestamp(datetime.combine(day, self.close))
+        return close.tz_localize(self.timezone)
+
+    def last_close(self, now: pd.Timestamp) -> Optional[pd.Timestamp]:
+        """Close of the latest session that ended at or before ``now``."""
+        day = now.tz_convert(self.timezone).date()
+        for _ in range(30):
+            if self.trades_on(day) and self.session_close(day) <= now:
+                return self.session_close(day)
+            day -= timedelta(days=1)
+        return None
+
+    def next_close(self, now: pd.Timestamp) -> pd.Timestamp:
+        """Close of the next session ending after ``now``."""
+        day = now.tz_convert(self.timezone).date()
+        while not (self.trades_on(day) and self.session_close(day) > now):
+            day += timedelta(days=1)
+        return self.session_close(day)
+
+
+def load_calendars(path: str = CALENDARS_FILE) -> Dict[str, Exchange]:
+    with open(path, "r") as file:
+        config = json.load(file)
+    return {
+        name: Exchange(
+            name=name,
+            timezone=venue["timezone"],
+            open=clock_time.fromisoformat(venue["open"]),
+            close=clock_time.fromisoformat(venue["close"]),
+            holidays=frozenset(
+                date.fromisoformat(day) for day in venue.get("holidays", [])
+            ),
+            suffixes=tuple(venue.get("suffixes", [])),
+        )
+        for name, venue in config.items()
+    }
+
+
+def exchange_of(ticker: str, calendars: Dict[str, Exchange]) -> Optional[Exchange]:
+    """Venue of a Yahoo ticker by its suffix (e.g. '.DE'), None if unknown."""
+    for exchange in calendars.values():
+        if any(ticker.endswith(suffix) for suffix in exchange.suffixes):
+            return exchange
+    return None
+
+
+def _link_or_copy(source: str, target: str):
+    if source.endswith(LINKED_EXTENSIONS):
+        try:
+            os.link(source, target)
+            return target
+        except OSError:
+            pass
+    return shutil.copy2(source, target)
+
+
+class SnapshotStore:
+    """
+    Published snapshots of the raw and analyzed folders below ``root``.
+
+    ``CURRENT`` holds the name of the latest snapshot and is replaced
+    atomically. A staging snapshot starts as a copy of the current one
+    in which the data files are hard links: the stores replace files
+    instead of writing into them, so the published copy never changes.
+    """
+
+    def __init__(self, root: str = SNAPSHOT_ROOT, keep: int = 3):
+        self.root = root
+        self.keep = keep
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def pointer(self) -> str:
+        return os.path.join(self.root, POINTER_FILE)
+
+    def current(self) -> Optional[str]:
+        """Folder of the published snapshot, or None before the first one."""
+        try:
+            with open(self.pointer, "r") as file:
+                name = file.read().strip()
+        except FileNotFoundError:
+            return None
+        return os.path.join(self.root, name) if name else None
+
+    def stage(self) -> str:
+        """Create a staging snapshot from the current one."""
+        name = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        staging = os.path.join(self.root, f".staging-{name}")
+        current = self.current()
+        if current is not None and os.path.isdir(current):
+            shutil.copytree(current, staging, copy_function=_link_or_copy)
+        else:
+            os.makedirs(staging)
+        return staging
+
+    def publish(self, staging: str) -> str:
+        """Make a staging snapshot the current one and prune old snapshots."""
+        name = os.path.basename(staging).replace(".staging-", "")
+        snapshot = os.path.join(self.root, name)
+        os.replace(staging, snapshot)
+        tmp_pointer = f"{self.pointer}.tmp-{os.getpid()}"
+        with open(tmp_pointer, "w") as file:
+            file.write(name)
+        os.replace(tmp_pointer, self.pointer)
+        self.prune()
+        return snapshot
+
+    def discard(self, staging: str):
+        shutil.rmtree(staging, ignore_errors=True)
+
+    def snapshots(self) -> List[str]:
+        return sorted(
+            name
+            for name in os.listdir(self.root)
+            if not name.startswith(".")
+            and name != POINTER_FILE
+            and os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def prune(self):
+        """Delete all but the ``keep`` newest snapshots (never the current one)."""
+        current = self.current()
+        for name in self.snapshots()[: -self.keep or None]:
+            path = os.path.join(self.root, name)
+            if path != current:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def current_folders(root: str = SNAPSHOT_ROOT) -> Optional[Tuple[str, str]]:
+    """Raw and analyzed folder of the published snapshot, if there is one."""
+    if not os.path.exists(os.path.join(root, POINTER_FILE)):
+        return None
+    current = SnapshotStore(root).current()
+    if current is None:
+        return None
+    return os.path.join(current, RAW), os.path.join(current, ANALYZED)
+
+
+def _utc_now() -> pd.Timestamp:
+    return pd.Timestamp.now(tz="UTC")
+
+
+class Refresher:
+    """
+    Runs extract -> analyze for the tickers whose venue traded since their
+    last fetch, ``delay`` after each session close (giving the data source
+    time to publish the last bars).
+
+    Tickers of unknown venues are refreshed on every run. ``fetch`` and
+    ``clock`` can be injected to run offline. With an ``alerter`` the
+    signal changes of the new bars are sent before the snapshot is
+    published; a failed alert is retried by the next refresh.
+    """
+
+    def __init__(
+        self,
+        tickers: List[str],
+        calendars: Dict[str, Exchange],
+        snapshots: SnapshotStore,
+        start_date: str,
+        delay: timedelta = timedelta(minutes=20),
+        fetch: Optional[Callable] = None,
+        workers: Optional[int] = None,
+        clock: Callable[[], pd.Timestamp] = _utc_now,
+        sleep: Callable[[float], None] = time.sleep,
+        alerter: Optional[Alerter] = None,
+    ):
+        self.tickers = tickers
+        self.calendars = calendars
+        self.snapshots = snapshots
+        self.start_date = start_date
+        self.delay = delay
+        self.fetch = fetch
+        self.workers = workers
+        self.clock = clock
+        self.sleep = sleep
+        self.alerter = alerter
+
+    def load_fetched(self) -> Dict[str, str]:
+        """
+        When every ticker of the current snapshot was last fetched, by the
+        refresher's clock, falling back to the extractor's manifest.
+        """
+        current = self.snapshots.current()
+        if current is None:
+            return {}
+        fetched = {}
+        manifest_path = os.path.join(current, RAW, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as file:
+                manifest = json.load(file)
+            fetched = {
+                ticker: entry["updated_at"]
+                for ticker, entry in manifest.items()
+                if entry.get("updated_at")
+            }
+        fetched_path = os.path.join(current, FETCHED_FILE)
+        if os.path.exists(fetched_path):
+            with open(fetched_path, "r") as file:
+                fetched.update(json.load(file))
+        return fetched
+
+    def save_fetched(self, snapshot: str, fetched: Dict[str, str]):
+        with open(os.path.join(snapshot, FETCHED_FILE), "w") as file:
+            json.dump(fetched, file, indent=4, sort_keys=True)
+
+    def due_tickers(self, now: pd.Timestamp, fetched: Dict[str, str]) -> List[str]:
+        """Tickers whose venue closed a session (plus delay) since their last fetch."""
+        due = []
+        for ticker in self.tickers:
+            exchange = exchange_of(ticker, self.calendars)
+            if ticker not in fetched or exchange is None:
+                due.append(ticker)
+                continue
+            last_close = exchange.last_close(now - self.delay)
+            if last_close is None:
+                continue
+            if pd.Timestamp(fetched[ticker]) < last_close + self.delay:
+                due.append(ticker)
+        return due
+
+    def next_run(self, now: pd.Timestamp) -> pd.Timestamp:
+        """When the next venue close plus delay is reached."""
+        venues = {exchange_of(ticker, self.calendars) for ticker in self.tickers}
+        venues.discard(None)
+        if not venues:
+            return now + timedelta(days=1)
+        return min(venue.next_close(now - self.delay) + self.delay for venue in venues)
+
+    def refresh(self) -> dict:
+        """
+        One refresh cycle. Returns a summary with the refreshed tickers, the
+        failures and the published snapshot (None if nothing was due).
+        """
+        now = self.clock()
+        fetched = self.load_fetched()
+        due = self.due_tickers(now, fetched)
+        summary = {
+            "at": now.isoformat(),
+            "tickers": due,
+            "failures": {},
+            "alerts": 0,
+            "snapshot": None,
+        }
+        if not due:
+            return summary
+
+        staging = self.snapshots.stage()
+        try:
+            raw_folder = os.path.join(staging, RAW)
+            analyzed_folder = os.path.join(staging, ANALYZED)
+            extractor = Extractor(
+                tickers=due,
+                start_date=self.start_date,
+                end_date=(now + timedelta(days=1)).strftime("%Y-%m-%d"),
+                target_folder=raw_folder,
+                incremental=True,
+                fetch=self.fetch,
+            )
+            extractor.extract_data()
+            analyzer = TickerAnalyzer(raw_folder, analyzed_folder)
+            extracted = [ticker for ticker in due if ticker not in extractor.failed]
+            report = analyzer.analyze_many(extracted, workers=self.workers)
+            summary["failures"] = {**extractor.failed, **report.failures}
+            if self.alerter is not None:
+                try:
+                    summary["alerts"] = len(self.alerter.run(analyzed_folder))
+                except Exception as error:
+                    summary["alert_error"] = f"{type(error).__name__}: {error}"
+            for ticker in due:
+                if ticker not in summary["failures"]:
+                    fetched[ticker] = now.isoformat()
+            self.save_fetched(staging, fetched)
+        except BaseException:
+            self.snapshots.discard(staging)
+            raise
+        summary["snapshot"] = self.snapshots.publish(staging)
+        return summary
+
+    def run_forever(self, max_cycles: Optional[int] = None):
+        """Refresh now, then after every venue close, ``max_cycles`` times."""
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            summary = self.refresh()
+            print(json.dumps(summary, default=str))
+            cycles += 1
+            now = self.clock()
+            wait = (self.next_run(now) - now).total_seconds()
+            if max_cycles is None or cycles < max_cycles:
+                self.sleep(max(wait, 0.0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true")
+    parser.add_argument("--tickers-file", default=TICKERS_FILE)
+    parser.add_argument("--calendars", default=CALENDARS_FILE)
+    parser.add_argument("--snapshots", default=SNAPSHOT_ROOT)
+    parser.add_argument("--keep", type=int, default=3)
+    parser.add_argument("--delay-minutes", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--start-date",
+        default=(datetime.today() - timedelta(days=729)).strftime("%Y-%m-%d"),
+    )
+    parser.add_argument(
+        "--alert",
+        action="append",
+        default=[],
+        help="send signal changes to stdout, a webhook URL or a JSONL file",
+    )
+    args = parser.parse_args(argv)
+
+    refresher = Refresher(
+        tickers=load_tickers(args.tickers_file),
+        calendars=load_calendars(args.calendars),
+        snapshots=SnapshotStore(args.snapshots, keep=args.keep),
+        start_date=args.start_date,
+        delay=timedelta(minutes=args.delay_minutes),
+        workers=args.workers,
+        alerter=(
+            Alerter([make_sink(spec) for spec in args.alert]) if args.alert else None
+        ),
+    )
+    refresher.run_forever(max_cycles=1 if args.once else None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Daily, weekly and monthly rollups of the analyzed data for plotting
+
+Rollups are written by ``TickerAnalyzer`` next to the analyzed data
+(``<analyzed>/rollups/<resolution>/``), one series per symbol. Each period
+keeps the last close, the highest high, the lowest low, the indicator
+values at the period end and the percentage change against the previous
+period, so a chart of any range reads one symbol at one resolution.
+"""
+
+from typing import Dict, Optional, Tuple
+import os
+import shutil
+
+import pandas as pd
+
+from indicators import INDICATOR_COLUMNS
+from storage import TickerStore, open_store
+
+ROLLUP_FOLDER = "rollups"
+ROLLUP_COLUMNS = ["date", "close", "high", "low"] + INDICATOR_COLUMNS
+
+# Resample rule and approximate length in days of every resolution,
+# finest first. Weeks end on Monday like the weekly chart always did.
+RESOLUTIONS = {
+    "daily": (None, 1),
+    "weekly": ("W-MON", 7),
+    "monthly": ("ME", 30.44),
+}
+MIN_POINTS = 50
+
+AGGREGATIONS = {
+    "close": "last",
+    "high": "max",
+    "low": "min",
+    **{column: "last" for column in INDICATOR_COLUMNS},
+}
+
+
+def rollup(daily: pd.DataFrame, resolution: str) -> pd.DataFrame:
+    """
+    Aggregate daily rows (with a 'date' column) to ``resolution``.
+
+    Periods are labelled with their last day; the percentage change is
+    recomputed between period closes.
+    """
+    rule, _ = RESOLUTIONS[resolution]
+    if rule is None:
+        return daily[ROLLUP_COLUMNS].reset_index(drop=True)
+    rolled = daily.resample(rule, on="date").agg(AGGREGATIONS).dropna(subset=["close"])
+    rolled["pct_change"] = rolled["close"].pct_change() * 100
+    return rolled.reset_index()[ROLLUP_COLUMNS]
+
+
+def choose_resolution(start, end, min_points: int = MIN_POINTS) -> str:
+    """Coarsest resolution that still has ``min_points`` periods in the range."""
+    days = (pd.Timestamp(end) - pd.Timestamp(start)).days + 1
+    chosen = "daily"
+    for resolution, (_, period_days) in RESOLUTIONS.items():
+        if days / period_days >= min_points:
+            chosen = resolution
+    return chosen
+
+
+class RollupStore:
+    """The per-resolution stores of the rollups of an analyzed folder."""
+
+    def __init__(self, analyzed_folder: str, storage_format: Optional[str] = None):
+        self.folder = os.path.join(analyzed_folder, ROLLUP_FOLDER)
+        self.stores: Dict[str, TickerStore] = {
+            resolution: open_store(
+                os.path.join(self.folder, resolution), "date", storage_format
+            )
+            for resolution in RESOLUTIONS
+        }
+
+    def write(self, symbol: str, daily: pd.DataFrame):
+        """Replace every rollup of ``symbol`` by those of its full daily history."""
+        for resolution, store in self.stores.items():
+            store.write(symbol, rollup(daily, resolution))
+
+    def update(self, symbol: str, daily: pd.DataFrame):
+        """
+        Fold new daily rows into the rollups of ``symbol``.
+
+        ``daily`` replaces the stored days from its first date onwards. Every
+        coarser period from the one before the first new day is recomputed
+        from the stored daily rollup, so the percentage change of the first
+        replaced period still sees the close of its predecessor.
+        """
+        if daily.empty:
+            return
+        daily_store = self.stores["daily"]
+        daily_store.upsert(symbol, daily[ROLLUP_COLUMNS])
+        first = pd.Timestamp(daily["date"].min())
+        for resolution, (rule, _) in RESOLUTIONS.items():
+            if rule is None:
+                continue
+            offset = pd.tseries.frequencies.to_offset(rule)
+            period_end = offset.rollforward(first)
+            history = daily_store.read(symbol, start=period_end - 2 * offset)
+            rolled = rollup(history, resolution)
+            self.stores[resolution].upsert(symbol, rolled[rolled["date"] >= period_end])
+
+    def read(self, symbol: str, resolution: str, start=None, end=None) -> pd.DataFrame:
+        """Rollup of one symbol over the periods overlapping ``start``/``end``."""
+        rule, _ = RESOLUTIONS[resolution]
+        if end is not None and rule is not None:
+            # Periods are labelled with their last day, which may be after end.
+            end = pd.tseries.frequencies.to_offset(rule).rollforward(pd.Timestamp(end))
+        return self.stores[resolution].read(symbol, start=start, end=end)
+
+    def fingerprint(self, symbol: str, resolution: str) -> Tuple:
+        """Modification time and size of a stored rollup."""
+        stat = os.stat(self.stores[resolution].path(symbol))
+        return stat.st_mtime_ns, stat.st_size
+
+    def exists(self, symbol: str) -> bool:
+        return all(store.exists(symbol) for store in self.stores.values())
+
+    def delete(self, symbol: str):
+        for store in self.stores.values():
+            store.delete(symbol)
+
+    def clear(self):
+        if os.path.isdir(self.folder):
+            shutil.rmtree(self.folder)
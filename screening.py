@@ -0,0 +1,291 @@
+"""Screening rules compiled into vectorized masks over the analyzed columns
+
+A rule is a boolean expression over analyzed columns, for example::
+
+    rsi_14 < 40 and cci_25 < -85
+    close > ma_50 and ma_9 crosses above ma_50
+    not (close < ma_250 * 0.95) or pct_change >= 2
+
+Supported are numbers, column names, ``+ - * /``, the comparisons
+``< <= > >= == !=``, ``crosses above``/``crosses below`` (against the
+previous row of the same symbol), ``and``, ``or``, ``not`` and parentheses.
+Comparisons involving NaN are false, except ``!=``.
+"""
+
+from typing import Callable, Dict, List, Optional
+import re
+
+import numpy as np
+import pandas as pd
+
+from panel_schema import criteria_dtype
+
+CRITERIA = ["buy", "sell", "hold"]
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<op><=|>=|==|!=|[<>()+\-*/]))"
+)
+_KEYWORDS = {"and", "or", "not", "crosses", "above", "below"}
+_COMPARISONS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+class RuleError(ValueError):
+    """Raised for a rule that cannot be parsed."""
+
+
+class Context:
+    """
+    Evaluation state of one frame: column arrays, the previous row of each
+    symbol and a cache of already evaluated sub-expressions.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.columns = {}
+        self.results = {}
+        self._previous = None
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            if name not in self.df.columns:
+                raise KeyError(f"Unknown column {name!r} in screening rule")
+            self.columns[name] = self.df[name].to_numpy(dtype=float, na_value=np.nan)
+        return self.columns[name]
+
+    def previous(self, values: np.ndarray) -> np.ndarray:
+        """Values of the previous date of the same symbol (NaN for the first)."""
+        if self._previous is None:
+            n = len(self.df)
+            keys = []
+            if "date" in self.df.columns:
+                keys.append(self.df["date"].to_numpy())
+            if "symbol" in self.df.columns:
+                keys.append(pd.factorize(self.df["symbol"])[0])
+            order = np.lexsort(keys) if keys else np.arange(n)
+            positions = np.zeros(n, dtype=np.int64)
+            valid = np.zeros(n, dtype=bool)
+            positions[order[1:]] = order[:-1]
+            valid[order[1:]] = True
+            if "symbol" in self.df.columns:
+                codes = keys[-1]
+                valid &= codes == codes[positions]
+            self._previous = (positions, valid)
+        positions, valid = self._previous
+        return np.where(valid, values[positions], np.nan)
+
+
+def _cached(key: str, evaluate: Callable[[Context], np.ndarray]):
+    def run(context: Context) -> np.ndarray:
+        if key not in context.results:
+            context.results[key] = evaluate(context)
+        return context.results[key]
+
+    return run
+
+
+class _Parser:
+    """Recursive descent parser producing ``(key, evaluate)`` pairs."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = self.tokenize(text)
+        self.position = 0
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        tokens, position = [], 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                raise RuleError(f"Unexpected character at {position} in {text!r}")
+            tokens.append(match.group(match.lastgroup))
+            position = match.end()
+        return tokens
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise RuleError(f"Expected {expected or 'a value'} in {self.text!r}")
+        self.position += 1
+        return token
+
+    def parse(self):
+        node = self.disjunction()
+        if self.peek() is not None:
+            raise RuleError(f"Unexpected {self.peek()!r} in {self.text!r}")
+        return node
+
+    def binary(self, operand, operators: Dict[str, Callable]):
+        key, run = operand()
+        while self.peek() in operators:
+            symbol = self.take()
+            right_key, right = operand()
+            key = f"({key} {symbol} {right_key})"
+            run = _cached(key, self.apply(operators[symbol], run, right))
+        return key, run
+
+    @staticmethod
+    def apply(function, left, right):
+        def evaluate(context):
+            with np.errstate(all="ignore"):
+                return function(left(context), right(context))
+
+        return evaluate
+
+    def disjunction(self):
+        return self.binary(self.conjunction, {"or": np.logical_or})
+
+    def conjunction(self):
+        return self.binary(self.negation, {"and": np.logical_and})
+
+    def negation(self):
+        if self.peek() == "not":
+            self.take()
+            key, operand = self.negation()
+            key = f"(not {key})"
+            return key, _cached(key, lambda context: ~operand(context))
+        return self.comparison()
+
+    def comparison(self):
+        key, left = self.sum()
+        token = self.peek()
+        if token in _COMPARISONS:
+            self.take()
+            right_key, right = self.sum()
+            key = f"({key} {token} {right_key})"
+            return key, _cached(key, self.apply(_COMPARISONS[token], left, right))
+        if token == "crosses":
+            self.take()
+            direction = self.take()
+            if direction not in ("above", "below"):
+                raise RuleError(f"Expected 'above' or 'below' in {self.text!r}")
+            right_key, right = self.sum()
+            key = f"({key} crosses {direction} {right_key})"
+            return key, _cached(key, self.crossing(direction, left, right))
+        return key, left
+
+    @staticmethod
+    def crossing(direction, left, right):
+        def evaluate(context):
+            difference = left(context) - right(context)
+            previous = context.previous(difference)
+            with np.errstate(invalid="ignore"):
+                if direction == "above":
+                    return (difference > 0) & (previous <= 0)
+                return (difference < 0) & (previous >= 0)
+
+        return evaluate
+
+    def sum(self):
+        return self.binary(self.product, {"+": np.add, "-": np.subtract})
+
+    def product(self):
+        return self.binary(self.unary, {"*": np.multiply, "/": np.divide})
+
+    def unary(self):
+        if self.peek() == "-":
+            self.take()
+            key, operand = self.unary()
+            key = f"(-{key})"
+            return key, _cached(key, lambda context: -operand(context))
+        return self.primary()
+
+    def primary(self):
+        token = self.take()
+        if token == "(":
+            node = self.disjunction()
+            self.take(")")
+            return node
+        if token[0].isdigit() or token[0] == ".":
+            value = float(token)
+            return token, lambda context: value
+        if token in _KEYWORDS or not (token[0].isalpha() or token[0] == "_"):
+            raise RuleError(f"Unexpected {token!r} in {self.text!r}")
+        return token, _cached(token, lambda context: context.column(token))
+
+
+class Rule:
+    """A screening rule compiled from its expression."""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.key, self.evaluate = _Parser(expression).parse()
+
+    def mask(self, df: pd.DataFrame, context: Optional[Context] = None) -> np.ndarray:
+        context = context or Context(df)
+        result = np.broadcast_to(self.evaluate(context), (len(df),))
+        return np.asarray(result, dtype=bool)
+
+    def __repr__(self):
+        return f"Rule({self.expression!r})"
+
+
+class RuleSet:
+    """
+    Named rules evaluated together in one pass.
+
+    ``classify`` labels every row with the name of the first matching rule,
+    in insertion order, or ``default``, as a categorical of ``labels``.
+    """
+
+    def __init__(self, rules: Dict[str, str], default: str = "hold"):
+        self.rules = {name: Rule(expression) for name, expression in rules.items()}
+        self.default = default
+
+    @property
+    def labels(self) -> List[str]:
+        return list(criteria_dtype(list(self.rules) + [self.default]).categories)
+
+    def evaluate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Boolean mask of every rule, sharing columns and sub-expressions."""
+        context = Context(df)
+        return pd.DataFrame(
+            {name: rule.mask(df, context) for name, rule in self.rules.items()},
+            index=df.index,
+        )
+
+    def classify(self, df: pd.DataFrame) -> pd.Categorical:
+        masks = self.evaluate(df)
+        labels = self.labels
+        codes = np.select(
+            [masks[name].to_numpy() for name in self.rules],
+            [labels.index(name) for name in self.rules],
+            default=labels.index(self.default),
+        )
+        return pd.Categorical.from_codes(
+            codes.astype(np.int8), dtype=criteria_dtype(labels)
+        )
+
+
+def default_rule_set(rsi_buy=40, cci_buy=-85, rsi_sell=65, cci_sell=90) -> RuleSet:
+    """The RSI/CCI threshold rules of the app."""
+    return RuleSet(
+        {
+            "buy": f"rsi_14 < {rsi_buy} and cci_25 < {cci_buy}",
+            "sell": f"rsi_14 > {rsi_sell} and cci_25 > {cci_sell}",
+        }
+    )
+
+
+RULE_SETS = {
+    "RSI/CCI thresholds": default_rule_set,
+    "MA 9/50 crossover": lambda **_: RuleSet(
+        {
+            "buy": "close > ma_50 and ma_9 crosses above ma_50",
+            "sell": "close < ma_50 and ma_9 crosses below ma_50",
+        }
+    ),
+}
@@ -0,0 +1,200 @@
+"""Analyzed universe published as one memory-mapped Arrow file for all sessions
+
+After an analysis run the analyzed store is rewritten into ``panel.arrow``
+next to it: an uncompressed Arrow IPC file with a fixed schema, rows sorted
+by symbol and date, symbols dictionary-encoded and dates stored as int64
+nanoseconds. Every session and process maps the same file read-only, so the
+operating system keeps a single copy of it in the page cache, and filters
+are answered by slicing the mapped columns. Only the selected rows are
+copied when they are converted to pandas.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from panel_schema import VALUE_COLUMNS, compact
+from storage import _replace_atomically, open_store
+
+PANEL_FILE = "panel.arrow"
+METADATA_KEY = b"lightyear.offsets"
+SCHEMA = pa.schema(
+    [
+        pa.field("symbol", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+        pa.field("date", pa.int64(), nullable=False),
+    ]
+    + [pa.field(column, pa.float64()) for column in VALUE_COLUMNS]
+)
+
+
+def panel_path(analyzed_folder: str) -> str:
+    return os.path.join(analyzed_folder, PANEL_FILE)
+
+
+def build_table(df: pd.DataFrame) -> pa.Table:
+    """Panel table of a long analyzed frame with a 'symbol' column."""
+    df = df.sort_values(["symbol", "date"], kind="stable")
+    codes, symbols = pd.factorize(df["symbol"], sort=True)
+    symbols = [str(symbol) for symbol in symbols]
+    dates = pd.to_datetime(df["date"])
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert("UTC").dt.tz_localize(None)
+    arrays = [
+        pa.DictionaryArray.from_arrays(
+            pa.array(codes, pa.int32()), pa.array(symbols, pa.string())
+        ),
+        pa.array(dates.to_numpy("datetime64[ns]").view(np.int64)),
+    ] + [
+        pa.array(df[column].to_numpy(dtype=float, na_value=np.nan), pa.float64())
+        for column in VALUE_COLUMNS
+    ]
+    # Row range of every symbol, so symbol filters become slices.
+    offsets = np.searchsorted(codes, np.arange(len(symbols) + 1)).tolist()
+    metadata = {METADATA_KEY: json.dumps({"symbols": symbols, "offsets": offsets})}
+    return pa.Table.from_arrays(arrays, schema=SCHEMA.with_metadata(metadata))
+
+
+def publish_panel(analyzed_folder: str, storage_format: Optional[str] = None) -> str:
+    """Rewrite the panel file of ``analyzed_folder`` and swap it in atomically."""
+    store = open_store(analyzed_folder, "date", storage_format)
+    df = store.read_all(columns=VALUE_COLUMNS)
+    if df.empty:
+        df = pd.DataFrame(columns=["symbol", "date"] + VALUE_COLUMNS)
+    table = build_table(df)
+    path = panel_path(analyzed_folder)
+
+    def write(tmp_path):
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+
+    _replace_atomically(path, write)
+    return path
+
+
+class SharedPanel:
+    """
+    Read-only memory map of a published panel file.
+
+    ``version`` identifies the file (inode, mtime and size); publishing a new
+    panel replaces the file, so mapped readers keep their version intact.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        stat = os.stat(path)
+        self.version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        self.source = pa.memory_map(path, "r")
+        self.table = pa.ipc.open_file(self.source).read_all()
+        metadata = json.loads(self.table.schema.metadata[METADATA_KEY])
+        self.symbols: List[str] = metadata["symbols"]
+        self.offsets = np.asarray(metadata["offsets"], dtype=np.int64)
+        self.positions: Dict[str, int] = {
+            symbol: position for position, symbol in enumerate(self.symbols)
+        }
+        dates = self.table.column("date")
+        self.dates = (
+            dates.chunk(0).to_numpy(zero_copy_only=True)
+            if dates.num_chunks == 1
+            else dates.to_numpy()
+        )
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @staticmethod
+    def _bound(value) -> Optional[int]:
+        if value is None:
+            return None
+        value = pd.Timestamp(value)
+        if value.tzinfo is not None:
+            value = value.tz_convert("UTC").tz_localize(None)
+        return value.value
+
+    def row_ranges(self, start=None, end=None, symbols=None) -> List[Tuple[int, int]]:
+        """``(first, stop)`` row ranges of ``symbols`` within ``start``/``end``."""
+        if symbols is None:
+            positions = range(len(self.symbols))
+        else:
+            positions = sorted(
+                self.positions[symbol]
+                for symbol in set(symbols)
+                if symbol in self.positions
+            )
+        low, high = self._bound(start), self._bound(end)
+        ranges = []
+        for position in positions:
+            first, stop = self.offsets[position], self.offsets[position + 1]
+            dates = self.dates[first:stop]
+            if low is not None:
+                first += np.searchsorted(dates, low, side="left")
+            if high is not None:
+                stop = self.offsets[position] + np.searchsorted(
+                    dates, high, side="right"
+                )
+            if first < stop:
+                ranges.append((int(first), int(stop)))
+        return ranges
+
+    def select(self, start=None, end=None, symbols=None) -> pa.Table:
+        """Zero-copy view of the rows of ``symbols`` within ``start``/``end``."""
+        ranges = self.row_ranges(start, end, symbols)
+        if not ranges:
+            return self.table.slice(0, 0)
+        return pa.concat_tables(
+            [self.table.slice(first, stop - first) for first, stop in ranges]
+        )
+
+    def to_pandas(
+        self, start=None, end=None, symbols=None, columns=None, float32=False
+    ) -> pd.DataFrame:
+        """Selected rows as a frame in the compact schema (see ``panel_schema``)."""
+        table = self.select(start, end, symbols)
+        if columns is not None:
+            table = table.select(["symbol", "date"] + list(columns))
+        df = table.to_pandas()
+        df["date"] = df["date"].to_numpy().view("datetime64[ns]")
+        df["symbol"] = df["symbol"].cat.remove_unused_categories()
+        df = df[[column for column in df.columns if column != "symbol"] + ["symbol"]]
+        return compact(df, float32=float32)
+
+
+class SharedPanels:
+    """
+    Process-wide registry of mapped panels, one per analyzed folder.
+
+    The file is re-mapped only when a new version was published; every
+    session of the process shares the same mapping.
+    """
+
+    def __init__(self):
+        self.panels: Dict[str, SharedPanel] = {}
+        self.lock = threading.Lock()
+
+    def get(self, analyzed_folder: str) -> Optional[SharedPanel]:
+        """Mapped panel of ``analyzed_folder``, or None if none was published."""
+        path = panel_path(analyzed_folder)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            panel = self.panels.get(analyzed_folder)
+            if panel is None or panel.version != version:
+                panel = SharedPanel(path)
+                self.panels[analyzed_folder] = panel
+            return panel
+
+
+_panels = SharedPanels()
+
+
+def shared_panel(analyzed_folder: str) -> Optional[SharedPanel]:
+    """Panel of ``analyzed_folder`` from this process's registry."""
+    return _panels.get(analyzed_folder)
@@ -0,0 +1,286 @@
+"""Per-symbol storage of ticker time series (Parquet or CSV)"""
+
+from typing import List, Optional
+import os
+import re
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+STORAGE_FORMAT = os.environ.get("LIGHTYEAR_STORAGE_FORMAT", "parquet")
+PARTITION_PREFIX = "symbol="
+PARQUET_FILE = "data.parquet"
+
+_OFFSET_PATTERN = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+
+
+def _parse_times(values: pd.Series) -> pd.Series:
+    """Parse a text timestamp column, aligning mixed UTC offsets to UTC."""
+    sample = values.dropna()
+    if sample.empty:
+        return pd.to_datetime(values)
+    has_offset = bool(_OFFSET_PATTERN.search(str(sample.iloc[0])))
+    return pd.to_datetime(values, utc=has_offset)
+
+
+def _bound(value, tz):
+    """Convert a start/end bound to a Timestamp comparable with times in ``tz``."""
+    bound = pd.Timestamp(value)
+    if tz is not None and bound.tzinfo is None:
+        bound = bound.tz_localize(tz)
+    elif tz is None and bound.tzinfo is not None:
+        bound = bound.tz_convert(None)
+    return bound
+
+
+def _replace_atomically(path: str, write):
+    """Call ``write(tmp_path)`` and move the result over ``path``."""
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class TickerStore:
+    """
+    Base class of the per-symbol stores.
+
+    Every symbol holds one time series indexed by ``time_column``. Readers
+    can restrict the columns and the inclusive ``start``/``end`` range they
+    need; ``read_all`` concatenates symbols and adds a ``symbol`` column.
+    """
+
+    extension = ""
+
+    def __init__(self, folder: str, time_column: str = "date"):
+        self.folder = folder
+        self.time_column = time_column
+        os.makedirs(self.folder, exist_ok=True)
+
+    def symbols(self) -> List[str]:
+        raise NotImplementedError
+
+    def path(self, symbol: str) -> str:
+        raise NotImplementedError
+
+    def exists(self, symbol: str) -> bool:
+        return os.path.exists(self.path(symbol))
+
+    def files(self) -> List[str]:
+        """Data files of every stored symbol."""
+        return [self.path(symbol) for symbol in self.symbols()]
+
+    def read(
+        self,
+        symbol: str,
+        columns: Optional[List[str]] = None,
+        start=None,
+        end=None,
+    ) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def read_all(
+        self,
+        columns: Optional[List[str]] = None,
+        start=None,
+        end=None,
+        symbols: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        frames = []
+        for symbol in symbols if symbols is not None else self.symbols():
+            if not self.exists(symbol):
+                continue
+            df = self.read(symbol, columns=columns, start=start, end=end)
+            df["symbol"] = symbol
+            frames.append(df)
+        if not frames:
+            return pd.DataFrame(columns=self._columns(columns) + ["symbol"])
+        return pd.concat(frames, ignore_index=True)
+
+    def write(self, symbol: str, df: pd.DataFrame):
+        raise NotImplementedError
+
+    def upsert(self, symbol: str, df: pd.DataFrame):
+        """Replace the stored rows from the first time in ``df`` onwards by ``df``."""
+        if df.empty:
+            return
+        if not self.exists(symbol):
+            self.write(symbol, df)
+            return
+        stored = self.read(symbol)
+        first = _bound(df[self.time_column].min(), stored[self.time_column].dt.tz)
+        kept = stored[stored[self.time_column] < first]
+        self.write(symbol, pd.concat([kept, df], ignore_index=True))
+
+    def delete(self, symbol: str):
+        if self.exists(symbol):
+            os.remove(self.path(symbol))
+
+    def clear(self):
+        """Delete every stored symbol."""
+        for symbol in self.symbols():
+            self.delete(symbol)
+
+    def _columns(self, columns: Optional[List[str]]) -> List[str]:
+        if columns is None:
+            return []
+        if self.time_column in columns:
+            return list(columns)
+        return [self.time_column] + list(columns)
+
+    def _filter(self, df: pd.DataFrame, start, end) -> pd.DataFrame:
+        if start is None and end is None:
+            return df
+        times = df[self.time_column]
+        tz = getattr(times.dt, "tz", None)
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= times >= _bound(start, tz)
+        if end is not None:
+            mask &= times <= _bound(end, tz)
+        return df[mask].reset_index(drop=True)
+
+
+class CsvStore(TickerStore):
+    """One ``<symbol>.csv`` file per symbol, kept for compatibility."""
+
+    extension = ".csv"
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.folder, f"{symbol}.csv")
+
+    def symbols(self) -> List[str]:
+        return sorted(
+            filename[: -len(self.extension)]
+            for filename in os.listdir(self.folder)
+            if filename.endswith(self.extension)
+        )
+
+    def read(self, symbol, columns=None, start=None, end=None) -> pd.DataFrame:
+        usecols = self._columns(columns) or None
+        df = pd.read_csv(
+            self.path(symbol), usecols=usecols, float_precision="round_trip"
+        )
+        if self.time_column in df.columns:
+            df[self.time_column] = _parse_times(df[self.time_column])
+        return self._filter(df, start, end)
+
+    def write(self, symbol: str, df: pd.DataFrame):
+        _replace_atomically(
+            self.path(symbol), lambda path: df.to_csv(path, index=False)
+        )
+
+
+class ParquetStore(TickerStore):
+    """
+    Columnar store: a hive-style ``symbol=<symbol>/data.parquet`` dataset
+    with typed, zstd-compressed columns. Column projection is pushed down
+    into the Parquet reader.
+
+    Rows are written sorted by time, one row group per symbol: a date range
+    is filtered after the row group is decoded, so it costs about as much
+    as reading the symbol's whole history. Recent windows of the analyzed
+    universe ("last X days") are sliced from the published shared panel
+    instead (``shared_panel(folder).to_pandas(start=...)``).
+    """
+
+    extension = ".parquet"
+    compression = "zstd"
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.folder, f"{PARTITION_PREFIX}{symbol}", PARQUET_FILE)
+
+    def symbols(self) -> List[str]:
+        return sorted(
+            name[len(PARTITION_PREFIX) :]
+            for name in os.listdir(self.folder)
+            if name.startswith(PARTITION_PREFIX)
+            and os.path.exists(os.path.join(self.folder, name, PARQUET_FILE))
+        )
+
+    def _time_filter(self, schema, start, end):
+        field_type = schema.field(self.time_column).type
+        tz = getattr(field_type, "tz", None)
+        field = ds.field(self.time_column)
+        expression = None
+        if start is not None:
+            expression = field >= pa.scalar(_bound(start, tz), type=field_type)
+        if end is not None:
+            condition = field <= pa.scalar(_bound(end, tz), type=field_type)
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def _dataset(self, symbols: List[str]):
+        partitioning = ds.partitioning(
+            pa.schema([("symbol", pa.string())]), flavor="hive"
+        )
+        return ds.dataset(
+            [self.path(symbol) for symbol in symbols],
+            format="parquet",
+            partitioning=partitioning,
+            partition_base_dir=self.folder,
+        )
+
+    def read(self, symbol, columns=None, start=None, end=None) -> pd.DataFrame:
+        dataset = ds.dataset(self.path(symbol), format="parquet")
+        table = dataset.to_table(
+            columns=self._columns(columns) or None,
+            filter=self._time_filter(dataset.schema, start, end),
+        )
+        return table.to_pandas()
+
+    def read_all(self, columns=None, start=None, end=None, symbols=None):
+        available = self.symbols()
+        if symbols is not None:
+            wanted = set(symbols)
+            available = [symbol for symbol in available if symbol in wanted]
+        if not available:
+            return pd.DataFrame(columns=self._columns(columns) + ["symbol"])
+        dataset = self._dataset(available)
+        projection = self._columns(columns) or [
+            name for name in dataset.schema.names if name != "symbol"
+        ]
+        table = dataset.to_table(
+            columns=projection + ["symbol"],
+            filter=self._time_filter(dataset.schema, start, end),
+        )
+        return table.to_pandas()
+
+    def write(self, symbol: str, df: pd.DataFrame):
+        path = self.path(symbol)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if self.time_column in df.columns:
+            times = df[self.time_column]
+            if not times.is_monotonic_increasing:
+                df = df.sort_values(self.time_column, kind="stable")
+        _replace_atomically(
+            path,
+            lambda tmp_path: df.to_parquet(
+                tmp_path, index=False, compression=self.compression
+            ),
+        )
+
+    def delete(self, symbol: str):
+        partition = os.path.dirname(self.path(symbol))
+        if os.path.isdir(partition):
+            shutil.rmtree(partition)
+
+
+STORES = {"parquet": ParquetStore, "csv": CsvStore}
+
+
+def open_store(
+    folder: str, time_column: str = "date", storage_format: Optional[str] = None
+) -> TickerStore:
+    """Open the store of ``folder`` in ``storage_format`` (default: ``STORAGE_FORMAT``)."""
+    storage_format = storage_format or STORAGE_FORMAT
+    if storage_format not in STORES:
+        raise ValueError(
+            f"Unknown storage format {storage_format!r}, expected one of {sorted(STORES)}"
+        )
+    return STORES[storage_format](folder, time_column=time_column)
@@ -0,0 +1,136 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alerts import Alerter, JsonlSink, StdoutSink, WebhookSink, make_sink
+from screening import RULE_SETS
+from storage import open_store
+
+# rsi_14 / cci_25 of a bar with each signal of the default rules
+SIGNALS = {"hold": (50, 0), "buy": (30, -100), "sell": (70, 100)}
+
+
+def bars(signals, start="2024-01-01"):
+    dates = pd.bdate_range(start, periods=len(signals))
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "close": np.arange(len(signals), dtype=float) + 10,
+            "rsi_14": [SIGNALS[signal][0] for signal in signals],
+            "cci_25": [SIGNALS[signal][1] for signal in signals],
+        }
+    )
+
+
+def test_only_transitions_of_new_bars_are_alerted_once(tmp_path):
+    store = open_store(str(tmp_path), "date")
+    history = ["hold", "buy", "hold", "buy", "buy", "hold", "sell", "buy", "buy"]
+    store.write("CSPX", bars(history[:3]))
+    store.write("IWDA", bars(["sell", "sell"]))
+    alerts_file = tmp_path / "alerts.jsonl"
+    alerter = Alerter([JsonlSink(str(alerts_file))])
+
+    # The first run only records the current signal of every symbol.
+    assert alerter.run(str(tmp_path)) == []
+    assert not alerts_file.exists()
+
+    store.write("CSPX", bars(history))
+    alerts = alerter.run(str(tmp_path))
+    assert [(alert.date.day, alert.previous, alert.signal) for alert in alerts] == [
+        (4, "hold", "buy"),
+        (9, "hold", "sell"),
+        (10, "sell", "buy"),
+    ]
+    lines = [json.loads(line) for line in alerts_file.read_text().splitlines()]
+    assert lines[0] == {
+        "symbol": "CSPX",
+        "date": "2024-01-04",
+        "signal": "buy",
+        "previous": "hold",
+        "close": 13.0,
+    }
+
+    # Nothing new: nothing is raised again.
+    assert alerter.run(str(tmp_path)) == []
+    store.write("CSPX", bars(history + ["buy", "sell"]))
+    assert [alert.signal for alert in alerter.run(str(tmp_path))] == ["sell"]
+
+
+def test_new_bars_are_read_from_the_last_evaluated_date(tmp_path):
+    store = open_store(str(tmp_path), "date")
+    store.write("CSPX", bars(["hold"] * 300))
+    alerter = Alerter([])
+    alerter.run(str(tmp_path))
+    store.write("CSPX", bars(["hold"] * 300 + ["buy"]))
+
+    df = alerter.new_bars(str(tmp_path), alerter.load_state(str(tmp_path)))
+    assert len(df) == 2
+
+
+def test_crossing_rules_use_the_previous_evaluated_bar(tmp_path):
+    store = open_store(str(tmp_path), "date")
+    frame = bars(["hold"] * 4)
+    frame["ma_9"] = [9.0, 9.0, 9.0, 11.0]
+    frame["ma_50"] = 10.0
+    store.write("CSPX", frame.iloc[:3])
+    alerter = Alerter([], RULE_SETS["MA 9/50 crossover"]())
+    alerter.run(str(tmp_path))
+
+    store.write("CSPX", frame)
+    assert [alert.signal for alert in alerter.run(str(tmp_path))] == ["buy"]
+
+
+def test_failed_sink_raises_the_alerts_again(tmp_path):
+    store = open_store(str(tmp_path), "date")
+    store.write("CSPX", bars(["hold"]))
+
+    class Webhook:
+        def __init__(self, status):
+            self.status, self.posts = status, []
+
+        def post(self, url, json, timeout):
+            self.posts.append(json)
+            return self
+
+        def raise_for_status(self):
+            if self.status >= 400:
+                raise RuntimeError(self.status)
+
+    def alerter(session):
+        stdout = StdoutSink(stream)
+        return Alerter([stdout, WebhookSink("https://hooks.test", session=session)])
+
+    stream = io.StringIO()
+    Alerter([]).run(str(tmp_path))
+    store.write("CSPX", bars(["hold", "buy"]))
+    down = Webhook(503)
+    with pytest.raises(RuntimeError):
+        alerter(down).run(str(tmp_path))
+    # The sink before the failing one got the alert once.
+    assert [json.loads(line)["signal"] for line in stream.getvalue().splitlines()] == [
+        "buy"
+    ]
+
+    # The retry only goes to the webhook, followed by the next new alerts.
+    store.write("CSPX", bars(["hold", "buy", "sell"]))
+    up = Webhook(200)
+    assert [alert.signal for alert in alerter(up).run(str(tmp_path))] == ["sell"]
+    assert [alert["signal"] for alert in up.posts[0]["alerts"]] == ["buy", "sell"]
+    assert [json.loads(line)["signal"] for line in stream.getvalue().splitlines()] == [
+        "buy",
+        "sell",
+    ]
+
+    # Delivered everywhere: nothing is left to retry.
+    assert alerter(up).run(str(tmp_path)) == []
+    assert len(up.posts) == 1
+    assert Alerter([]).load_outbox(str(tmp_path)) == {}
+
+
+def test_make_sink():
+    assert isinstance(make_sink("stdout"), StdoutSink)
+    assert isinstance(make_sink("https://hooks.test/alerts"), WebhookSink)
+    assert isinstance(make_sink("data/alerts.jsonl"), JsonlSink)
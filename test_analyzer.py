@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import instrumentation
+from storage import open_store
+from transform import ANALYZED_COLUMNS, TickerAnalyzer
+
+
+def hourly_bars(days, seed=3):
+    """Synthetic hourly bars, 09:00-17:00 Berlin time on weekdays."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=days)
+    index = pd.DatetimeIndex(
+        [
+            pd.Timestamp(day) + pd.Timedelta(hours=hour)
+            for day in dates
+            for hour in range(9, 18)
+        ]
+    ).tz_localize("Europe/Berlin")
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.003, len(index))))
+    spread = np.abs(rng.normal(0, 0.1, len(index)))
+    return pd.DataFrame(
+        {"datetime": index, "close": close, "high": close + spread, "low": close - spread}
+    )
+
+
+def analyze(tmp_path, name, raw, rebuild=False, analyzer=None):
+    raw_store = open_store(str(tmp_path / name / "tickers"), "datetime")
+    raw_store.write("GMVM.DE", raw)
+    analyzer = analyzer or TickerAnalyzer(
+        str(tmp_path / name / "tickers"), str(tmp_path / name / "analyzed")
+    )
+    analyzer.preprocess_and_analyze("GMVM.DE", rebuild=rebuild)
+    return analyzer
+
+
+def test_incremental_update_matches_full_rebuild(tmp_path):
+    bars = hourly_bars(400)
+    # The first run misses 30 days and sees its last day only up to 12:00.
+    days = bars["datetime"].dt.normalize().unique()
+    first = bars[bars["datetime"] <= days[-31] + pd.Timedelta(hours=12)]
+
+    incremental = analyze(tmp_path, "incremental", first)
+    state_date = incremental.load_state("GMVM").date
+    analyze(tmp_path, "incremental", bars, analyzer=incremental)
+    assert incremental.load_state("GMVM").date > state_date
+    full = analyze(tmp_path, "full", bars, rebuild=True)
+
+    updated = incremental.analyzed_store.read("GMVM")
+    expected = full.analyzed_store.read("GMVM")
+    assert list(updated.columns) == ANALYZED_COLUMNS
+    assert updated["date"].equals(expected["date"])
+    for column in ANALYZED_COLUMNS[1:]:
+        np.testing.assert_allclose(
+            updated[column], expected[column], rtol=1e-9, equal_nan=True, err_msg=column
+        )
+    assert os.path.exists(incremental.state_path("GMVM"))
+
+
+def test_no_new_bars_leaves_data_untouched(tmp_path):
+    analyzer = analyze(tmp_path, "same", hourly_bars(60))
+    before = analyzer.analyzed_store.read("GMVM")
+    analyze(tmp_path, "same", hourly_bars(60), analyzer=analyzer)
+    pd.testing.assert_frame_equal(before, analyzer.analyzed_store.read("GMVM"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_analyze_many_reports_failures_without_aborting(tmp_path, workers):
+    raw_store = open_store(str(tmp_path / "tickers"), "datetime")
+    raw_store.write("GMVM.DE", hourly_bars(60))
+    raw_store.write("IWDA.AS", hourly_bars(60, seed=4).drop(columns=["high"]))
+    analyzer = TickerAnalyzer(str(tmp_path / "tickers"), str(tmp_path / "analyzed"))
+    seen = []
+
+    report = analyzer.analyze_many(
+        ["GMVM.DE", "IWDA.AS"],
+        workers=workers,
+        progress=lambda done, total, ticker, error: seen.append((done, total)),
+    )
+
+    assert report.analyzed == ["GMVM"]
+    assert list(report.failures) == ["IWDA.AS"]
+    assert sorted(seen) == [(1, 2), (2, 2)]
+    assert analyzer.analyzed_store.symbols() == ["GMVM"]
+
+
+def test_analyze_many_runs_one_vectorized_pass_per_worker(tmp_path):
+    raw_store = open_store(str(tmp_path / "tickers"), "datetime")
+    tickers = ["GMVM.DE", "IWDA.AS", "C40.PA", "CSPX.AS"]
+    for seed, ticker in enumerate(tickers):
+        raw_store.write(ticker, hourly_bars(60, seed=seed))
+    analyzer = TickerAnalyzer(str(tmp_path / "tickers"), str(tmp_path / "analyzed"))
+    instrumentation.disable()
+    instrumentation.enable()
+    try:
+        report = analyzer.analyze_many(tickers, workers=2)
+        records = instrumentation.recorder().frame()
+    finally:
+        instrumentation.disable()
+
+    assert sorted(report.analyzed) == ["C40", "CSPX", "GMVM", "IWDA"]
+    passes = records[records["stage"] == "indicators"]
+    assert passes["symbols"].tolist() == [2, 2]
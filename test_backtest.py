@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import Backtester, BacktesterCache, grid, random_grid
+from indicators import Panel
+
+
+def panel_from(close, rsi, cci):
+    dates = pd.date_range("2024-01-01", periods=len(close))
+    columns = lambda values: np.asarray(values, dtype=float).reshape(len(close), -1)
+    return Panel(
+        dates,
+        [f"S{i}" for i in range(columns(close).shape[1])],
+        {"close": columns(close), "rsi_14": columns(rsi), "cci_25": columns(cci)},
+    )
+
+
+def test_single_trade_matches_hand_computation():
+    # Buy at the close of day 1 (100), sell at the close of day 4 (90).
+    close = [100, 100, 110, 99, 90, 95]
+    rsi = [50, 30, 50, 50, 70, 50]
+    cci = [0, -100, 0, 0, 100, 0]
+    backtester = Backtester(panel_from(close, rsi, cci))
+
+    result = backtester.run((40, -85, 65, 90))
+
+    assert result["trades"] == 1
+    assert result["mean_return"] == pytest.approx(90 / 100 - 1)
+    assert result["max_drawdown"] == pytest.approx(90 / 110 - 1)
+    assert result["hit_rate"] == 0
+
+
+def test_per_symbol_matches_loop_implementation():
+    rng = np.random.default_rng(5)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (300, 4)), axis=0))
+    rsi = rng.uniform(0, 100, (300, 4))
+    cci = rng.uniform(-200, 200, (300, 4))
+    backtester = Backtester(panel_from(close, rsi, cci))
+    per_symbol = backtester.per_symbol((40, -85, 65, 90))
+
+    for column in range(4):
+        holding, equity, trades, wins, entry = False, 1.0, 0, 0, None
+        for t in range(300):
+            if holding:
+                equity *= close[t, column] / close[t - 1, column]
+            if rsi[t, column] > 65 and cci[t, column] > 90 and holding:
+                holding = False
+                wins += close[t, column] > entry
+            elif rsi[t, column] < 40 and cci[t, column] < -85 and not holding:
+                holding, entry, trades = True, close[t, column], trades + 1
+        wins += holding and close[-1, column] > entry
+        row = per_symbol.iloc[column]
+        assert row["trades"] == trades
+        assert row["total_return"] == pytest.approx(equity - 1)
+        assert row["hit_rate"] == pytest.approx(wins / trades)
+
+
+def test_sweep_caches_and_uses_processes():
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (200, 3)), axis=0))
+    backtester = Backtester(
+        panel_from(close, rng.uniform(0, 100, (200, 3)), rng.uniform(-200, 200, (200, 3)))
+    )
+    combinations = grid([30, 40], [-100, -85], [65], [90, 100])
+
+    parallel = backtester.sweep(combinations, workers=2)
+    assert len(parallel) == 8 and len(backtester.cache) == 8
+    assert parallel["mean_return"].is_monotonic_decreasing
+
+    serial = Backtester(backtester.panel).sweep(combinations, workers=1)
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert len(random_grid(5, seed=1)) == 5
+
+
+def test_cached_backtester_reuses_sweeps_across_calls(analyzed_universe, monkeypatch):
+    analyzer = analyzed_universe
+    cache = BacktesterCache()
+    combinations = grid([30, 40], [-100], [65], [90, 100])
+    start = pd.Timestamp("2023-02-01").date()
+    first = cache.get(analyzer.analyzed_folder, start=start)
+    expected = first.sweep(combinations, workers=1)
+
+    simulated = []
+    monkeypatch.setattr(
+        Backtester, "simulate", lambda self, params: simulated.append(params)
+    )
+    again = cache.get(analyzer.analyzed_folder, start=start)
+    assert again is first
+    pd.testing.assert_frame_equal(again.sweep(combinations, workers=1), expected)
+    assert simulated == []
+
+    # A new analysis publishes a new panel version: the results are stale.
+    analyzer.publish_panel()
+    assert cache.get(analyzer.analyzed_folder, start=start) is not first
@@ -0,0 +1,37 @@
+import json
+
+import pandas as pd
+
+from bench import STAGES, cold_start, compare, main, synthetic_bars
+
+
+def test_synthetic_bars_are_deterministic_and_consistent():
+    bars = synthetic_bars("SYN00001.DE", "2024-01-01", "2024-03-01")
+    later = synthetic_bars("SYN00001.DE", "2024-02-01", "2024-03-01")
+    other = synthetic_bars("SYN00002.DE", "2024-01-01", "2024-03-01")
+
+    assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert str(bars.index.tz) == "Europe/Berlin"
+    assert bars.index.min() == pd.Timestamp("2024-01-01 09:00", tz="Europe/Berlin")
+    assert bars.index.max() == pd.Timestamp("2024-02-29 17:00", tz="Europe/Berlin")
+    assert (bars.index.dayofweek < 5).all()
+    assert (bars["High"] >= bars["Close"]).all() and (bars["Low"] <= bars["Close"]).all()
+    pd.testing.assert_frame_equal(bars.loc[later.index], later)
+    assert not bars["Close"].equals(other["Close"])
+
+
+def test_benchmark_writes_every_stage(tmp_path):
+    output = tmp_path / "results"
+    assert main(["--tickers", "3", "--days", "60", "--output", str(output)]) == 0
+
+    (path,) = output.iterdir()
+    results = json.loads(path.read_text())
+    assert results["tickers"] == 3
+    assert [stage["stage"] for stage in results["stages"]] == STAGES
+    for stage in results["stages"]:
+        assert stage["seconds"] > 0 and stage["rows"] > 0
+    assert set(compare(results, results).values()) == {1.0}
+
+
+def test_cold_start_defers_heavy_imports():
+    assert cold_start() == []
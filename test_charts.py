@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from charts import cached_png, figure_cache, lttb
+from rollups import ROLLUP_COLUMNS
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    y[123], y[777] = 5.0, -5.0
+
+    selected = lttb(x, y, 100)
+
+    assert len(selected) == 100
+    assert selected[0] == 0 and selected[-1] == 999
+    assert np.all(np.diff(selected) > 0)
+    assert 123 in selected and 777 in selected
+
+
+def test_lttb_skips_nan_and_keeps_short_series():
+    y = np.r_[np.full(10, np.nan), np.arange(20.0)]
+    assert list(lttb(np.arange(30), y, 100)) == list(range(10, 30))
+    selected = lttb(np.arange(30), y, 5)
+    assert len(selected) == 5 and selected[0] == 10 and selected[-1] == 29
+
+
+def frame(days=400):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=days)})
+    for column in ROLLUP_COLUMNS[1:]:
+        df[column] = rng.normal(50, 10, days)
+    return df
+
+
+def test_figures_are_cached_per_view_and_fingerprint():
+    cache = figure_cache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return frame()
+
+    png = cached_png(cache, "CSPX", ("daily", "2024-01-01"), (1, 100), load)
+    assert png.startswith(b"\x89PNG")
+    assert cached_png(cache, "CSPX", ("daily", "2024-01-01"), (1, 100), load) is png
+    assert len(loads) == 1
+
+    cached_png(cache, "CSPX", ("daily", "2024-01-01"), (2, 100), load)
+    cached_png(cache, "CSPX", ("weekly", "2024-01-01"), (2, 100), load)
+    assert len(loads) == 3
+    assert cached_png(cache, "IWDA", ("daily",), (1, 0), lambda: frame(0)) == b""
+
+
+def test_figure_cache_is_bounded_by_bytes():
+    cache = figure_cache(max_bytes=10)
+    cache.put(("A",), 1, b"12345")
+    cache.put(("B",), 1, b"12345")
+    cache.put(("C",), 1, b"12345")
+    assert list(cache.entries) == [("B",), ("C",)]
+    assert cache.total_bytes == 10
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from cross_section import (
+    CrossSection,
+    CrossSectionCache,
+    load_fields,
+    RollingCorrelation,
+    forward_fill,
+    percentile_ranks,
+)
+from indicators import Panel
+from conftest import UNIVERSE, write_universe
+
+
+def synthetic_panel(days=120, symbols=6, seed=8):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=days)
+    names = [f"S{number}" for number in range(symbols)]
+    market = rng.normal(0, 1, (days, 1))
+    returns = market * rng.uniform(0, 1, symbols) + rng.normal(0, 1, (days, symbols))
+    close = 100 * np.exp(np.cumsum(returns / 100, axis=0))
+    fields = {
+        "close": close,
+        "pct_change": returns,
+        "rsi_14": np.round(rng.uniform(0, 100, (days, symbols))),
+        "cci_25": rng.normal(0, 100, (days, symbols)),
+    }
+    # A venue holiday and a symbol listed later.
+    for values in fields.values():
+        values[10, 2] = np.nan
+        values[:30, 5] = np.nan
+    return Panel(dates, names, fields)
+
+
+def test_percentile_ranks_match_pandas():
+    values = synthetic_panel().fields["rsi_14"]
+    expected = pd.DataFrame(values).rank(axis=1, pct=True).to_numpy()
+    np.testing.assert_allclose(percentile_ranks(values), expected, equal_nan=True)
+
+
+def test_rolling_correlation_matches_pairwise_pandas():
+    returns = synthetic_panel().fields["pct_change"]
+    correlation = RollingCorrelation(returns.shape[1], window=40, min_periods=5)
+    for start in range(0, len(returns), 17):
+        correlation.extend(returns[start : start + 17])
+
+    expected = pd.DataFrame(returns[-40:]).corr(min_periods=5).to_numpy()
+    np.testing.assert_allclose(correlation.matrix(), expected, atol=1e-10)
+
+
+def test_incremental_updates_match_a_full_build():
+    panel = synthetic_panel()
+    full = CrossSection.from_panel(panel, benchmark="S0", window=40, lookback=10)
+
+    incremental = CrossSection(panel.symbols, benchmark="S0", window=40, lookback=10)
+    # Later updates also see known days again; the last one may be revised.
+    for start, end in ((0, 50), (49, 51), (50, 90), (85, 120)):
+        part = Panel(
+            panel.dates[start:end],
+            panel.symbols,
+            {field: values[start:end] for field, values in panel.fields.items()},
+        )
+        assert incremental.update(part)
+
+    assert incremental.dates.equals(full.dates)
+    np.testing.assert_allclose(incremental.strength, full.strength, equal_nan=True)
+    np.testing.assert_allclose(
+        incremental.ranks["cci_25"], full.ranks["cci_25"], equal_nan=True
+    )
+    np.testing.assert_allclose(
+        incremental.correlation.matrix(), full.correlation.matrix(), atol=1e-10
+    )
+
+    close = forward_fill(panel.fields["close"])
+    expected = (close[-1] / close[-11]) / (close[-1, 0] / close[-11, 0]) - 1
+    np.testing.assert_allclose(
+        full.latest().loc[panel.symbols, "relative_strength"], expected
+    )
+    assert full.latest()["relative_strength"].is_monotonic_decreasing
+    assert len(full.top_pairs(3)) == 3
+
+
+def test_unknown_symbols_require_a_rebuild():
+    panel = synthetic_panel()
+    cross_section = CrossSection(panel.symbols[:3])
+    assert not cross_section.update(panel)
+
+
+def test_cache_extends_the_cross_section_with_appended_dates(
+    tmp_path, analyzed_universe
+):
+    analyzer = analyzed_universe
+    cache = CrossSectionCache()
+    cross_section = cache.get(analyzer.analyzed_folder, benchmark="IWDA")
+    assert cross_section.symbols == ["C40", "GMVM", "IWDA"]
+    assert cache.get(analyzer.analyzed_folder, benchmark="IWDA") is cross_section
+    assert cross_section.latest().loc["IWDA", "relative_strength"] == 0
+    last = cross_section.dates[-1]
+
+    write_universe(tmp_path, days=90)
+    analyzer.analyze_many(UNIVERSE, workers=1)
+    extended = cache.get(analyzer.analyzed_folder, benchmark="IWDA")
+    assert extended is cross_section
+    assert extended.dates[-1] > last
+    rebuilt = CrossSection.from_panel(
+        load_fields(analyzer.analyzed_folder), benchmark="IWDA"
+    )
+    np.testing.assert_allclose(
+        extended.correlation.matrix(), rebuilt.correlation.matrix(), equal_nan=True
+    )
+
+
+def test_cache_rebuilds_after_history_or_symbols_change(tmp_path, analyzed_universe):
+    analyzer = analyzed_universe
+    cache = CrossSectionCache()
+    cross_section = cache.get(analyzer.analyzed_folder)
+
+    # A full rebuild on revised bars rewrites the history.
+    raw_store = write_universe(tmp_path)
+    raw = raw_store.read("GMVM.DE")
+    raw_store.write("GMVM.DE", raw.assign(close=raw["close"] * 1.5))
+    analyzer.analyze_many(UNIVERSE, workers=1, rebuild=True)
+    rebuilt = cache.get(analyzer.analyzed_folder)
+    assert rebuilt is not cross_section
+
+    analyzer.delete("C40.PA")
+    analyzer.publish_panel()
+    assert cache.get(analyzer.analyzed_folder).symbols == ["GMVM", "IWDA"]
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from extractor import Extractor
+
+
+class Recorder:
+    """
+    Hourly Yahoo-shaped downloads whose prices depend only on the bar time,
+    recording every requested window.
+    """
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.calls = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        if ticker in self.errors:
+            raise self.errors[ticker]
+        days = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        index = pd.DatetimeIndex(
+            (days.values[:, None] + np.arange(9, 18) * np.timedelta64(1, "h")).ravel(),
+            name="Datetime",
+        ).tz_localize("Europe/Berlin")
+        close = 100 + index.asi8 / 3.6e12 % 1000
+        return pd.DataFrame(
+            {
+                "Open": close,
+                "High": close + 1,
+                "Low": close - 1,
+                "Close": close,
+                "Volume": 1000,
+            },
+            index=index,
+        )
+
+
+def test_extractor_incremental_fetches_only_missing_window(tmp_path):
+    fetch = Recorder()
+    folder = str(tmp_path / "tickers")
+
+    Extractor(
+        ["CSPX.AS"], "2024-03-20", "2024-04-05", folder, fetch=fetch
+    ).extract_data()
+    extractor = Extractor(
+        ["CSPX.AS", "DBXN.DE"],
+        "2024-03-20",
+        "2024-04-10",
+        folder,
+        incremental=True,
+        fetch=fetch,
+        retries=0,
+    )
+    fetch.errors["DBXN.DE"] = ValueError("possibly delisted")
+    fetch.calls.clear()
+    result = extractor.extract_data()
+
+    # Only the days after the stored bars (plus the overlap) are downloaded.
+    assert ("CSPX.AS", "2024-04-03", "2024-04-10") in fetch.calls
+    stored = extractor.store.read("CSPX.AS")
+    full = Extractor(
+        ["CSPX.AS"], "2024-03-20", "2024-04-10", str(tmp_path / "full"), fetch=fetch
+    ).extract_data()["CSPX.AS"]
+    pd.testing.assert_series_equal(
+        stored["close"], full["close"].reset_index(drop=True), check_names=False
+    )
+    assert stored["datetime"].is_unique
+    assert len(stored) == len(result["CSPX.AS"])
+    assert list(extractor.failed) == ["DBXN.DE"]
+    assert "CSPX.AS" in extractor.load_manifest()
+
+
+def test_failed_extraction_leaves_no_manifest(tmp_path):
+    fetch = Recorder(errors={"DBXN.DE": ValueError("possibly delisted")})
+    extractor = Extractor(
+        ["DBXN.DE"], "2024-03-20", "2024-04-05", str(tmp_path), fetch=fetch, retries=0
+    )
+    extractor.extract_data()
+    assert not (tmp_path / "manifest.json").exists()
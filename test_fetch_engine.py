@@ -0,0 +1,113 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fetch_engine import FetchEngine, TokenBucket
+
+
+class FakeYahoo:
+    """Serves canned hourly OHLCV frames with configurable latency and errors."""
+
+    def __init__(self, latency=0.0, errors=None, flaky=None):
+        self.latency = latency
+        self.errors = errors or {}
+        self.flaky = dict(flaky or {})
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, ticker, start, end):
+        with self.lock:
+            self.calls.append((ticker, start, end))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            if ticker in self.errors:
+                raise self.errors[ticker]
+            if self.flaky.get(ticker, 0) > 0:
+                self.flaky[ticker] -= 1
+                raise ConnectionError("temporary failure")
+            index = pd.date_range(
+                pd.Timestamp(start, tz="Europe/Berlin") + pd.Timedelta(hours=9),
+                pd.Timestamp(end, tz="Europe/Berlin"),
+                freq="h",
+                name="Datetime",
+            )
+            close = np.linspace(100, 110, len(index))
+            return pd.DataFrame(
+                {
+                    "Open": close,
+                    "High": close + 1,
+                    "Low": close - 1,
+                    "Close": close,
+                    "Volume": 1000,
+                },
+                index=index,
+            )
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_engine_fetches_concurrently():
+    fake = FakeYahoo(latency=0.05)
+    engine = FetchEngine(fake, max_workers=8, rate=1000)
+    jobs = {f"T{i}.DE": ("2024-01-01", "2024-01-03") for i in range(16)}
+
+    started = time.perf_counter()
+    report = engine.run(jobs)
+    elapsed = time.perf_counter() - started
+
+    assert sorted(report.results) == sorted(jobs)
+    assert fake.max_active > 1
+    assert elapsed < 16 * 0.05
+
+
+def test_engine_retries_and_reports_partial_failures():
+    fake = FakeYahoo(
+        errors={"DBXN.DE": ValueError("possibly delisted")},
+        flaky={"CSPX.AS": 2},
+    )
+    engine = FetchEngine(fake, rate=1000, retries=3, sleep=lambda _: None)
+    jobs = {t: ("2024-01-01", "2024-01-03") for t in ["DBXN.DE", "CSPX.AS", "C40.PA"]}
+
+    report = engine.run(jobs)
+
+    assert report.failed_tickers == ["DBXN.DE"]
+    assert "possibly delisted" in report.failures["DBXN.DE"]
+    assert report.attempts["CSPX.AS"] == 3
+    assert sum(1 for call in fake.calls if call[0] == "DBXN.DE") == 4
+
+
+def test_engine_does_not_retry_fatal_errors():
+    class Missing(Exception):
+        pass
+
+    fake = FakeYahoo(errors={"DFND.PA": Missing("no data")})
+    engine = FetchEngine(fake, rate=1000, fatal_errors=(Missing,))
+
+    report = engine.run({"DFND.PA": ("2024-01-01", "2024-01-03")})
+
+    assert report.failed_tickers == ["DFND.PA"]
+    assert len(fake.calls) == 1
+
+
+def test_token_bucket_limits_rate():
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(6):
+        bucket.acquire()
+
+    # Two tokens are available up front, the other four arrive at 2 per second.
+    assert now[0] == pytest.approx(2.0)
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import CCIIndicator
+
+from indicators import MA_WINDOWS, Panel, compute_indicators
+
+
+def daily_frames(seed=7):
+    """Random walks with different start dates and lengths per symbol."""
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for position, symbol in enumerate(["CSPX", "IWDA", "EXS1", "C40"]):
+        days = 300 + 60 * position
+        dates = pd.date_range(pd.Timestamp("2023-01-01") + pd.Timedelta(days=17 * position), periods=days)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, days)))
+        spread = np.abs(rng.normal(0, 0.5, days))
+        frames[symbol] = pd.DataFrame(
+            {"close": close, "high": close + spread, "low": close - spread},
+            index=pd.Index(dates, name="date"),
+        )
+    return frames
+
+
+def reference(df):
+    """Indicators computed per ticker with pandas and the ta library."""
+    expected = pd.DataFrame(index=df.index)
+    expected["pct_change"] = df["close"].pct_change() * 100
+    expected["cci_25"] = CCIIndicator(
+        high=df["high"], low=df["low"], close=df["close"], window=25, constant=0.015
+    ).cci()
+    expected["rsi_14"] = RSIIndicator(close=df["close"], window=14).rsi()
+    for window in MA_WINDOWS:
+        expected[f"ma_{window}"] = df["close"].rolling(window=window).mean()
+    return expected
+
+
+def test_panel_matches_ta_per_ticker():
+    frames = daily_frames()
+    panel = compute_indicators(Panel.from_frames(frames, ["close", "high", "low"]))
+    columns = ["pct_change", "cci_25", "rsi_14"] + [f"ma_{w}" for w in MA_WINDOWS]
+    result = panel.to_frames(["close"] + columns)
+
+    for symbol, df in frames.items():
+        expected = reference(df)
+        assert result[symbol].index.equals(df.index)
+        for column in columns:
+            np.testing.assert_allclose(
+                result[symbol][column].to_numpy(),
+                expected[column].to_numpy(),
+                rtol=1e-9,
+                atol=1e-9,
+                equal_nan=True,
+                err_msg=f"{symbol} {column}",
+            )
+
+
+def test_flat_series_rsi_is_100():
+    dates = pd.date_range("2024-01-01", periods=30)
+    flat = pd.DataFrame({"close": 5.0, "high": 5.0, "low": 5.0}, index=dates)
+    panel = compute_indicators(Panel.from_frames({"FLAT": flat}, ["close", "high", "low"]))
+    assert np.all(panel.fields["rsi_14"][13:] == 100)
+    assert np.all(np.isnan(panel.fields["rsi_14"][:13]))
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+import instrumentation
+from instrumentation import stage
+from storage import open_store
+from test_analyzer import hourly_bars
+from transform import TickerAnalyzer
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    instrumentation.disable()
+    yield instrumentation.enable(str(tmp_path / "timings.jsonl"))
+    instrumentation.disable()
+
+
+def test_disabled_stages_record_nothing():
+    instrumentation.disable()
+    with stage("fetch", "CSPX.AS") as record:
+        record["rows"] = 10
+    assert instrumentation.recorder() is None
+    assert stage("fetch") is stage("write")
+
+
+def test_stages_are_recorded_and_logged_as_json(recorder):
+    with stage("fetch", "CSPX.AS", attempt=1) as record:
+        record["rows"] = 10
+    with pytest.raises(ValueError):
+        with stage("write", "CSPX.AS"):
+            raise ValueError("disk full")
+
+    fetch, write = recorder.records
+    assert fetch["stage"] == "fetch" and fetch["rows"] == 10 and fetch["attempt"] == 1
+    assert fetch["seconds"] >= 0 and "error" not in fetch
+    assert write["error"] == "ValueError"
+    with open(recorder.log_path) as file:
+        assert [json.loads(line) for line in file] == [fetch, write]
+
+    summary = recorder.summary("stage")
+    assert list(summary.index) == sorted(
+        ["fetch", "write"], key=lambda name: -summary.loc[name, "total"]
+    )
+    assert recorder.slowest(1)["seconds"][0] == max(fetch["seconds"], write["seconds"])
+
+
+def test_worker_records_are_sent_to_the_parent(recorder, tmp_path):
+    raw = open_store(str(tmp_path / "tickers"), "datetime")
+    for ticker in ["GMVM.DE", "CSPX.AS"]:
+        raw.write(ticker, hourly_bars(60))
+    analyzer = TickerAnalyzer(str(tmp_path / "tickers"), str(tmp_path / "analyzed"))
+
+    report = analyzer.analyze_many(["GMVM.DE", "CSPX.AS"], workers=2)
+
+    assert sorted(report.analyzed) == ["CSPX", "GMVM"]
+    stages = {(record["stage"], record["ticker"]) for record in recorder.records}
+    assert {("read", "GMVM.DE"), ("indicators", "CSPX.AS"), ("write", "GMVM")} <= stages
+    with open(recorder.log_path) as file:
+        assert len(file.readlines()) == len(recorder.records)
+
+
+def test_recording_runs_while_any_subscriber_wants_it():
+    instrumentation.disable()
+    now = [0.0]
+    clock = lambda: now[0]
+    try:
+        first = instrumentation.subscribe("a", True, clock)
+        assert instrumentation.subscribe("b", True, clock) is first
+        # One session switching the panel off keeps the others' recording.
+        instrumentation.subscribe("a", False, clock)
+        assert instrumentation.recorder() is first
+
+        # A session that went away stops counting after the TTL.
+        now[0] += instrumentation.SUBSCRIPTION_TTL + 1
+        assert instrumentation.subscribe("a", False, clock) is None
+        assert not instrumentation.enabled()
+
+        # Recording started elsewhere is left running.
+        started = instrumentation.enable()
+        instrumentation.subscribe("c", True, clock)
+        instrumentation.subscribe("c", False, clock)
+        assert instrumentation.recorder() is started
+    finally:
+        instrumentation.disable()
@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from panel_cache import PanelCache, folder_fingerprint, load_analyzed_panel
+from storage import open_store
+
+
+def write_symbol(folder, symbol, days=20):
+    dates = pd.date_range("2024-01-01", periods=days)
+    open_store(folder, "date").write(
+        symbol, pd.DataFrame({"date": dates, "close": np.arange(days, dtype=float)})
+    )
+
+
+def test_cache_reloads_only_when_files_change(tmp_path):
+    folder = str(tmp_path)
+    write_symbol(folder, "CSPX")
+    cache = PanelCache()
+
+    first = load_analyzed_panel(folder, cache, start="2024-01-15")
+    again = load_analyzed_panel(folder, cache, start="2024-01-10", symbols=["CSPX"])
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert len(first) == 6 and len(again) == 11
+
+    write_symbol(folder, "IWDA")
+    universe = load_analyzed_panel(folder, cache)
+    assert cache.misses == 2
+    assert sorted(universe["symbol"].unique()) == ["CSPX", "IWDA"]
+
+
+def test_fingerprint_changes_with_size_and_mtime(tmp_path):
+    folder = str(tmp_path)
+    write_symbol(folder, "CSPX")
+    before = folder_fingerprint(folder)
+    path = open_store(folder, "date").path("CSPX")
+    os.utime(path, ns=(0, 0))
+    assert folder_fingerprint(folder) != before
+
+
+def test_lru_eviction_respects_memory_bound():
+    frame = pd.DataFrame({"close": np.zeros(1000)})
+    size = int(frame.memory_usage(deep=True).sum())
+    cache = PanelCache(max_bytes=2 * size)
+
+    for name in ["a", "b", "c"]:
+        cache.put(name, 1, frame)
+    cache.get("b", 1, lambda: frame)
+    cache.put("d", 1, frame)
+
+    assert list(cache.entries) == ["b", "d"]
+    assert cache.total_bytes <= cache.max_bytes
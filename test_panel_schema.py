@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from panel_schema import VALUE_COLUMNS, compact
+from screening import default_rule_set
+
+
+def wide_universe(symbols=200, days=250):
+    rng = np.random.default_rng(5)
+    rows = symbols * days
+    df = pd.DataFrame(
+        {
+            "date": np.tile(
+                pd.date_range("2024-01-01", periods=days).astype(str), symbols
+            ),
+            "symbol": np.repeat(
+                [f"SYM{number:04d}" for number in range(symbols)], days
+            ),
+        }
+    )
+    for column in VALUE_COLUMNS:
+        df[column] = rng.normal(0, 100, rows)
+    return df
+
+
+def test_compact_schema_cuts_memory_several_fold():
+    loose = wide_universe()
+    loose["criteria"] = np.asarray(default_rule_set().classify(loose), dtype=object)
+    tight = compact(loose.drop(columns=["criteria"]), float32=True)
+    tight["criteria"] = default_rule_set().classify(tight)
+
+    assert isinstance(tight["symbol"].dtype, pd.CategoricalDtype)
+    assert list(tight["symbol"].cat.categories) == sorted(loose["symbol"].unique())
+    assert tight["date"].dtype == "datetime64[ns]"
+    assert tight["rsi_14"].dtype == np.float32
+    assert list(tight["criteria"].cat.categories) == ["buy", "sell", "hold"]
+    assert tight["criteria"].astype(str).tolist() == loose["criteria"].tolist()
+
+    loose_bytes = loose.memory_usage(deep=True).sum()
+    assert loose_bytes > 3 * tight.memory_usage(deep=True).sum()
+
+
+def test_compact_keeps_float64_by_default():
+    df = compact(wide_universe(symbols=2, days=3))
+    assert (df[VALUE_COLUMNS].dtypes == np.float64).all()
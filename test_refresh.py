@@ -0,0 +1,120 @@
+import os
+
+import pandas as pd
+
+from alerts import Alerter
+from bench import synthetic_bars
+from refresh import (
+    Refresher,
+    SnapshotStore,
+    current_folders,
+    exchange_of,
+    load_calendars,
+)
+from storage import open_store
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = pd.Timestamp(now, tz="UTC")
+
+    def __call__(self):
+        return self.now
+
+
+def refresher(tmp_path, clock, fetch, tickers=("GMVM.DE", "IWDA.AS")):
+    return Refresher(
+        tickers=list(tickers),
+        calendars=load_calendars(),
+        snapshots=SnapshotStore(str(tmp_path / "snapshots"), keep=2),
+        start_date="2025-09-01",
+        fetch=fetch,
+        workers=1,
+        clock=clock,
+        sleep=lambda seconds: None,
+    )
+
+
+def test_calendars_know_every_venue_of_the_universe():
+    calendars = load_calendars()
+    assert exchange_of("GMVM.DE", calendars).name == "XETRA"
+    assert exchange_of("IWDA.AS", calendars).name == "AEX"
+    xetra = calendars["XETRA"]
+    # Friday 2025-12-26 is a holiday, so Monday's check still sees Tuesday's close.
+    monday = pd.Timestamp("2025-12-29 08:00", tz="UTC")
+    assert xetra.last_close(monday) == pd.Timestamp(
+        "2025-12-23 17:30", tz="Europe/Berlin"
+    )
+    assert xetra.next_close(monday) == pd.Timestamp(
+        "2025-12-29 17:30", tz="Europe/Berlin"
+    )
+
+
+def test_refresh_skips_venues_that_have_not_traded(tmp_path):
+    calls = []
+
+    def fetch(ticker, start, end):
+        calls.append(ticker)
+        return synthetic_bars(ticker, start, end)
+
+    # Saturday: both venues closed on Friday.
+    clock = Clock("2025-11-15 12:00")
+    daemon = refresher(tmp_path, clock, fetch)
+    first = daemon.refresh()
+    assert first["tickers"] == ["GMVM.DE", "IWDA.AS"]
+    assert first["failures"] == {}
+    raw_folder, analyzed_folder = current_folders(str(tmp_path / "snapshots"))
+    assert open_store(analyzed_folder, "date").symbols() == ["GMVM", "IWDA"]
+
+    # Nothing has traded over the weekend.
+    clock.now = pd.Timestamp("2025-11-17 10:00", tz="UTC")
+    assert daemon.refresh()["snapshot"] is None
+    assert len(calls) == 2
+
+    # Monday after the close (plus delay) both are due again.
+    clock.now = pd.Timestamp("2025-11-17 16:50", tz="UTC")
+    assert daemon.next_run(pd.Timestamp("2025-11-17 10:00", tz="UTC")) == clock.now
+    second = daemon.refresh()
+    assert second["tickers"] == ["GMVM.DE", "IWDA.AS"]
+    assert second["snapshot"] != first["snapshot"]
+    assert os.path.isdir(first["snapshot"])
+
+
+def test_failed_refresh_keeps_the_published_snapshot(tmp_path):
+    clock = Clock("2025-11-15 12:00")
+    daemon = refresher(tmp_path, clock, synthetic_bars)
+    published = daemon.refresh()["snapshot"]
+    before = open_store(os.path.join(published, "analyzed"), "date").read("GMVM")
+
+    def broken(ticker, start, end):
+        raise KeyboardInterrupt
+
+    daemon.fetch = broken
+    clock.now = pd.Timestamp("2025-11-17 16:50", tz="UTC")
+    try:
+        daemon.refresh()
+    except KeyboardInterrupt:
+        pass
+
+    assert daemon.snapshots.current() == published
+    assert not [
+        name for name in os.listdir(daemon.snapshots.root) if name.startswith(".")
+    ]
+    after = open_store(os.path.join(published, "analyzed"), "date").read("GMVM")
+    pd.testing.assert_frame_equal(before, after)
+
+
+def test_refresh_alerts_on_the_staged_analysis(tmp_path):
+    sent = []
+    clock = Clock("2025-11-15 12:00")
+    daemon = refresher(tmp_path, clock, synthetic_bars)
+    daemon.alerter = Alerter([sent.extend])
+    assert daemon.refresh()["alerts"] == 0
+    first = daemon.alerter.load_state(current_folders(daemon.snapshots.root)[1])
+    assert sorted(first) == ["GMVM", "IWDA"]
+
+    clock.now = pd.Timestamp("2025-11-17 16:50", tz="UTC")
+    summary = daemon.refresh()
+    assert summary["alerts"] == len(sent)
+    second = daemon.alerter.load_state(current_folders(daemon.snapshots.root)[1])
+    assert second["GMVM"]["date"] > first["GMVM"]["date"]
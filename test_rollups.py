@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rollups import ROLLUP_COLUMNS, RollupStore, choose_resolution, rollup
+from storage import open_store
+from test_analyzer import analyze, hourly_bars
+
+
+def daily_rows(days=60):
+    rng = np.random.default_rng(5)
+    dates = pd.date_range("2024-01-01", periods=days)
+    close = 100 + np.cumsum(rng.normal(0, 1, days))
+    df = pd.DataFrame({"date": dates, "close": close})
+    df["high"] = close + rng.uniform(0, 2, days)
+    df["low"] = close - rng.uniform(0, 2, days)
+    for column in ROLLUP_COLUMNS[4:]:
+        df[column] = rng.normal(0, 1, days)
+    return df
+
+
+def test_weekly_rollup_aggregates_ohlc_per_column():
+    daily = daily_rows()
+    weekly = rollup(daily, "weekly")
+
+    # 2024-01-01 is a Monday and ends the first week on its own.
+    assert list(weekly.columns) == ROLLUP_COLUMNS
+    assert weekly["date"].iloc[0] == pd.Timestamp("2024-01-01")
+    second = daily[(daily["date"] > "2024-01-01") & (daily["date"] <= "2024-01-08")]
+    row = weekly.iloc[1]
+    assert row["date"] == pd.Timestamp("2024-01-08")
+    assert row["close"] == second["close"].iloc[-1]
+    assert row["high"] == second["high"].max()
+    assert row["low"] == second["low"].min()
+    assert row["rsi_14"] == second["rsi_14"].iloc[-1]
+    assert row["pct_change"] == pytest.approx(
+        (second["close"].iloc[-1] / daily["close"].iloc[0] - 1) * 100
+    )
+
+
+def test_update_matches_full_write(tmp_path):
+    daily = daily_rows(120)
+    full = RollupStore(str(tmp_path / "full"))
+    full.write("CSPX", daily)
+    incremental = RollupStore(str(tmp_path / "incremental"))
+    incremental.write("CSPX", daily.iloc[:75])
+    # The last stored day is replaced, as the analyzer does.
+    incremental.update("CSPX", daily.iloc[74:100])
+    incremental.update("CSPX", daily.iloc[99:])
+
+    for resolution in ["daily", "weekly", "monthly"]:
+        pd.testing.assert_frame_equal(
+            incremental.read("CSPX", resolution), full.read("CSPX", resolution)
+        )
+
+
+def test_read_includes_the_period_containing_end(tmp_path):
+    store = RollupStore(str(tmp_path))
+    store.write("CSPX", daily_rows())
+    weekly = store.read("CSPX", "weekly", start="2024-01-10", end="2024-01-17")
+    assert list(weekly["date"]) == [pd.Timestamp("2024-01-15"), pd.Timestamp("2024-01-22")]
+
+
+def test_choose_resolution():
+    assert choose_resolution("2024-01-01", "2024-01-14") == "daily"
+    assert choose_resolution("2024-01-01", "2024-06-30") == "daily"
+    assert choose_resolution("2024-01-01", "2025-12-31") == "weekly"
+    assert choose_resolution("2020-01-01", "2025-12-31") == "monthly"
+
+
+def test_analyzer_keeps_rollups_of_incremental_runs_in_sync(tmp_path):
+    bars = hourly_bars(200)
+    days = bars["datetime"].dt.normalize().unique()
+    incremental = analyze(tmp_path, "incremental", bars[bars["datetime"] <= days[-40]])
+    analyze(tmp_path, "incremental", bars, analyzer=incremental)
+    full = analyze(tmp_path, "full", bars, rebuild=True)
+
+    for resolution in ["daily", "weekly", "monthly"]:
+        updated = incremental.rollups.read("GMVM", resolution)
+        expected = full.rollups.read("GMVM", resolution)
+        assert updated["date"].equals(expected["date"])
+        for column in ROLLUP_COLUMNS[1:]:
+            np.testing.assert_allclose(
+                updated[column], expected[column], rtol=1e-9, equal_nan=True
+            )
+    analyzed = open_store(str(tmp_path / "full" / "analyzed"), "date").read("GMVM")
+    np.testing.assert_allclose(
+        full.rollups.read("GMVM", "daily")["close"], analyzed["close"]
+    )
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from screening import Rule, RuleError, RuleSet, default_rule_set
+
+
+def analyzed_rows(seed=11, rows=500):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "date": np.tile(pd.date_range("2024-01-01", periods=rows // 5), 5),
+            "symbol": np.repeat(["CSPX", "IWDA", "EXS1", "C40", "DAX"], rows // 5),
+            "rsi_14": rng.uniform(10, 90, rows),
+            "cci_25": rng.uniform(-200, 200, rows),
+        }
+    )
+    df.loc[::17, "rsi_14"] = np.nan
+    return df
+
+
+def test_default_rule_set_matches_row_wise_rule():
+    df = analyzed_rows()
+    expected = df.apply(
+        lambda row: "buy"
+        if row["rsi_14"] < 40 and row["cci_25"] < -85
+        else "sell"
+        if row["rsi_14"] > 65 and row["cci_25"] > 90
+        else "hold",
+        axis=1,
+    )
+    assert list(default_rule_set(40, -85, 65, 90).classify(df)) == list(expected)
+
+
+def test_crosses_above_uses_previous_row_of_same_symbol():
+    df = pd.DataFrame(
+        {
+            "symbol": ["B", "A", "A", "A", "B"],
+            "date": pd.to_datetime(
+                ["2024-01-01", "2024-01-03", "2024-01-01", "2024-01-02", "2024-01-02"]
+            ),
+            "close": [10.0, 12, 10, 10, 10],
+            "ma_9": [4.0, 6, 4, 6, 6],
+            "ma_50": [5.0, 5, 5, 5, 5],
+        }
+    )
+    mask = Rule("close > ma_50 and ma_9 crosses above ma_50").mask(df)
+    assert list(mask) == [False, False, False, True, True]
+
+
+def test_arithmetic_not_and_parentheses():
+    df = pd.DataFrame({"close": [100.0, 90, 110], "ma_50": [100.0, 100, 100]})
+    assert list(Rule("close > ma_50 * 1.05").mask(df)) == [False, False, True]
+    assert list(Rule("not (close >= ma_50) or close - ma_50 > 5").mask(df)) == [
+        False,
+        True,
+        True,
+    ]
+
+
+def test_evaluate_returns_every_named_rule():
+    df = analyzed_rows()
+    masks = RuleSet(
+        {"oversold": "rsi_14 < 30", "overbought": "rsi_14 > 70", "any": "rsi_14 < 30 or rsi_14 > 70"}
+    ).evaluate(df)
+    assert list(masks.columns) == ["oversold", "overbought", "any"]
+    assert masks["any"].equals(masks["oversold"] | masks["overbought"])
+
+
+@pytest.mark.parametrize("expression", ["rsi_14 <", "rsi_14 < 40 and", "(rsi_14 < 40", "rsi_14 $ 4"])
+def test_invalid_rules_raise(expression):
+    with pytest.raises(RuleError):
+        Rule(expression)
+
+
+def test_unknown_column():
+    with pytest.raises(KeyError):
+        Rule("volume > 1").mask(analyzed_rows())
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from shared_panel import SharedPanels, publish_panel, shared_panel
+
+
+def test_analysis_publishes_a_panel_matching_the_store(analyzed_universe):
+    analyzer = analyzed_universe
+    panel = shared_panel(analyzer.analyzed_folder)
+    assert panel.symbols == ["C40", "GMVM", "IWDA"]
+    assert panel.table.schema.field("date").type == "int64"
+
+    start, end = pd.Timestamp("2023-02-01"), pd.Timestamp("2023-03-15")
+    expected = analyzer.analyzed_store.read_all(
+        start=start, end=end, symbols=["IWDA", "GMVM"]
+    )
+    expected = expected.sort_values(["symbol", "date"]).reset_index(drop=True)
+    selected = panel.to_pandas(start=start, end=end, symbols=["IWDA", "GMVM", "NONE"])
+
+    assert list(selected.columns) == list(expected.columns)
+    assert list(selected["symbol"].cat.categories) == ["GMVM", "IWDA"]
+    assert selected["symbol"].astype(str).tolist() == expected["symbol"].tolist()
+    assert selected["date"].equals(expected["date"])
+    np.testing.assert_allclose(
+        selected["rsi_14"], expected["rsi_14"], rtol=0, equal_nan=True
+    )
+
+
+def test_selection_is_a_view_of_the_mapped_file(analyzed_universe):
+    analyzer = analyzed_universe
+    panel = shared_panel(analyzer.analyzed_folder)
+    selected = panel.select(symbols=["GMVM"])
+    column = selected.column("close").chunk(0)
+    mapped = panel.table.column("close").chunk(0)
+    offset = panel.offsets[panel.symbols.index("GMVM")]
+    assert column.buffers()[1].address == mapped.buffers()[1].address
+    assert column.offset == mapped.offset + offset
+
+
+def test_republishing_swaps_in_a_new_version(analyzed_universe):
+    analyzer = analyzed_universe
+    panels = SharedPanels()
+    old = panels.get(analyzer.analyzed_folder)
+    assert panels.get(analyzer.analyzed_folder) is old
+    rows = len(analyzer.analyzed_store.read("C40"))
+
+    analyzer.analyzed_store.delete("C40")
+    publish_panel(analyzer.analyzed_folder)
+    new = panels.get(analyzer.analyzed_folder)
+
+    assert new is not old
+    assert new.symbols == ["GMVM", "IWDA"]
+    # Sessions still holding the old mapping keep reading a consistent file.
+    assert old.symbols == ["C40", "GMVM", "IWDA"]
+    assert len(old.to_pandas(symbols=["C40"])) == rows
+
+
+def test_missing_panel_is_none(tmp_path):
+    assert shared_panel(str(tmp_path)) is None
+
+
+def test_last_days_window_only_touches_the_tail_rows(analyzed_universe):
+    analyzer = analyzed_universe
+    panel = shared_panel(analyzer.analyzed_folder)
+    dates = pd.DatetimeIndex(panel.dates.view("datetime64[ns]")).unique().sort_values()
+    start = dates[-5]
+
+    ranges = panel.row_ranges(start=start)
+    # One range per symbol, ending at its last row and holding only the window.
+    assert [stop for _, stop in ranges] == panel.offsets[1:].tolist()
+    assert sum(stop - first for first, stop in ranges) == 5 * len(panel.symbols)
+
+    window = panel.to_pandas(start=start)
+    expected = analyzer.analyzed_store.read_all(start=start)
+    expected = expected.sort_values(["symbol", "date"]).reset_index(drop=True)
+    assert window["date"].equals(expected["date"])
+    np.testing.assert_array_equal(window["close"], expected["close"])
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from storage import CsvStore, ParquetStore, open_store
+
+
+def analyzed_frame(days=30):
+    dates = pd.date_range("2024-01-01", periods=days, freq="D")
+    close = np.linspace(10, 20, days)
+    return pd.DataFrame({"date": dates, "close": close, "rsi_14": close * 2})
+
+
+def hourly_frame():
+    # Spans the DST switch, so the CSV text holds mixed UTC offsets.
+    index = pd.date_range(
+        "2024-03-29 09:00", "2024-04-02 17:00", freq="h", tz="Europe/Berlin"
+    )
+    return pd.DataFrame(
+        {"datetime": index, "close": np.arange(len(index), dtype=float)}
+    )
+
+
+@pytest.mark.parametrize("storage_format", ["parquet", "csv"])
+def test_round_trip_with_columns_and_dates(tmp_path, storage_format):
+    store = open_store(str(tmp_path), "date", storage_format)
+    store.write("CSPX", analyzed_frame())
+    store.write("IWDA", analyzed_frame(10))
+
+    assert store.symbols() == ["CSPX", "IWDA"]
+    df = store.read("CSPX", columns=["close"], start="2024-01-25")
+    assert list(df.columns) == ["date", "close"]
+    assert df["date"].min() == pd.Timestamp("2024-01-25")
+    assert len(df) == 6
+
+    universe = store.read_all(start="2024-01-05", end="2024-01-06")
+    assert sorted(universe["symbol"].astype(str)) == ["CSPX", "CSPX", "IWDA", "IWDA"]
+    assert universe["rsi_14"].dtype == np.float64
+
+    store.clear()
+    assert store.symbols() == []
+
+
+@pytest.mark.parametrize("store_class", [ParquetStore, CsvStore])
+def test_timezone_aware_times(tmp_path, store_class):
+    store = store_class(str(tmp_path), time_column="datetime")
+    store.write("CSPX.AS", hourly_frame())
+
+    df = store.read("CSPX.AS", start=pd.Timestamp("2024-04-02 09:00+02:00"))
+    assert df["datetime"].dt.tz is not None
+    assert len(df) == 9
+    assert df["close"].iloc[0] == hourly_frame()["close"].iloc[-9]
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        open_store(str(tmp_path), storage_format="xlsx")
+
+
+def test_date_range_returns_exactly_the_rows_inside_it(tmp_path):
+    store = ParquetStore(str(tmp_path))
+    history = analyzed_frame(730)
+    # Written out of order: the store keeps every file sorted by time.
+    store.write("CSPX", history.sample(frac=1, random_state=1))
+    store.write("IWDA", history.iloc[:100])
+
+    start, end = history["date"].iloc[-5], history["date"].iloc[-2]
+    df = store.read("CSPX", start=start, end=end)
+    pd.testing.assert_frame_equal(df, history.iloc[-5:-1].reset_index(drop=True))
+    assert store.read("CSPX", start=history["date"].iloc[-1])["date"].tolist() == [
+        history["date"].iloc[-1]
+    ]
+
+    universe = store.read_all(start=history["date"].iloc[95], end=end)
+    counts = universe["symbol"].astype(str).value_counts()
+    assert counts.to_dict() == {"CSPX": 634, "IWDA": 5}
+    assert universe["date"].between(history["date"].iloc[95], end).all()
+
+
+def test_csv_round_trip_is_bit_identical(tmp_path):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=20_000, freq="D"),
+            "close": rng.lognormal(4, 1, 20_000),
+            "rsi_14": rng.uniform(0, 100, 20_000) / 3,
+        }
+    )
+    store = CsvStore(str(tmp_path))
+    store.write("CSPX", df)
+    first = store.read("CSPX")
+    store.write("CSPX", first)
+    second = store.read("CSPX")
+
+    for column in ["close", "rsi_14"]:
+        original = df[column].to_numpy().view(np.int64)
+        assert (first[column].to_numpy().view(np.int64) == original).all()
+        assert (second[column].to_numpy().view(np.int64) == original).all()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from indicators import INDICATOR_COLUMNS
+from storage import open_store
+from test_analyzer import hourly_bars
+from timeframes import aggregate_bars, analyze_timeframes
+from transform import TickerAnalyzer
+
+
+def ohlcv_bars(days, seed=3):
+    bars = hourly_bars(days, seed)
+    rng = np.random.default_rng(seed)
+    bars["open"] = bars["close"] + rng.normal(0, 0.05, len(bars))
+    bars["volume"] = rng.integers(1, 100, len(bars)).astype(float)
+    return bars
+
+
+def expected_bars(bars, keys):
+    return bars.groupby(keys.to_numpy()).agg(
+        open=("open", "first"),
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+        volume=("volume", "sum"),
+    )
+
+
+def test_aggregate_bars_builds_ohlc_per_timeframe():
+    bars = ohlcv_bars(30)
+    local = bars["datetime"].dt.tz_localize(None)
+    keys = {
+        "1h": local,
+        "4h": local.dt.floor("4h"),
+        "1d": local.dt.normalize(),
+        "1w": local.dt.to_period("W").dt.start_time,
+    }
+    for timeframe, key in keys.items():
+        result = aggregate_bars(bars, timeframe)
+        expected = expected_bars(bars, key)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), err_msg=timeframe)
+        assert list(result.index) == list(expected.index)
+
+    weekly = aggregate_bars(bars, "1w")
+    assert (weekly.index.dayofweek == 0).all()
+    daily = aggregate_bars(bars, "1d")
+    assert (daily["high"] >= daily["close"]).all()
+    assert (daily["high"] > bars.groupby(local.dt.normalize())["high"].last()).any()
+
+
+def test_symbols_with_different_sessions_do_not_leave_gaps():
+    gmvm = ohlcv_bars(120)
+    # CSPX misses every Wednesday and trades one hour less.
+    cspx = ohlcv_bars(120, seed=4)
+    cspx = cspx[(cspx["datetime"].dt.dayofweek != 2) & (cspx["datetime"].dt.hour < 17)]
+
+    together = analyze_timeframes({"GMVM": gmvm, "CSPX": cspx}, ["4h", "1d"])
+    for timeframe in ["4h", "1d"]:
+        alone = analyze_timeframes({"CSPX": cspx}, [timeframe])[timeframe]["CSPX"]
+        pd.testing.assert_frame_equal(together[timeframe]["CSPX"], alone)
+        assert not alone["ma_50"].iloc[60:].isna().any()
+    assert list(together["1d"]["GMVM"].columns) == (
+        ["date", "open", "high", "low", "close", "volume"] + INDICATOR_COLUMNS
+    )
+
+
+def test_analyzer_stores_timeframes_from_one_raw_read(tmp_path):
+    raw = open_store(str(tmp_path / "tickers"), "datetime")
+    raw.write("GMVM.DE", ohlcv_bars(80))
+    analyzer = TickerAnalyzer(
+        str(tmp_path / "tickers"), str(tmp_path / "analyzed"), timeframes=["1h", "1w"]
+    )
+    analyzer.preprocess_and_analyze("GMVM.DE")
+
+    hourly = analyzer.timeframe_store.read("GMVM", "1h")
+    assert len(hourly) == 80 * 9
+    assert hourly["rsi_14"].notna().sum() == 80 * 9 - 13
+    weekly = analyzer.timeframe_store.read("GMVM", "1w")
+    assert len(weekly) == 16
+
+    # The daily analysis takes the highest high of the day, not the last one.
+    daily = aggregate_bars(raw.read("GMVM.DE"), "1d")
+    assert analyzer.aggregate_daily(raw.read("GMVM.DE"))["high"].equals(
+        daily["high"].reset_index(drop=True)
+    )
@@ -0,0 +1,46 @@
+import re
+
+from universe import diff_universe, stream_listings
+
+LISTINGS_PAGE = "data/listings/lightyear_etfs.html"
+
+
+def test_streaming_finds_links_split_between_chunks(tmp_path):
+    with open(LISTINGS_PAGE, "r") as file:
+        html = file.read()
+    expected = re.findall(r'href="/et[fcn]/([^":]+):([A-Z]+)"', html)
+
+    assert list(stream_listings([LISTINGS_PAGE], chunk_size=97)) == expected
+    assert len(dict(stream_listings([LISTINGS_PAGE]))) == 68
+
+    page = tmp_path / "page.html"
+    page.write_text(
+        '<a href="/etf/CSPX:AEX">' + "x" * 500 + '<a href="/etc/PPFB:XETRA">'
+    )
+    assert list(stream_listings([str(page)], chunk_size=7)) == [
+        ("CSPX", "AEX"),
+        ("PPFB", "XETRA"),
+    ]
+
+
+def test_only_new_and_delisted_symbols_change_the_universe():
+    suffixes = {"AEX": ".AS", "XETRA": ".DE", "PAR": ".PA"}
+    previous = {"CSPX": "AEX", "DFND": "PAR", "WBIT": "XETRA", "OLD": "XETRA"}
+    tickers = {"CSPX": "CSPX.AS", "DFND": "DFND.MI", "OLD": "OLD.DE"}
+    listings = {
+        "CSPX": "AEX",
+        "DFND": "PAR",
+        "WBIT": "XETRA",
+        "NEW": "PAR",
+        "LSE1": "LSE",
+    }
+
+    diff = diff_universe(listings, previous, tickers, suffixes)
+
+    assert diff.added == {"NEW": "NEW.PA"}
+    assert diff.removed == {"OLD": "OLD.DE"}
+    assert diff.unmapped == {"LSE1": "LSE"}
+    # Hand-made entries and exclusions of listed symbols are kept.
+    assert diff.tickers == {"CSPX": "CSPX.AS", "DFND": "DFND.MI", "NEW": "NEW.PA"}
+    assert diff.changed
+    assert not diff_universe(listings, listings, diff.tickers, suffixes).changed
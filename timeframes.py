@@ -0,0 +1,136 @@
+"""OHLC bars and indicators at several timeframes from the raw hourly bars
+
+``aggregate_bars`` builds bars of a timeframe in one pass over time-sorted
+hourly bars: the first open, the highest high, the lowest low, the last
+close and the summed volume of every period. Periods follow the exchange's
+wall clock and bars are labelled with the start of their period (weeks
+start on Monday). Only periods with trades get a bar; unlike the daily
+analysis nothing is forward filled.
+
+``analyze_timeframes`` computes the indicator set for every timeframe and
+every symbol in one vectorized pass per timeframe. Symbols trade different
+hours and holidays, so each symbol's bars are stacked by bar number instead
+of by time, which leaves no gaps inside the rolling windows.
+"""
+
+from typing import Dict, Iterable, Optional
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from indicators import INDICATOR_COLUMNS, Panel, compute_indicators
+from storage import TickerStore, open_store
+
+TIMEFRAME_FOLDER = "timeframes"
+TIMEFRAMES = {"1h": "1h", "4h": "4h", "1d": "1D", "1w": "W"}
+OHLC_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def period_starts(times: pd.Series, timeframe: str) -> np.ndarray:
+    """Start of the ``timeframe`` period of every timestamp, in wall-clock time."""
+    local = times.dt.tz_localize(None) if times.dt.tz is not None else times
+    rule = TIMEFRAMES[timeframe]
+    if rule == "W":
+        return local.dt.to_period("W").dt.start_time.to_numpy()
+    return local.dt.floor(rule).to_numpy()
+
+
+def aggregate_bars(bars: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    OHLC(V) bars of ``timeframe`` from time-sorted bars with a 'datetime'
+    column. Missing open/volume columns are left out of the result.
+    """
+    bars = bars.dropna(subset=["close"])
+    columns = [column for column in OHLC_COLUMNS if column in bars.columns]
+    if bars.empty:
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name="date"))
+
+    starts = period_starts(bars["datetime"], timeframe)
+    first = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    last = np.r_[first[1:] - 1, len(starts) - 1]
+    reducers = {
+        "open": lambda values: values[first],
+        "high": lambda values: np.fmax.reduceat(values, first),
+        "low": lambda values: np.fmin.reduceat(values, first),
+        "close": lambda values: values[last],
+        "volume": lambda values: np.add.reduceat(np.nan_to_num(values), first),
+    }
+    return pd.DataFrame(
+        {
+            column: reducers[column](bars[column].to_numpy(dtype=float))
+            for column in columns
+        },
+        index=pd.DatetimeIndex(starts[first], name="date"),
+    )
+
+
+def bar_panel(frames: Dict[str, pd.DataFrame], columns) -> Panel:
+    """Stack per-symbol bars by bar number: row ``i`` is each symbol's i-th bar."""
+    symbols = list(frames)
+    length = max((len(df) for df in frames.values()), default=0)
+    fields = {column: np.full((length, len(symbols)), np.nan) for column in columns}
+    for position, df in enumerate(frames.values()):
+        for column in columns:
+            fields[column][: len(df), position] = df[column].to_numpy(dtype=float)
+    return Panel(pd.RangeIndex(length), symbols, fields)
+
+
+def analyze_timeframes(
+    raw: Dict[str, pd.DataFrame], timeframes: Iterable[str] = TIMEFRAMES
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """
+    Bars and indicators of every symbol at every timeframe.
+
+    ``raw`` maps symbols to their hourly bars. Returns ``timeframe -> symbol
+    -> frame`` with a 'date' column, the OHLC(V) columns and the indicators.
+    """
+    results = {}
+    for timeframe in timeframes:
+        bars = {symbol: aggregate_bars(df, timeframe) for symbol, df in raw.items()}
+        bars = {symbol: df for symbol, df in bars.items() if not df.empty}
+        panel = compute_indicators(bar_panel(bars, ["close", "high", "low"]))
+        frames = {}
+        for position, (symbol, df) in enumerate(bars.items()):
+            df = df.copy()
+            for column in INDICATOR_COLUMNS:
+                df[column] = panel.fields[column][: len(df), position]
+            frames[symbol] = df.reset_index()
+        results[timeframe] = frames
+    return results
+
+
+class TimeframeStore:
+    """The per-timeframe stores of the intraday analysis of an analyzed folder."""
+
+    def __init__(
+        self,
+        analyzed_folder: str,
+        timeframes: Iterable[str] = TIMEFRAMES,
+        storage_format: Optional[str] = None,
+    ):
+        self.folder = os.path.join(analyzed_folder, TIMEFRAME_FOLDER)
+        self.stores: Dict[str, TickerStore] = {
+            timeframe: open_store(
+                os.path.join(self.folder, timeframe), "date", storage_format
+            )
+            for timeframe in timeframes
+        }
+
+    def write(self, results: Dict[str, Dict[str, pd.DataFrame]]):
+        """Store the output of ``analyze_timeframes``."""
+        for timeframe, frames in results.items():
+            for symbol, df in frames.items():
+                self.stores[timeframe].write(symbol, df)
+
+    def read(self, symbol: str, timeframe: str, start=None, end=None) -> pd.DataFrame:
+        return self.stores[timeframe].read(symbol, start=start, end=end)
+
+    def delete(self, symbol: str):
+        for store in self.stores.values():
+            store.delete(symbol)
+
+    def clear(self):
+        if os.path.isdir(self.folder):
+            shutil.rmtree(self.folder)
@@ -1,36 +1,153 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import json
 import os
+import numpy as np
 import pandas as pd
-from ta.momentum import RSIIndicator
-from ta.trend import CCIIndicator
+from indicators import INDICATOR_COLUMNS, IndicatorState, Panel, compute_indicators
+import instrumentation
+from instrumentation import stage
+from rollups import RollupStore
+from shared_panel import publish_panel
+from storage import open_store
+from timeframes import TimeframeStore, aggregate_bars, analyze_timeframes
+
+ANALYZED_COLUMNS = ["date", "close"] + INDICATOR_COLUMNS
+
+
+@dataclass
+class AnalysisReport:
+    """Outcome of a batch analysis: analyzed symbols and errors per failed ticker."""
+
+    analyzed: list = field(default_factory=list)
+    failures: dict = field(default_factory=dict)
+
+
+def _analyze_chunk(analyzer, tickers, rebuild):
+    """
+    Analyze ``tickers`` in one vectorized pass. If the pass fails, every
+    ticker is analyzed on its own, so a bad ticker only fails itself.
+    Returns ``(ticker, analyzed symbols, error message)`` per ticker.
+    """
+    try:
+        analyzed = set(analyzer.analyze_universe(tickers, rebuild=rebuild))
+    except Exception:
+        outcomes = []
+        for ticker in tickers:
+            try:
+                symbols = analyzer.analyze_universe([ticker], rebuild=rebuild)
+            except Exception as error:
+                outcomes.append((ticker, [], f"{type(error).__name__}: {error}"))
+            else:
+                outcomes.append((ticker, symbols, None))
+        return outcomes
+    outcomes = []
+    for ticker in tickers:
+        symbol = ticker.split(".")[0]
+        outcomes.append((ticker, [symbol] if symbol in analyzed else [], None))
+    return outcomes
+
+
+def _analyze_in_worker(
+    raw_folder, analyzed_folder, storage_format, timeframes, tickers, rebuild, timed
+):
+    """Analyze a chunk of tickers; also return its stage records if ``timed``."""
+    # The parent logs the records, so workers only buffer them.
+    instrumentation.disable()
+    if timed:
+        instrumentation.enable()
+    analyzer = TickerAnalyzer(raw_folder, analyzed_folder, storage_format, timeframes)
+    try:
+        outcomes = _analyze_chunk(analyzer, tickers, rebuild)
+    finally:
+        records = instrumentation.recorder().drain() if timed else []
+    return outcomes, records
 
 
 class TickerAnalyzer:
-    def __init__(self, raw_folder, analyzed_folder):
+    """
+    Aggregates raw hourly bars into daily bars and calculates the indicators.
+
+    After a full analysis the running indicator state of every symbol is
+    saved next to the analyzed data (``<symbol>.state.json``), so later runs
+    only analyze the days that arrived since. Pass ``rebuild=True`` to force
+    a full recompute. Daily, weekly and monthly rollups for plotting are
+    kept up to date alongside (see ``rollups``).
+
+    With ``timeframes`` (e.g. ``("1h", "4h", "1w")``) the indicators are also
+    computed on OHLC bars of those timeframes, from the same read of the raw
+    bars (see ``timeframes``). They are recomputed in full on every run.
+    """
+
+    def __init__(
+        self, raw_folder, analyzed_folder, storage_format=None, timeframes=()
+    ):
         self.raw_folder = raw_folder
         self.analyzed_folder = analyzed_folder
-
-    def preprocess_and_analyze(self, ticker):
-        """Preprocess data and calculate indicators for a single ticker."""
-        # Trim the ticker to remove everything after the first "."
-        trimmed_ticker = ticker.split(".")[0]
-
-        # Adjust the file path to match the expected pattern: ticker.csv
-        file_name = f"{ticker}.csv"
-        file_path = os.path.join(self.raw_folder, file_name)
-
-        if not os.path.exists(file_path):
-            print(f"Raw data for {ticker} not found at {file_path}!")
-            return
-
-        # Load the raw ticker data with needed columns
-        ticker_data = pd.read_csv(
-            file_path,
-            usecols=["datetime", "close", "high", "low"],
-            parse_dates=["datetime"],
+        self.storage_format = storage_format
+        self.timeframes = tuple(timeframes)
+        self.raw_store = open_store(raw_folder, "datetime", storage_format)
+        self.analyzed_store = open_store(analyzed_folder, "date", storage_format)
+        self.rollups = RollupStore(analyzed_folder, storage_format)
+        self.timeframe_store = TimeframeStore(
+            analyzed_folder, self.timeframes, storage_format
         )
-        ticker_data["date"] = ticker_data["datetime"].dt.date
-        aggregated_df = ticker_data.groupby("date").last().reset_index()
-        aggregated_df = aggregated_df[["date", "close", "high", "low"]]
+
+    def state_path(self, symbol):
+        return os.path.join(self.analyzed_folder, f"{symbol}.state.json")
+
+    def load_state(self, symbol):
+        """Saved indicator state of a symbol, or None if it has to be rebuilt."""
+        path = self.state_path(symbol)
+        if not os.path.exists(path) or not self.analyzed_store.exists(symbol):
+            return None
+        if not self.rollups.exists(symbol):
+            return None
+        with open(path, "r") as file:
+            return IndicatorState.from_dict(json.load(file))
+
+    def save_state(self, symbol, state):
+        with open(self.state_path(symbol), "w") as file:
+            json.dump(state.to_dict(), file)
+
+    def aggregate_daily(self, ticker_data):
+        """Aggregate hourly bars into daily close (last), high (max) and low (min)."""
+        aggregated_df = aggregate_bars(ticker_data, "1d").reset_index()
+        return aggregated_df[["date", "close", "high", "low"]]
+
+    def load_raw(self, ticker, start=None):
+        """Raw hourly bars of a ticker, or None if nothing is stored."""
+        if not self.raw_store.exists(ticker):
+            print(f"Raw data for {ticker} not found at {self.raw_store.path(ticker)}!")
+            return None
+
+        # Load the raw ticker data with needed columns (all for the timeframes)
+        columns = None if self.timeframes else ["close", "high", "low"]
+        with stage("read", ticker) as record:
+            ticker_data = self.raw_store.read(ticker, columns=columns, start=start)
+            record["rows"] = len(ticker_data)
+        return ticker_data
+
+    def load_daily(self, ticker, start=None, ticker_data=None):
+        """
+        Aggregate the raw hourly bars of a ticker into a gap-free daily frame.
+
+        Already loaded bars can be passed as ``ticker_data``; only their bars
+        from ``start`` on are used.
+        """
+        if ticker_data is None:
+            ticker_data = self.load_raw(ticker, start=start)
+            if ticker_data is None:
+                return None
+        elif start is not None:
+            times = ticker_data["datetime"]
+            local = times.dt.tz_localize(None) if times.dt.tz is not None else times
+            ticker_data = ticker_data[local >= pd.Timestamp(start)]
+
+        with stage("aggregate", ticker):
+            aggregated_df = self.aggregate_daily(ticker_data)
+        if aggregated_df.empty:
+            return aggregated_df.set_index("date")
 
         # Create a full date range from the minimum to the maximum date
         full_date_range = pd.date_range(
@@ -40,47 +157,199 @@ class TickerAnalyzer:
         main_df = aggregated_df.set_index("date").reindex(full_date_range)
         main_df.ffill(inplace=True)
         main_df.index.name = "date"  # optional, to keep index name consistent
+        return main_df
+
+    def update_ticker(self, ticker, state):
+        """
+        Analyze only the days after the saved state of a ticker.
 
-        # Calculate percentage change on close
-        main_df["pct_change"] = main_df["close"].pct_change() * 100
+        The state covers every analyzed day but the last one, whose hourly
+        bars may still have been incomplete, so that day is analyzed again
+        together with the new ones. Returns False if there was nothing to do.
+        """
+        symbol = ticker.split(".")[0]
+        first_date = state.date + pd.Timedelta(days=1)
+        if self.timeframes:
+            ticker_data = self.load_raw(ticker)
+            if ticker_data is None:
+                return False
+            self.analyze_timeframes({symbol: ticker_data})
+            new_days = self.load_daily(ticker, first_date, ticker_data)
+        else:
+            new_days = self.load_daily(ticker, start=first_date)
+        if new_days is None or new_days.empty:
+            return False
 
-        # Compute CCI on the aggregated data from main_df
-        cci = CCIIndicator(
-            high=main_df["high"],
-            low=main_df["low"],
-            close=main_df["close"],
-            window=25,
-            constant=0.015,
+        # Fill the gap to the last state day the same way a full run would.
+        full_date_range = pd.date_range(start=first_date, end=new_days.index.max())
+        new_days = new_days.reindex(full_date_range)
+        new_days.iloc[0] = new_days.iloc[0].fillna(
+            {"close": state.close, "high": state.high, "low": state.low}
         )
-        main_df["cci_25"] = cci.cci()
-
-        # RSI (Relative Strength Index) computed on the aggregated close values
-        rsi = RSIIndicator(close=main_df["close"], window=14)
-        main_df["rsi_14"] = rsi.rsi()
-
-        # Moving Averages
-        main_df["ma_9"] = main_df["close"].rolling(window=9).mean()
-        main_df["ma_14"] = main_df["close"].rolling(window=14).mean()  # 14-day MA
-        main_df["ma_50"] = main_df["close"].rolling(window=50).mean()  # 50-day MA
-        main_df["ma_250"] = main_df["close"].rolling(window=250).mean()  # 250-day MA
-
-        main_df.reset_index(inplace=True)
-        main_df.rename(columns={"index": "date"}, inplace=True)
-        analyzed_file_path = os.path.join(self.analyzed_folder, f"{trimmed_ticker}.csv")
-
-        cols_to_keep = [
-            "date",
-            "close",
-            "pct_change",
-            "cci_25",
-            "rsi_14",
-            "ma_9",
-            "ma_14",
-            "ma_50",
-            "ma_250",
+        new_days.ffill(inplace=True)
+
+        rows = []
+        committed = state
+        with stage("indicators", ticker, rows=len(new_days)):
+            for date, bar in new_days.iterrows():
+                committed = IndicatorState.from_dict(state.to_dict())
+                row = state.update(date, bar["close"], bar["high"], bar["low"])
+                row.update(date=date, high=bar["high"], low=bar["low"])
+                rows.append(row)
+
+        new_rows = pd.DataFrame(rows)
+        with stage("write", symbol, rows=len(rows)):
+            self.analyzed_store.upsert(symbol, new_rows[ANALYZED_COLUMNS])
+            self.save_state(symbol, committed)
+        with stage("rollups", symbol):
+            self.rollups.update(symbol, new_rows)
+        return True
+
+    def analyze_universe(self, tickers, rebuild=False):
+        """
+        Calculate indicators for many tickers in one vectorized pass.
+
+        Tickers with a saved state are updated incrementally. The daily series
+        of all other tickers are aligned into one date x symbol panel, so the
+        indicator cost scales with the total number of bars rather than with
+        the number of tickers. Returns the analyzed symbols.
+        """
+        analyzed, full = [], []
+        for ticker in tickers:
+            # Trim the ticker to remove everything after the first "."
+            symbol = ticker.split(".")[0]
+            state = None if rebuild else self.load_state(symbol)
+            if state is None:
+                full.append(ticker)
+            elif self.update_ticker(ticker, state):
+                analyzed.append(symbol)
+
+        daily, raw = {}, {}
+        for ticker in full:
+            ticker_data = self.load_raw(ticker)
+            if ticker_data is None:
+                continue
+            main_df = self.load_daily(ticker, ticker_data=ticker_data)
+            if not main_df.empty:
+                daily[ticker.split(".")[0]] = main_df
+                if self.timeframes:
+                    raw[ticker.split(".")[0]] = ticker_data
+        if self.timeframes:
+            self.analyze_timeframes(raw)
+
+        with stage(
+            "indicators",
+            full[0] if len(full) == 1 else None,
+            rows=sum(len(main_df) for main_df in daily.values()),
+            symbols=len(daily),
+        ):
+            panel = compute_indicators(
+                Panel.from_frames(daily, columns=["close", "high", "low"])
+            )
+            frames = panel.to_frames(ANALYZED_COLUMNS[1:] + ["high", "low"])
+        for position, (symbol, main_df) in enumerate(frames.items()):
+            main_df = main_df.reset_index()
+            with stage("write", symbol, rows=len(main_df)):
+                self.analyzed_store.write(symbol, main_df[ANALYZED_COLUMNS])
+                if len(main_df) > 1:
+                    # Save the state before the last row, see update_ticker.
+                    row = panel.dates.get_loc(main_df["date"].iloc[-2])
+                    state = IndicatorState.from_panel(panel, position, row)
+                    self.save_state(symbol, state)
+            with stage("rollups", symbol):
+                self.rollups.write(symbol, main_df)
+            analyzed.append(symbol)
+        return analyzed
+
+    def analyze_timeframes(self, raw):
+        """Analyze and store the configured timeframes of ``symbol -> raw bars``."""
+        with stage("timeframes", None, symbols=len(raw)):
+            results = analyze_timeframes(raw, self.timeframes)
+        self.timeframe_store.write(results)
+
+    def analyze_many(self, tickers, workers=None, rebuild=False, progress=None):
+        """
+        Analyze tickers on a pool of ``workers`` processes.
+
+        Every worker gets one chunk of the tickers and analyzes it in one
+        vectorized pass (see ``analyze_universe``). ``progress(done, total,
+        ticker, error)`` is called for each ticker as its chunk finishes. A
+        failing ticker is recorded in the report instead of aborting the
+        batch. ``workers=1`` runs everything in this process.
+        While instrumentation is enabled the workers send their stage
+        records back with their results. Afterwards the shared panel of the
+        analyzed folder is republished (see ``shared_panel``).
+        """
+        report = AnalysisReport()
+        total = len(tickers)
+
+        done = 0
+
+        def finished(outcomes):
+            nonlocal done
+            for ticker, analyzed, error in outcomes:
+                done += 1
+                if error is None:
+                    report.analyzed.extend(analyzed)
+                else:
+                    report.failures[ticker] = error
+                if progress is not None:
+                    progress(done, total, ticker, error)
+
+        if workers == 1:
+            if tickers:
+                finished(_analyze_chunk(self, list(tickers), rebuild))
+            self.publish_panel()
+            return report
+
+        workers = min(workers or os.cpu_count() or 1, max(total, 1))
+        chunks = [
+            [str(ticker) for ticker in chunk]
+            for chunk in np.array_split(np.asarray(tickers, dtype=object), workers)
+            if len(chunk)
         ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    _analyze_in_worker,
+                    self.raw_folder,
+                    self.analyzed_folder,
+                    self.storage_format,
+                    self.timeframes,
+                    chunk,
+                    rebuild,
+                    instrumentation.enabled(),
+                ): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                try:
+                    outcomes, records = future.result()
+                except Exception as error:
+                    message = f"{type(error).__name__}: {error}"
+                    outcomes = [(ticker, [], message) for ticker in futures[future]]
+                else:
+                    instrumentation.merge(records)
+                finished(outcomes)
+        self.publish_panel()
+        return report
+
+    def publish_panel(self):
+        with stage("publish"):
+            publish_panel(self.analyzed_folder, self.storage_format)
 
-        main_df.to_csv(analyzed_file_path, index=False, columns=cols_to_keep)
+    def delete(self, ticker):
+        """Delete the analyzed data, state, rollups and timeframes of a ticker."""
+        symbol = ticker.split(".")[0]
+        self.analyzed_store.delete(symbol)
+        if os.path.exists(self.state_path(symbol)):
+            os.remove(self.state_path(symbol))
+        self.rollups.delete(symbol)
+        self.timeframe_store.delete(symbol)
+
+    def preprocess_and_analyze(self, ticker, rebuild=False):
+        """Preprocess data and calculate indicators for a single ticker."""
+        self.analyze_universe([ticker], rebuild=rebuild)
 
 
 # Example usage:
@@ -0,0 +1,244 @@
+"""Build the ticker universe from saved Lightyear listing pages
+
+Usage:
+    python universe.py data/listings/*.html            # show the diff
+    python universe.py data/listings/*.html --apply    # write the universe
+    python universe.py data/listings/*.html --apply --refresh
+
+The pages are streamed in chunks, so memory stays flat however large the
+catalogue is. Every ``href="/etf/CSPX:AEX"`` link becomes a listing of
+``CSPX`` on ``AEX``, which maps to the Yahoo ticker ``CSPX.AS`` through the
+venue suffixes of ``data/exchanges.json``.
+
+Only listings that appeared or disappeared since the last build change the
+Yahoo universe; hand-made entries of tickers that are still listed (other
+venues, removed tickers Yahoo has no data for) are kept. With ``--refresh``
+only the added tickers are extracted and analyzed and the data of the
+removed ones is deleted.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import json
+import os
+import re
+import sys
+
+from extractor import Extractor
+from pipeline import ANALYZED_FOLDER, RAW_FOLDER, TICKERS_FILE
+from refresh import CALENDARS_FILE
+from storage import _replace_atomically, open_store
+from transform import TickerAnalyzer
+
+LISTINGS_FILE = "data/lightyear_raw_etf_data.json"
+CHUNK_SIZE = 64 * 1024
+# Longest link considered a listing; a chunk keeps this many characters for
+# the next one, so a link split between two chunks is still found.
+MAX_LINK = 256
+INSTRUMENT_TYPES = ("etf", "etc", "etn")
+_LINK = re.compile(
+    r'href="/(?:%s)/([^":/]{1,64}):([A-Z0-9]{1,16})"' % "|".join(INSTRUMENT_TYPES)
+)
+
+
+def stream_listings(
+    paths: Iterable[str], chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[str, str]]:
+    """``(symbol, venue)`` of every listing link in the pages, in order."""
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            buffer = ""
+            while True:
+                chunk = file.read(chunk_size)
+                buffer += chunk
+                # Links starting before the boundary are complete in the buffer.
+                boundary = len(buffer) if not chunk else len(buffer) - MAX_LINK
+                for match in _LINK.finditer(buffer):
+                    if match.start() >= boundary:
+                        break
+                    yield match.group(1), match.group(2)
+                if not chunk:
+                    break
+                buffer = buffer[max(boundary, 0) :]
+
+
+def load_suffixes(path: str = CALENDARS_FILE) -> Dict[str, str]:
+    """Yahoo suffix of every venue of the exchange calendars."""
+    with open(path, "r") as file:
+        config = json.load(file)
+    return {
+        venue: settings["suffixes"][0]
+        for venue, settings in config.items()
+        if settings.get("suffixes")
+    }
+
+
+def load_json(path: str) -> Dict[str, str]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def load_listings(path: str = LISTINGS_FILE) -> Dict[str, str]:
+    """Listings of the last build (older files kept '/etc/'-style prefixes)."""
+    return {
+        symbol.rsplit("/", 1)[-1]: venue for symbol, venue in load_json(path).items()
+    }
+
+
+def save_json(path: str, data: Dict[str, str]):
+    def write(tmp_path):
+        with open(tmp_path, "w") as file:
+            json.dump(dict(sorted(data.items())), file, indent=4)
+
+    _replace_atomically(path, write)
+
+
+@dataclass
+class UniverseDiff:
+    """Listings and Yahoo tickers before and after a build."""
+
+    listings: Dict[str, str]
+    tickers: Dict[str, str]
+    added: Dict[str, str] = field(default_factory=dict)
+    removed: Dict[str, str] = field(default_factory=dict)
+    unmapped: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def diff_universe(
+    listings: Dict[str, str],
+    previous_listings: Dict[str, str],
+    tickers: Dict[str, str],
+    suffixes: Dict[str, str],
+) -> UniverseDiff:
+    """
+    Apply the listings that appeared or disappeared since
+    ``previous_listings`` to the Yahoo universe ``tickers``.
+
+    New listings on venues without a suffix are reported as ``unmapped``.
+    """
+    diff = UniverseDiff(listings=listings, tickers=dict(tickers))
+    for symbol, venue in listings.items():
+        if symbol in previous_listings or symbol in tickers:
+            continue
+        if venue not in suffixes:
+            diff.unmapped[symbol] = venue
+            continue
+        diff.added[symbol] = diff.tickers[symbol] = symbol + suffixes[venue]
+    for symbol in previous_listings:
+        if symbol not in listings and symbol in diff.tickers:
+            diff.removed[symbol] = diff.tickers.pop(symbol)
+    return diff
+
+
+def build_universe(
+    paths: List[str],
+    listings_file: str = LISTINGS_FILE,
+    tickers_file: str = TICKERS_FILE,
+    calendars_file: str = CALENDARS_FILE,
+) -> UniverseDiff:
+    """Diff the listings of the saved pages against the current universe."""
+    listings = dict(stream_listings(paths))
+    return diff_universe(
+        listings,
+        load_listings(listings_file),
+        load_json(tickers_file),
+        load_suffixes(calendars_file),
+    )
+
+
+def save_universe(
+    diff: UniverseDiff,
+    listings_file: str = LISTINGS_FILE,
+    tickers_file: str = TICKERS_FILE,
+):
+    save_json(listings_file, diff.listings)
+    save_json(tickers_file, diff.tickers)
+
+
+def refresh_changes(
+    diff: UniverseDiff,
+    start_date: str,
+    raw_folder: str = RAW_FOLDER,
+    analyzed_folder: str = ANALYZED_FOLDER,
+    workers: Optional[int] = None,
+) -> dict:
+    """Extract and analyze the added tickers, delete the removed ones."""
+    analyzer = TickerAnalyzer(raw_folder, analyzed_folder)
+    raw_store = open_store(raw_folder, "datetime")
+    for ticker in diff.removed.values():
+        raw_store.delete(ticker)
+        analyzer.delete(ticker)
+
+    failures = {}
+    added = list(diff.added.values())
+    if added:
+        extractor = Extractor(
+            tickers=added,
+            start_date=start_date,
+            end_date=datetime.now().strftime("%Y-%m-%d"),
+            target_folder=raw_folder,
+        )
+        extractor.extract_data()
+        failures.update(extractor.failed)
+        extracted = [ticker for ticker in added if ticker not in extractor.failed]
+        failures.update(analyzer.analyze_many(extracted, workers=workers).failures)
+    elif diff.removed:
+        analyzer.publish_panel()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="+", help="saved listing pages (HTML)")
+    parser.add_argument("--apply", action="store_true", help="write the universe")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="extract and analyze added tickers, delete removed ones",
+    )
+    parser.add_argument("--listings-file", default=LISTINGS_FILE)
+    parser.add_argument("--tickers-file", default=TICKERS_FILE)
+    parser.add_argument("--calendars", default=CALENDARS_FILE)
+    parser.add_argument("--raw-folder", default=RAW_FOLDER)
+    parser.add_argument("--analyzed-folder", default=ANALYZED_FOLDER)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--start-date",
+        default=(datetime.today() - timedelta(days=729)).strftime("%Y-%m-%d"),
+    )
+    args = parser.parse_args(argv)
+
+    diff = build_universe(
+        args.pages, args.listings_file, args.tickers_file, args.calendars
+    )
+    print(f"{len(diff.listings)} listings, {len(diff.tickers)} tickers")
+    for symbol, ticker in sorted(diff.added.items()):
+        print(f"+ {symbol} {ticker}")
+    for symbol, ticker in sorted(diff.removed.items()):
+        print(f"- {symbol} {ticker}")
+    for symbol, venue in sorted(diff.unmapped.items()):
+        print(f"? {symbol} on {venue} (no Yahoo suffix)")
+    if not args.apply:
+        return 0
+
+    save_universe(diff, args.listings_file, args.tickers_file)
+    if not (args.refresh and diff.changed):
+        return 0
+    failures = refresh_changes(
+        diff, args.start_date, args.raw_folder, args.analyzed_folder, args.workers
+    )
+    for ticker, error in sorted(failures.items()):
+        print(f"{ticker}: {error}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())